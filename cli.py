@@ -1,18 +1,192 @@
 """Click-based CLI for disk I/O benchmarking"""
 
+import os
+import re
+
 import click
 
 from rich.console import Console
 from rich.panel import Panel
 
+from src.checkpoint import CheckpointJournal, new_run_id, run_settings
 from src.config import BenchmarkConfig, Mode, StorageBackend
-from src.executor import BenchmarkExecutor
+from src.async_executor import AsyncBenchmarkExecutor
+from src.engines import DEFAULT_MATRIX, engine_speedups, parse_engine
+from src.mountinfo import is_block_device
+from src.executor import BenchmarkExecutor, _format_time_hhmmss
+from src.profiles import builtin_profiles, load_profile
+from src.pyengine import fio_available
+from src.stress import validate_file_service_type
+from src.testfiles import PreparedFilePool
 from src.storage import SQLiteStorage, JsonStorage, CsvStorage
 from src.formatters import TableFormatter, JsonFormatter, CsvFormatter, ExcelFormatter
 from src.plots import create_plotter
 from src.analytics import Statistics, Comparison
 
 
+def _split_list(value: str) -> list:
+    """Split a comma-separated option value into a list"""
+    return [item.strip() for item in value.split(",") if item.strip()] if value else []
+
+
+BLOCK_SIZE_PATTERN = re.compile(r"^\d+[kmg]?$", re.IGNORECASE)
+
+
+def _validate_block_sizes(ctx, param, value):
+    """Accept any fio block size such as 4k, 16k, 128k or 1M"""
+    for size in value:
+        if not BLOCK_SIZE_PATTERN.match(size):
+            raise click.BadParameter(f"'{size}' is not a block size like 4k, 128k or 1M")
+    return value
+
+
+def _validate_engines(ctx, param, value):
+    """Accept engine specs such as io_uring+fixedbufs, comma-separated for lists"""
+    for spec in _split_list(value):
+        try:
+            parse_engine(spec)
+        except ValueError as e:
+            raise click.BadParameter(str(e))
+    return value
+
+
+def _validate_targets(ctx, param, value):
+    """Accept directories and block devices; tests create their files inside a target"""
+    for target in value:
+        if not os.path.isdir(target) and not is_block_device(target):
+            raise click.BadParameter(f"'{target}' is neither a directory nor a block device")
+    return value
+
+
+def _validate_file_service_type(ctx, param, value):
+    """Accept fio file_service_type values such as roundrobin or zipf:1.2"""
+    try:
+        return validate_file_service_type(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def _print_engine_speedups(console: Console, results: list) -> None:
+    """Show each engine's IOPS relative to the first engine of the matrix"""
+    from rich.table import Table
+
+    rows = engine_speedups(results)
+    if not rows:
+        return
+    table = Table(title=f"I/O engine speedup (baseline: {rows[0]['ioengine']})")
+    table.add_column("Test Type", style="cyan", no_wrap=True)
+    table.add_column("Block Size", style="magenta")
+    table.add_column("Engine", style="magenta", no_wrap=True)
+    table.add_column("IOPS", justify="right", style="green")
+    table.add_column("MB/s", justify="right", style="blue")
+    table.add_column("Lat (µs)", justify="right", style="yellow")
+    table.add_column("Speedup", justify="right", style="bold")
+    for row in rows:
+        table.add_row(
+            row["test_type"],
+            row["block_size"],
+            row["ioengine"],
+            f"{row['iops']:,.0f}",
+            f"{row['bw'] / 1024 / 1024:.2f}",
+            f"{row['latency_us']:.2f}",
+            f"{row['speedup']:.2f}x" if row["speedup"] is not None else "N/A",
+        )
+    console.print(table)
+
+
+def _format_bytes(size: float) -> str:
+    if size >= 1024**3:
+        return f"{size / 1024**3:.1f} GiB"
+    return f"{size / 1024**2:.0f} MiB"
+
+
+def _print_plan(console: Console, plan) -> None:
+    """Show the tests of a run plan with their estimates and fio commands"""
+    from rich.table import Table
+
+    table = Table(title=f"Run plan for {plan.target}")
+    table.add_column("#", justify="right", style="dim")
+    table.add_column("Test", style="cyan", no_wrap=True)
+    table.add_column("Prepare", justify="right")
+    table.add_column("Run", justify="right")
+    table.add_column("Overhead", justify="right")
+    table.add_column("Est. Wall", justify="right", style="bold")
+    table.add_column("Writes", justify="right", style="blue")
+    table.add_column("Basis", style="dim")
+    for idx, test in enumerate(plan.tests, 1):
+        if test.skip_reason:
+            table.add_row(str(idx), test.description, "", "", "", "-", "-", test.skip_reason)
+            continue
+        table.add_row(
+            str(idx),
+            test.description,
+            _format_time_hhmmss(test.prepare_sec) if test.prepare_sec else (
+                "?" if test.prepare_bytes else ""
+            ),
+            _format_time_hhmmss(test.run_sec),
+            _format_time_hhmmss(test.overhead_sec),
+            _format_time_hhmmss(test.wall_sec),
+            _format_bytes(test.bytes_written) if test.write_bytes is not None else (
+                f">= {_format_bytes(test.prepare_bytes)}" if test.prepare_bytes else "?"
+            ),
+            test.basis,
+        )
+    console.print(table)
+
+    for idx, test in enumerate(plan.tests, 1):
+        if test.command:
+            console.print(f"[dim][{idx}][/dim] {' '.join(test.command)}", soft_wrap=True)
+        elif not test.skip_reason:
+            console.print(f"[dim][{idx}] built-in Python engine[/dim]")
+
+    unknown = (
+        f" (+ {plan.unknown_writes} tests without history)" if plan.unknown_writes else ""
+    )
+    console.print(
+        f"\nEstimated total: [bold cyan]{_format_time_hhmmss(plan.total_sec)}[/bold cyan], "
+        f"~{_format_bytes(plan.total_bytes_written)} written{unknown}"
+    )
+
+
+def _print_plans(config: BenchmarkConfig, console: Console) -> None:
+    """Print the run plan of every target without running anything
+
+    Estimates use results and calibrations stored in SQLite; no disk probe runs.
+    Without an --engines list the engine matrix shows every default engine,
+    since detecting the usable ones runs probe jobs on the target.
+    """
+    storage = SQLiteStorage(config.db_path) if config.database == StorageBackend.SQLITE else None
+    for target in config.targets or [None]:
+        executor = BenchmarkExecutor(config, console, target_dir=target, dry_run=True)
+        if storage is not None:
+            if config.calibrate:
+                executor.calibrate(storage, probe=False)
+            executor.load_history(storage)
+        _print_plan(console, executor.plan(executor._get_test_configs()))
+
+
+def _use_python_engine(config: BenchmarkConfig, console: Console) -> None:
+    """Switch to the built-in Python engine when fio is not installed
+
+    Features that need fio itself (batch job files, fio servers, the engine
+    matrix and the asyncio executor's fio processes) are turned off.
+    """
+    if not config.python_engine and not fio_available():
+        console.print("[yellow]fio not found, using the built-in Python engine[/yellow]")
+        config.python_engine = True
+    if not config.python_engine:
+        return
+    if config.batch or config.engine_matrix or config.parallel_targets:
+        console.print(
+            "[yellow]The Python engine runs tests one at a time; "
+            "batch, engine matrix and parallel targets are disabled[/yellow]"
+        )
+    config.batch = False
+    config.engine_matrix = False
+    config.parallel_targets = False
+    config.ioengine = ""
+
+
 @click.group()
 def main():
     """Disk I/O benchmarking tool"""
@@ -22,7 +196,7 @@ def main():
 @main.command()
 @click.option(
     "--mode",
-    type=click.Choice(["test", "lean", "full", "individual"]),
+    type=click.Choice(["test", "lean", "full", "individual", "sweep", "replay", "profile"]),
     default="lean",
     help="Test mode",
 )
@@ -41,9 +215,52 @@ def main():
     "--block-size",
     "block_size",
     multiple=True,
-    type=click.Choice(["4k", "64k", "1M", "512k"]),
-    help="Block sizes for individual tests",
+    callback=_validate_block_sizes,
+    help="Block sizes for individual tests, e.g. 4k, 16k, 1M",
 )
+@click.option(
+    "--sweep-test-type",
+    "sweep_test_type",
+    multiple=True,
+    type=click.Choice(["randread", "randwrite", "read", "write", "randrw", "trim"]),
+    help="Test types for --mode sweep (default: randread)",
+)
+@click.option("--sweep-bs", type=str, default="", help="Sweep block sizes, e.g. 4k,16k,64k")
+@click.option("--sweep-iodepth", type=str, default="", help="Sweep iodepths, e.g. 1,4,16,64")
+@click.option("--sweep-numjobs", type=str, default="", help="Sweep job counts, e.g. 1,2,4")
+@click.option(
+    "--sweep-rwmixread", type=str, default="", help="Sweep read percentages for mixed tests"
+)
+@click.option(
+    "--sweep-grid",
+    type=click.Path(exists=True, dir_okay=False),
+    help="JSON file with explicit sweep points instead of a cartesian grid",
+)
+@click.option(
+    "--profile",
+    multiple=True,
+    help="Workload profile name (see 'profiles') or TOML/YAML file (repeatable)",
+)
+@click.option(
+    "--trace",
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="fio iolog (v2/v3) or CSV trace to replay (repeatable, selects replay mode)",
+)
+@click.option(
+    "--trace-time-unit",
+    type=click.Choice(["s", "ms", "us", "ns"]),
+    default="us",
+    help="Timestamp unit of CSV traces",
+)
+@click.option(
+    "--replay-speed",
+    type=int,
+    default=100,
+    help="Replay rate in percent of the recorded timing (200 = twice as fast)",
+)
+@click.option("--replay-no-stall", is_flag=True, help="Ignore trace timing, replay flat out")
+@click.option("--replay-loops", type=int, default=1, help="Replay each trace this many times")
 @click.option("--runtime", type=int, default=300, help="Test runtime in seconds")
 @click.option(
     "--timeout",
@@ -52,6 +269,120 @@ def main():
     help="Timeout per test in seconds (0=auto-calculate based on filesize)",
 )
 @click.option("--filesize", type=str, default="10G", help="File size for fio")
+@click.option(
+    "--keep-test-files",
+    is_flag=True,
+    help="Keep prepared read test files for reuse by later runs",
+)
+@click.option(
+    "--fill-pattern",
+    type=click.Choice(["random", "zero"]),
+    default="random",
+    help="Data pattern written to prepared read test files",
+)
+@click.option(
+    "--prepare-strategy",
+    type=click.Choice(["auto", "sequential", "parallel", "refill"]),
+    default="auto",
+    help="How read test files are written (auto: refill for random data, else parallel)",
+)
+@click.option(
+    "--status-interval",
+    type=int,
+    default=1,
+    help="Seconds between live fio status reports (0=disable live stats)",
+)
+@click.option(
+    "--per-job", is_flag=True, help="Keep a per-worker breakdown when fio runs several jobs"
+)
+@click.option(
+    "--log-interval",
+    type=int,
+    default=0,
+    help="Log IOPS/bandwidth/latency averaged over N ms into the timeseries table (0=off)",
+)
+@click.option(
+    "--device-stats-interval",
+    type=float,
+    default=1.0,
+    help="Seconds between block-device telemetry samples (0=off)",
+)
+@click.option(
+    "--host-stats-interval",
+    type=float,
+    default=1.0,
+    help="Seconds between host PSI/CPU/vmstat samples (0=off)",
+)
+@click.option(
+    "--host-stats-series",
+    is_flag=True,
+    help="Store every host telemetry sample in the timeseries table, not only the summary",
+)
+@click.option("--steady-state", is_flag=True, help="Stop each test once it reaches steady state")
+@click.option(
+    "--ss-metric",
+    type=click.Choice(["iops", "bw"]),
+    default="iops",
+    help="Metric checked for steady state",
+)
+@click.option(
+    "--ss-slope", type=float, default=0.3, help="Max slope per second, in % of the mean"
+)
+@click.option(
+    "--ss-deviation", type=float, default=5.0, help="Max deviation from the mean, in %"
+)
+@click.option(
+    "--ss-window", type=int, default=30, help="Seconds of samples steady state is judged on"
+)
+@click.option("--ss-ramp", type=int, default=10, help="Seconds ignored at the start of a test")
+@click.option(
+    "--ioengine",
+    type=str,
+    default="",
+    callback=_validate_engines,
+    help="fio I/O engine, e.g. io_uring, io_uring+fixedbufs+registerfiles, libaio, psync",
+)
+@click.option(
+    "--engine-matrix",
+    is_flag=True,
+    help="Run every test under each I/O engine and report the speedup",
+)
+@click.option(
+    "--engines",
+    type=str,
+    default="",
+    callback=_validate_engines,
+    help="Engines for --engine-matrix, comma-separated (default: auto-detect)",
+)
+@click.option(
+    "--no-calibrate",
+    is_flag=True,
+    help="Skip the quick disk probe and assume a 10 MB/s disk for timeouts",
+)
+@click.option(
+    "--recalibrate", is_flag=True, help="Probe the disk again instead of using the cached result"
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Print the fio commands and time/bytes-written estimates without running anything",
+)
+@click.option(
+    "--python-engine",
+    is_flag=True,
+    help="Use the built-in Python I/O engine instead of fio (automatic when fio is missing)",
+)
+@click.option(
+    "--batch",
+    is_flag=True,
+    help="Run the whole suite as one fio job file (one process, stonewall sections)",
+)
+@click.option(
+    "--section",
+    "section",
+    multiple=True,
+    help="Batch section to (re)run, e.g. t03_read_4k (implies --batch)",
+)
 @click.option(
     "--output-format",
     "output_format",
@@ -65,20 +396,42 @@ def main():
     default="sqlite",
     help="Storage backend (none/sqlite/json/csv)",
 )
+@click.option("--percentiles", is_flag=True, help="Show latency percentile columns in table output")
 @click.option("--plots", is_flag=True, help="Generate plots after benchmark")
 @click.option(
     "--plot-types",
     "plot_types",
     multiple=True,
-    type=click.Choice(["bar", "scatter", "radar", "line"]),
+    type=click.Choice(["bar", "scatter", "radar", "line", "sweep"]),
     default=["bar", "scatter", "radar"],
     help="Plot types to generate",
 )
+@click.option(
+    "--pivot",
+    type=click.Choice(["io_depth", "num_jobs", "block_size", "rwmixread", "test_type"]),
+    default="io_depth",
+    help="Sweep dimension on the x axis of sweep plots",
+)
+@click.option(
+    "--pivot-metric",
+    type=str,
+    default="iops",
+    help="Metric for sweep plots: iops, bw, latency or a result column like read_p99_us",
+)
 @click.option(
     "--plot-output-dir", type=click.Path(), default="results/plots", help="Directory for plot files"
 )
 @click.option("--open-browser", is_flag=True, help="Open plots in browser after generation")
 @click.option("--no-database", is_flag=True, help="Disable database storage (for dummy tests)")
+@click.option(
+    "--no-archive", is_flag=True, help="Do not keep the raw fio output for later reparsing"
+)
+@click.option(
+    "--archive-dir",
+    type=click.Path(),
+    default="results/archive",
+    help="Content-addressed archive of raw fio output",
+)
 @click.option(
     "--db-path",
     "db_path",
@@ -90,6 +443,72 @@ def main():
     "--history", type=int, default=0, help="Show N recent benchmark runs (history-only mode)"
 )
 @click.option("--query-sql", type=str, help="Query database with custom SQL (history-only mode)")
+@click.option(
+    "--resume",
+    type=str,
+    default="",
+    help="Resume an interrupted run by id, skipping tests it already completed",
+)
+@click.option("--no-checkpoint", is_flag=True, help="Do not journal completed tests")
+@click.option(
+    "--target",
+    multiple=True,
+    type=click.Path(exists=True),
+    callback=_validate_targets,
+    help="Directory or block device to benchmark (repeatable, default: current directory)",
+)
+@click.option(
+    "--client",
+    multiple=True,
+    help="fio server to drive with fio --client, as host or host,port (repeatable)",
+)
+@click.option("--parallel-targets", is_flag=True, help="Benchmark all targets concurrently")
+@click.option(
+    "--max-concurrency",
+    type=int,
+    default=0,
+    help="Max concurrent fio processes with --parallel-targets (0 = one per target)",
+)
+@click.option(
+    "--allow-device-writes",
+    is_flag=True,
+    help="Allow write tests on block device targets (DESTROYS data on the device)",
+)
+@click.option(
+    "--stress-target",
+    multiple=True,
+    type=click.Path(),
+    help="File or block device every test drives concurrently, one fio job each (repeatable)",
+)
+@click.option(
+    "--stress-files",
+    type=int,
+    default=0,
+    help="Spread every test over N files in the target, one fio job each",
+)
+@click.option(
+    "--stress-shared",
+    is_flag=True,
+    help="Let each job use all stress files (filename=a:b:c) instead of one file per job",
+)
+@click.option(
+    "--stress-nrfiles",
+    type=int,
+    default=1,
+    help="Give each stress job a directory of N small files (metadata-heavy workloads)",
+)
+@click.option(
+    "--stress-openfiles",
+    type=int,
+    default=0,
+    help="Files a stress job keeps open at once (0 = all of them)",
+)
+@click.option(
+    "--file-service-type",
+    default="roundrobin",
+    callback=_validate_file_service_type,
+    help="How a stress job picks its next file: random, roundrobin, sequential, zipf:1.2, ...",
+)
 def run(**kwargs):
     """Run disk I/O benchmarks with fio"""
     console = Console()
@@ -103,9 +522,44 @@ def run(**kwargs):
         "quick": kwargs["quick"],
         "test_types": list(kwargs["test_type"]),
         "block_sizes": list(kwargs["block_size"]),
+        "sweep_test_types": list(kwargs["sweep_test_type"]),
+        "sweep_block_sizes": _split_list(kwargs["sweep_bs"]),
+        "sweep_io_depths": [int(v) for v in _split_list(kwargs["sweep_iodepth"])],
+        "sweep_num_jobs": [int(v) for v in _split_list(kwargs["sweep_numjobs"])],
+        "sweep_rwmixread": [int(v) for v in _split_list(kwargs["sweep_rwmixread"])],
+        "sweep_grid_file": kwargs["sweep_grid"] or "",
+        "profiles": list(kwargs["profile"]),
+        "trace_files": list(kwargs["trace"]),
+        "trace_time_unit": kwargs["trace_time_unit"],
+        "replay_time_scale": kwargs["replay_speed"],
+        "replay_no_stall": kwargs["replay_no_stall"],
+        "replay_loops": kwargs["replay_loops"],
         "runtime": kwargs["runtime"],
         "timeout": kwargs["timeout"],
         "filesize": kwargs["filesize"],
+        "keep_test_files": kwargs["keep_test_files"],
+        "fill_pattern": kwargs["fill_pattern"],
+        "prepare_strategy": kwargs["prepare_strategy"],
+        "status_interval": kwargs["status_interval"],
+        "per_job_breakdown": kwargs["per_job"],
+        "ioengine": kwargs["ioengine"],
+        "engine_matrix": kwargs["engine_matrix"] or bool(kwargs["engines"]),
+        "engines": _split_list(kwargs["engines"]),
+        "python_engine": kwargs["python_engine"],
+        "calibrate": not kwargs["no_calibrate"],
+        "recalibrate": kwargs["recalibrate"],
+        "log_interval_ms": kwargs["log_interval"],
+        "device_stats_interval": kwargs["device_stats_interval"],
+        "host_stats_interval": kwargs["host_stats_interval"],
+        "host_stats_series": kwargs["host_stats_series"],
+        "steady_state": kwargs["steady_state"],
+        "ss_metric": kwargs["ss_metric"],
+        "ss_slope_limit": kwargs["ss_slope"],
+        "ss_deviation_limit": kwargs["ss_deviation"],
+        "ss_dur": kwargs["ss_window"],
+        "ss_ramp": kwargs["ss_ramp"],
+        "batch": kwargs["batch"] or bool(kwargs["section"]),
+        "sections": list(kwargs["section"]),
         "results_dir": "results",
         "output_format": kwargs["output_format"],
         "json_output_dir": "results/json",
@@ -113,12 +567,28 @@ def run(**kwargs):
         if kwargs["no_database"]
         else StorageBackend(kwargs["database"]),
         "db_path": kwargs["db_path"],
+        "archive_raw": not kwargs["no_archive"],
+        "archive_dir": kwargs["archive_dir"],
         "history": kwargs["history"],
         "query_sql": kwargs["query_sql"],
+        "run_id": kwargs["resume"],
+        "targets": list(kwargs["target"]),
+        "parallel_targets": kwargs["parallel_targets"],
+        "clients": list(kwargs["client"]),
+        "max_concurrency": kwargs["max_concurrency"],
+        "allow_device_writes": kwargs["allow_device_writes"],
+        "stress_targets": list(kwargs["stress_target"]),
+        "stress_files": kwargs["stress_files"],
+        "stress_shared": kwargs["stress_shared"],
+        "stress_nrfiles": kwargs["stress_nrfiles"],
+        "stress_openfiles": kwargs["stress_openfiles"],
+        "file_service_type": kwargs["file_service_type"],
         "generate_plots": kwargs["plots"],
         "plot_types": list(kwargs["plot_types"]),
         "plot_output_dir": kwargs["plot_output_dir"],
         "interactive_plots": kwargs["open_browser"],
+        "pivot": kwargs["pivot"],
+        "pivot_metric": kwargs["pivot_metric"],
     }
 
     # Quick mode overrides
@@ -131,8 +601,21 @@ def run(**kwargs):
         config_data["runtime"] = 15
         config_data["filesize"] = "1G"
 
+    # Any sweep dimension selects sweep mode
+    if kwargs["sweep_grid"] or any(
+        config_data[key]
+        for key in ("sweep_block_sizes", "sweep_io_depths", "sweep_num_jobs", "sweep_rwmixread")
+    ):
+        config_data["mode"] = Mode.SWEEP
+
+    if config_data["trace_files"]:
+        config_data["mode"] = Mode.REPLAY
+
+    if config_data["profiles"]:
+        config_data["mode"] = Mode.PROFILE
+
     # Auto-detect individual mode
-    if config_data["test_types"]:
+    if config_data["test_types"] and config_data["mode"] != Mode.SWEEP:
         config_data["mode"] = Mode.INDIVIDUAL
         if not config_data["block_sizes"]:
             config_data["block_sizes"] = ["4k", "64k", "1M", "512k"]
@@ -151,7 +634,7 @@ def run(**kwargs):
                 console.print(Panel(f"Last {config.history} Benchmark Runs", style="blue"))
 
             if results:
-                formatter = TableFormatter(console)
+                formatter = TableFormatter(console, show_percentiles=kwargs["percentiles"])
                 formatter.format(results)
             return
         else:
@@ -162,13 +645,91 @@ def run(**kwargs):
     if config.mode == Mode.INDIVIDUAL and not config.test_types:
         console.print("[red]Error: Individual mode requires --test-type flags[/red]")
         return
+    if config.mode == Mode.REPLAY and not config.trace_files:
+        console.print("[red]Error: Replay mode requires --trace files[/red]")
+        return
+    if config.mode == Mode.PROFILE:
+        if not config.profiles:
+            console.print("[red]Error: Profile mode requires --profile names[/red]")
+            return
+        try:
+            for name in config.profiles:
+                load_profile(name)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            return
+
+    if (config.stress_targets or config.stress_files) and (config.batch or config.clients):
+        console.print("[red]Error: Stress layouts do not combine with --batch or --client[/red]")
+        return
+
+    _use_python_engine(config, console)
+    if config.python_engine and config.clients:
+        console.print("[red]Error: --client needs fio servers, not the Python engine[/red]")
+        return
+
+    if kwargs["dry_run"]:
+        _print_plans(config, console)
+        return
+
+    # Completed tests are journaled so an interrupted run can be resumed
+    if config.run_id:
+        journal = CheckpointJournal(config.checkpoint_dir, config.run_id, run_settings(config))
+        if not journal.exists():
+            console.print(f"[red]Error: No checkpoint found for run {config.run_id}[/red]")
+            return
+        try:
+            journal.check()
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            return
+    elif not kwargs["no_checkpoint"] and not config.batch:
+        config.run_id = new_run_id()
+    if config.run_id:
+        console.print(f"[dim]Checkpoint run id: {config.run_id}[/dim]")
 
     # Run benchmarks
     import time
 
+    # Calibrations are cached per target in SQLite; other backends probe every run.
+    # Past results stored there also drive the runtime estimates.
+    calibration_storage = (
+        SQLiteStorage(config.db_path) if config.database == StorageBackend.SQLITE else None
+    )
+    # Servers run the I/O in distributed mode, so a local probe says nothing about them
+    calibrate = config.calibrate and not config.clients
+
     start_time = time.time()
-    executor = BenchmarkExecutor(config, console)
-    results = executor.run_all_tests()
+    try:
+        if config.parallel_targets and len(config.targets) > 1 and not config.clients:
+            async_executor = AsyncBenchmarkExecutor(
+                config, config.targets, console, config.max_concurrency
+            )
+            for executor in async_executor.executors.values():
+                if calibrate:
+                    executor.calibrate(calibration_storage)
+                if calibration_storage is not None:
+                    executor.load_history(calibration_storage)
+            results = async_executor.run_all_tests()
+        else:
+            # One suite per target, one target after another
+            results = []
+            for target in config.targets or [None]:
+                executor = BenchmarkExecutor(config, console, target_dir=target)
+                if calibrate:
+                    executor.calibrate(calibration_storage)
+                if calibration_storage is not None:
+                    executor.load_history(calibration_storage)
+                if config.clients:
+                    results.extend(executor.run_distributed())
+                elif config.batch:
+                    results.extend(executor.run_batch(config.sections))
+                else:
+                    results.extend(executor.run_all_tests())
+    except KeyboardInterrupt:
+        if config.run_id:
+            console.print(f"\n[yellow]Interrupted. Resume with: --resume {config.run_id}[/yellow]")
+        raise
     total_wall_time = time.time() - start_time
 
     # Store results
@@ -190,9 +751,13 @@ def run(**kwargs):
                 f"[green]Results saved to {config.database.value}: {storage_path}[/green]"
             )
 
+    # The merged results are stored, the journal is no longer needed
+    if config.run_id:
+        CheckpointJournal(config.checkpoint_dir, config.run_id).remove()
+
     # Format and display output
     if config.output_format == "table":
-        formatter = TableFormatter(console)
+        formatter = TableFormatter(console, show_percentiles=kwargs["percentiles"])
         formatter.format(results)
     elif config.output_format == "json":
         formatter = JsonFormatter(config.json_output_dir)
@@ -215,6 +780,9 @@ def run(**kwargs):
         time_str = f"{seconds}s"
     console.print(f"\nTotal runtime: [bold cyan]{time_str}[/bold cyan]")
 
+    if config.engine_matrix:
+        _print_engine_speedups(console, results)
+
     # Generate plots if requested
     if config.generate_plots and results:
         try:
@@ -261,8 +829,8 @@ def run(**kwargs):
     "--block-size",
     "block_size",
     multiple=True,
-    type=click.Choice(["4k", "64k", "1M", "512k"]),
-    help="Block sizes for individual tests",
+    callback=_validate_block_sizes,
+    help="Block sizes for individual tests, e.g. 4k, 16k, 1M",
 )
 @click.option("--runtime", type=int, default=15, help="Test runtime in seconds")
 @click.option(
@@ -289,6 +857,7 @@ def test(**kwargs):
     }
 
     config = BenchmarkConfig.from_dict(config_data)
+    _use_python_engine(config, console)
 
     console.print("[blue]Running test benchmark...[/blue]")
     import time
@@ -388,7 +957,7 @@ def compare(**kwargs):
     "--block-size",
     "block_size",
     multiple=True,
-    type=click.Choice(["4k", "64k", "1M", "512k"]),
+    callback=_validate_block_sizes,
     help="Filter by block size",
 )
 @click.option("--detailed", is_flag=True, help="Show detailed statistics")
@@ -398,10 +967,22 @@ def compare(**kwargs):
     "--plot-types",
     "plot_types",
     multiple=True,
-    type=click.Choice(["bar", "scatter", "radar", "line"]),
+    type=click.Choice(["bar", "scatter", "radar", "line", "sweep"]),
     default=["bar", "scatter", "radar"],
     help="Plot types to generate",
 )
+@click.option(
+    "--pivot",
+    type=click.Choice(["io_depth", "num_jobs", "block_size", "rwmixread", "test_type"]),
+    default="io_depth",
+    help="Sweep dimension on the x axis of sweep plots",
+)
+@click.option(
+    "--pivot-metric",
+    type=str,
+    default="iops",
+    help="Metric for sweep plots: iops, bw, latency or a result column like read_p99_us",
+)
 @click.option(
     "--plot-output-dir", type=click.Path(), default="results/plots", help="Directory for plot files"
 )
@@ -452,7 +1033,14 @@ def analyze(**kwargs):
             list(kwargs["plot_types"]) if kwargs["plot_types"] else ["bar", "scatter", "radar"]
         )
         plotter = create_plotter(
-            plot_types, results, {"plot_output_dir": kwargs["plot_output_dir"]}
+            plot_types,
+            results,
+            {
+                "plot_types": plot_types,
+                "plot_output_dir": kwargs["plot_output_dir"],
+                "pivot": kwargs["pivot"],
+                "pivot_metric": kwargs["pivot_metric"],
+            },
         )
         plotter.generate()
 
@@ -494,7 +1082,7 @@ def analyze(**kwargs):
     "--block-size",
     "block_size",
     multiple=True,
-    type=click.Choice(["4k", "64k", "1M", "512k"]),
+    callback=_validate_block_sizes,
     help="Filter by block size",
 )
 def export(**kwargs):
@@ -540,3 +1128,251 @@ def export(**kwargs):
         formatter.format(results)
 
     console.print("[green]Export complete[/green]")
+
+
+@main.command()
+@click.option(
+    "--db-path",
+    type=click.Path(exists=True, dir_okay=False),
+    default="results/benchmark_history.db",
+    help="SQLite database whose rows are rebuilt",
+)
+@click.option(
+    "--archive-dir",
+    type=click.Path(exists=True, file_okay=False),
+    default="results/archive",
+    help="Archive the raw fio output was kept in",
+)
+@click.option(
+    "--workers", type=int, default=0, help="Parser processes (default: one per CPU)"
+)
+def reparse(**kwargs):
+    """Rebuild derived result columns from archived raw fio output
+
+    Only the archive is read, so no benchmark runs and no target is touched.
+    """
+    from rich.progress import BarColumn, Progress, TaskProgressColumn, TextColumn
+
+    from src.reparse import reparse_history
+
+    console = Console()
+    storage = SQLiteStorage(kwargs["db_path"])
+    [count] = storage.custom_query(
+        "SELECT COUNT(*) AS n FROM benchmarks WHERE raw_output IS NOT NULL"
+    )
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Reparsing archived fio output", total=count["n"])
+        updated, failed = reparse_history(
+            storage,
+            kwargs["archive_dir"],
+            workers=kwargs["workers"] or None,
+            on_progress=lambda n: progress.advance(task, n),
+        )
+    console.print(f"[green]Rebuilt {updated} benchmark rows[/green]")
+    if failed:
+        console.print(f"[yellow]{failed} rows had no usable archive entry[/yellow]")
+
+
+@main.command()
+@click.option(
+    "--target",
+    type=click.Path(exists=True, file_okay=False),
+    default=".",
+    help="Directory holding the prepared test-file pool",
+)
+@click.option("--filesize", type=str, help="Only evict files of this size")
+@click.option(
+    "--fill-pattern",
+    type=click.Choice(["random", "zero"]),
+    help="Only evict files with this fill pattern",
+)
+def evict(**kwargs):
+    """Remove prepared read test files kept with --keep-test-files"""
+    console = Console()
+
+    pool = PreparedFilePool(kwargs["target"], persistent=True)
+    removed = pool.evict(filesize=kwargs["filesize"], pattern=kwargs["fill_pattern"])
+    console.print(f"[green]Removed {removed} prepared test file(s) from {pool.root}[/green]")
+
+
+@main.command()
+@click.option(
+    "--test-type",
+    type=click.Choice(["randread", "randwrite", "read", "write", "randrw"]),
+    default="randread",
+    help="Workload to search",
+)
+@click.option("--block-size", type=str, default="4k", help="Block size of the workload")
+@click.option("--slo-p99", type=float, required=True, help="p99 latency target in microseconds")
+@click.option(
+    "--dimension",
+    type=click.Choice(["io_depth", "num_jobs", "rate_iops"]),
+    default="io_depth",
+    help="Load knob raised during the search",
+)
+@click.option("--max-value", type=int, default=1024, help="Upper bound for io_depth/num_jobs")
+@click.option("--max-probes", type=int, default=12, help="Maximum number of benchmark probes")
+@click.option(
+    "--tolerance",
+    type=float,
+    default=0.05,
+    help="Relative IOPS gain/precision at which the search stops",
+)
+@click.option("--runtime", type=int, default=30, help="Runtime of each probe in seconds")
+@click.option("--filesize", type=str, default="10G", help="File size for fio")
+@click.option(
+    "--db-path",
+    type=click.Path(),
+    default="results/benchmark_history.db",
+    help="SQLite database for probe results and the curve",
+)
+@click.option("--no-database", is_flag=True, help="Do not store the search")
+def knee(**kwargs):
+    """Find the highest sustainable IOPS under a p99 latency target"""
+    from rich.table import Table
+
+    from src.knee import KneeFinder
+
+    console = Console()
+    config = BenchmarkConfig.from_dict(
+        {
+            "mode": Mode.INDIVIDUAL,
+            "runtime": kwargs["runtime"],
+            "filesize": kwargs["filesize"],
+            "database": StorageBackend.NONE if kwargs["no_database"] else StorageBackend.SQLITE,
+            "db_path": kwargs["db_path"],
+        }
+    )
+    _use_python_engine(config, console)
+
+    finder = KneeFinder(
+        BenchmarkExecutor(config, console),
+        test_type=kwargs["test_type"],
+        block_size=kwargs["block_size"],
+        slo_p99_us=kwargs["slo_p99"],
+        dimension=kwargs["dimension"],
+        max_value=kwargs["max_value"],
+        tolerance=kwargs["tolerance"],
+        max_probes=kwargs["max_probes"],
+    )
+    result = finder.search()
+
+    table = Table(title=f"Latency vs throughput ({result.test_type} {result.block_size})")
+    table.add_column(result.dimension, justify="right")
+    table.add_column("IOPS", justify="right")
+    table.add_column("p99 (us)", justify="right")
+    table.add_column("SLO", justify="center")
+    for point in result.curve:
+        table.add_row(
+            str(point.value) if point.value else "max",
+            f"{point.iops:,.0f}",
+            f"{point.p99_us:,.1f}",
+            "[green]ok[/green]" if point.meets(result.slo_p99_us) else "[red]miss[/red]",
+        )
+    console.print(table)
+
+    if result.knee:
+        console.print(
+            f"Knee: [bold cyan]{result.knee.iops:,.0f} IOPS[/bold cyan] at "
+            f"{result.dimension}={result.knee.value or 'max'} "
+            f"(p99 {result.knee.p99_us:,.1f} us <= {result.slo_p99_us:g} us)"
+        )
+    else:
+        console.print(f"[red]No probe met the p99 target of {result.slo_p99_us:g} us[/red]")
+
+    if config.database == StorageBackend.SQLITE:
+        storage = SQLiteStorage(config.db_path)
+        ids = storage.save_results([p.result for p in result.curve], config)
+        search_id = storage.save_knee_search(
+            result.summary(),
+            [(p.value, p.iops, p.p99_us, i) for p, i in zip(result.curve, ids)],
+        )
+        console.print(f"[green]Knee search {search_id} saved to {config.db_path}[/green]")
+
+
+@main.command("convert-trace")
+@click.argument("source", type=click.Path(exists=True, dir_okay=False))
+@click.argument("output", type=click.Path(dir_okay=False))
+@click.option(
+    "--time-unit",
+    type=click.Choice(["s", "ms", "us", "ns"]),
+    default="us",
+    help="Timestamp unit of the CSV trace",
+)
+def convert_trace(**kwargs):
+    """Convert a CSV trace (offset,length,op,timestamp) into a fio iolog"""
+    from src.trace import convert_trace as convert
+
+    console = Console()
+    try:
+        count = convert(kwargs["source"], kwargs["output"], kwargs["time_unit"])
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+    console.print(f"[green]Wrote {count} I/Os to {kwargs['output']}[/green]")
+
+
+@main.command()
+def profiles():
+    """List built-in workload profiles"""
+    from rich.table import Table
+
+    console = Console()
+    table = Table(title="Built-in workload profiles")
+    table.add_column("Profile", style="cyan", no_wrap=True)
+    table.add_column("Tests", justify="right")
+    table.add_column("Description")
+    for name in builtin_profiles():
+        profile = load_profile(name)
+        table.add_row(name, str(len(profile["tests"])), profile["description"])
+    console.print(table)
+
+
+@main.command(context_settings={"ignore_unknown_options": True, "allow_extra_args": True})
+@click.pass_context
+def plan(ctx):
+    """Show what a run would do and how long it would take (takes run's options)"""
+    with run.make_context("plan", [*ctx.args, "--dry-run"], parent=ctx) as run_ctx:
+        run.invoke(run_ctx)
+
+
+@main.command()
+@click.option(
+    "--target",
+    type=click.Path(exists=True, file_okay=False),
+    default=".",
+    help="Directory the engines are probed in",
+)
+@click.option(
+    "--engines",
+    type=str,
+    default="",
+    callback=_validate_engines,
+    help="Engine specs to check, comma-separated (default: the engine matrix)",
+)
+def engines(**kwargs):
+    """Detect which fio I/O engines work on this system"""
+    from rich.table import Table
+
+    from src.engines import compiled_engines, probe_engine
+
+    console = Console()
+    compiled = set(compiled_engines())
+    table = Table(title=f"I/O engines ({kwargs['target']})")
+    table.add_column("Engine", style="cyan", no_wrap=True)
+    table.add_column("Compiled in", justify="center")
+    table.add_column("Usable", justify="center")
+    for spec in _split_list(kwargs["engines"]) or list(DEFAULT_MATRIX):
+        built = parse_engine(spec)[0] in compiled
+        usable = built and probe_engine(spec, kwargs["target"])
+        table.add_row(
+            spec,
+            "[green]yes[/green]" if built else "[red]no[/red]",
+            "[green]yes[/green]" if usable else "[red]no[/red]",
+        )
+    console.print(table)
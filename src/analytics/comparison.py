@@ -1,21 +1,27 @@
 """Run comparison logic for benchmark results"""
 
-import pandas as pd
+import numpy as np
 from typing import List, Dict, Any, Tuple
 
+from src.result import ResultLike, to_frame
+
 
 class Comparison:
     """Compare benchmark runs"""
 
     @staticmethod
-    def compare_runs(run1: List[dict], run2: List[dict], threshold: float = 0.1) -> Dict[str, Any]:
-        """Compare two benchmark runs and calculate deltas"""
+    def compare_runs(
+        run1: List[ResultLike], run2: List[ResultLike], threshold: float = 0.1
+    ) -> Dict[str, Any]:
+        """Compare two benchmark runs and calculate deltas
+
+        Each test of run1 is matched with the first run2 result of the same
+        test type and block size; deltas are computed column-wise for all
+        matched tests at once.
+        """
         if not run1 or not run2:
             return {"error": "Cannot compare empty runs"}
 
-        df1 = pd.DataFrame(run1)
-        df2 = pd.DataFrame(run2)
-
         comparison = {"run1": run1, "run2": run2, "deltas": [], "significant_changes": []}
 
         numeric_cols = [
@@ -27,38 +33,34 @@ class Comparison:
             "write_latency_us",
         ]
 
-        for _, row1 in df1.iterrows():
-            test_type = row1["test_type"]
-            block_size = row1["block_size"]
-
-            matching = df2[(df2["test_type"] == test_type) & (df2["block_size"] == block_size)]
-
-            if matching.empty:
-                continue
-
-            row2 = matching.iloc[0]
-
-            delta = {"test_type": test_type, "block_size": block_size}
-
-            for col in numeric_cols:
-                val1 = row1.get(col, 0) or 0
-                val2 = row2.get(col, 0) or 0
-
-                delta_abs = val2 - val1
-                delta_pct = (delta_abs / val1 * 100) if val1 != 0 else 0
-
-                delta[f"{col}_abs"] = delta_abs
-                delta[f"{col}_pct"] = delta_pct
-
-                if abs(delta_pct) >= threshold * 100:
-                    if "significant_fields" not in delta:
-                        delta["significant_fields"] = []
-                    delta["significant_fields"].append(col)
-
-            comparison["deltas"].append(delta)
-
-            if "significant_fields" in delta and delta["significant_fields"]:
+        keys = ["test_type", "block_size"]
+        df1 = to_frame(run1)[keys + numeric_cols]
+        df2 = to_frame(run2)[keys + numeric_cols].drop_duplicates(keys)
+        # An inner merge keeps the order of run1
+        matched = df1.merge(df2, on=keys, how="inner", suffixes=("_1", "_2"))
+
+        columns = {}
+        for col in numeric_cols:
+            val1 = matched[f"{col}_1"].to_numpy()
+            delta_abs = matched[f"{col}_2"].to_numpy() - val1
+            delta_pct = np.divide(
+                delta_abs * 100, val1, out=np.zeros_like(delta_abs), where=val1 != 0
+            )
+            columns[col] = (delta_abs, delta_pct, np.abs(delta_pct) >= threshold * 100)
+
+        for i, key in enumerate(zip(matched["test_type"], matched["block_size"])):
+            delta = dict(zip(keys, key))
+            significant = []
+            for col, (delta_abs, delta_pct, is_significant) in columns.items():
+                delta[f"{col}_abs"] = float(delta_abs[i])
+                delta[f"{col}_pct"] = float(delta_pct[i])
+                if is_significant[i]:
+                    significant.append(col)
+
+            if significant:
+                delta["significant_fields"] = significant
                 comparison["significant_changes"].append(delta)
+            comparison["deltas"].append(delta)
 
         return comparison
 
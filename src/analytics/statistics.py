@@ -1,96 +1,57 @@
 """Statistics and analysis for benchmark results"""
 
-import pandas as pd
-from typing import List, Dict, Any
+from typing import Iterable, Dict, Any
+
+from src.result import NUMERIC_FIELDS, ResultLike, to_frame
 
 
 class Statistics:
     """Calculate statistics for benchmark results"""
 
     @staticmethod
-    def calculate_basic(results: List[dict]) -> Dict[str, Any]:
-        """Calculate basic statistics (mean, median, min, max)"""
-        if not results:
+    def _aggregate(results: Iterable[ResultLike], detailed: bool) -> Dict[str, Any]:
+        """Per test type and block size statistics of every numeric result field"""
+        df = to_frame(results)
+        if df.empty:
             return {}
 
-        df = pd.DataFrame(results)
-
-        numeric_cols = [
-            "read_iops",
-            "write_iops",
-            "read_bw",
-            "write_bw",
-            "read_latency_us",
-            "write_latency_us",
-            "io_time_sec",
-            "wall_time_sec",
-        ]
+        grouped = df.groupby(["test_type", "block_size"], sort=False)[list(NUMERIC_FIELDS)]
+        aggregates = {
+            "mean": grouped.mean(),
+            "median": grouped.median(),
+            "min": grouped.min(),
+            "max": grouped.max(),
+        }
+        if detailed:
+            aggregates["std"] = grouped.std()
+            aggregates["q25"] = grouped.quantile(0.25)
+            aggregates["q75"] = grouped.quantile(0.75)
+        sizes = grouped.size()
 
         stats = {}
-
-        for test_type in df["test_type"].unique():
-            for block_size in df[df["test_type"] == test_type]["block_size"].unique():
-                subset = df[(df["test_type"] == test_type) & (df["block_size"] == block_size)]
-
-                if subset.empty:
-                    continue
-
-                key = f"{test_type}_{block_size}"
-                stats[key] = {}
-
-                for col in numeric_cols:
-                    if col in subset.columns:
-                        values = subset[col].dropna()
-                        if len(values) > 0:
-                            stats[key][col] = {
-                                "mean": float(values.mean()),
-                                "median": float(values.median()),
-                                "min": float(values.min()),
-                                "max": float(values.max()),
-                            }
-
+        for test_type, block_size in aggregates["mean"].index:
+            key = f"{test_type}_{block_size}"
+            stats[key] = {
+                col: {
+                    name: float(frame.at[(test_type, block_size), col])
+                    for name, frame in aggregates.items()
+                }
+                for col in NUMERIC_FIELDS
+            }
+            if detailed:
+                for values in stats[key].values():
+                    values["count"] = int(sizes[(test_type, block_size)])
         return stats
 
     @staticmethod
-    def calculate_detailed(results: List[dict]) -> Dict[str, Any]:
+    def calculate_basic(results: Iterable[ResultLike]) -> Dict[str, Any]:
+        """Calculate basic statistics (mean, median, min, max)"""
+        return Statistics._aggregate(results, detailed=False)
+
+    @staticmethod
+    def calculate_detailed(results: Iterable[ResultLike]) -> Dict[str, Any]:
         """Calculate detailed statistics with std dev and percentiles"""
-        basic_stats = Statistics.calculate_basic(results)
-
-        if not results:
-            return basic_stats
-
-        df = pd.DataFrame(results)
-
-        numeric_cols = [
-            "read_iops",
-            "write_iops",
-            "read_bw",
-            "write_bw",
-            "read_latency_us",
-            "write_latency_us",
-            "io_time_sec",
-            "wall_time_sec",
-        ]
-
-        for test_type in df["test_type"].unique():
-            for block_size in df[df["test_type"] == test_type]["block_size"].unique():
-                subset = df[(df["test_type"] == test_type) & (df["block_size"] == block_size)]
-
-                if subset.empty:
-                    continue
-
-                key = f"{test_type}_{block_size}"
-
-                for col in numeric_cols:
-                    if col in subset.columns and col in basic_stats.get(key, {}):
-                        values = subset[col].dropna()
-                        if len(values) > 0:
-                            basic_stats[key][col]["std"] = float(values.std())
-                            basic_stats[key][col]["q25"] = float(values.quantile(0.25))
-                            basic_stats[key][col]["q75"] = float(values.quantile(0.75))
-                            basic_stats[key][col]["count"] = len(values)
-
-        return basic_stats
+        return Statistics._aggregate(results, detailed=True)
 
     @staticmethod
     def format_basic(stats: Dict[str, Any]) -> str:
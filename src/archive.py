@@ -0,0 +1,89 @@
+"""Compressed, content-addressed archive of raw fio output"""
+
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.fio_logs import find_log_files
+
+# Bumped when the manifest layout changes
+MANIFEST_VERSION = 1
+
+
+class RawArchive:
+    """Store blobs gzip-compressed under the SHA-256 of their content
+
+    Blobs live at <root>/<first two hex digits>/<digest>.gz, so identical
+    content (a batch run's shared output, a rerun that produced the same
+    log) is stored once. Writes go through a temporary file and a rename, so
+    a crash never leaves a truncated blob under a valid name.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.gz"
+
+    def put(self, data: bytes) -> str:
+        """Store data and return its digest"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        if path.exists():
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        # mtime=0 keeps the compressed bytes reproducible
+        tmp_path.write_bytes(gzip.compress(data, compresslevel=6, mtime=0))
+        tmp_path.replace(path)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the content stored under a digest
+
+        Raises:
+            FileNotFoundError: If nothing is stored under the digest
+        """
+        return gzip.decompress(self.path_for(digest).read_bytes())
+
+    def put_json(self, data: dict) -> str:
+        return self.put(json.dumps(data, sort_keys=True).encode())
+
+    def get_json(self, digest: str) -> dict:
+        return json.loads(self.get(digest))
+
+    def __contains__(self, digest: str) -> bool:
+        return self.path_for(digest).exists()
+
+    def archive_test(
+        self,
+        output: str,
+        test_config: dict,
+        section: Optional[str] = None,
+        host: Optional[str] = None,
+        per_job_breakdown: bool = False,
+    ) -> str:
+        """Archive the raw output of one test and return its manifest digest
+
+        The manifest records everything needed to parse the output again: the
+        test configuration, the batch section or fio server host the result
+        came from, and the digests of the test's interval log files.
+        """
+        logs: Dict[str, str] = {}
+        if test_config.get("log_prefix"):
+            for _, _, path in find_log_files(test_config["log_prefix"]):
+                logs[path.name] = self.put(path.read_bytes())
+        return self.put_json(
+            {
+                "version": MANIFEST_VERSION,
+                "output": self.put(output.encode()),
+                "logs": logs,
+                "test_config": test_config,
+                "section": section,
+                "host": host,
+                "per_job_breakdown": per_job_breakdown,
+            }
+        )
@@ -0,0 +1,268 @@
+"""Asyncio executor running benchmark suites against several targets at once"""
+
+import asyncio
+import os
+import signal
+import stat
+import time
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
+from src.config import BenchmarkConfig
+from src.executor import BenchmarkExecutor, _calculate_timeout
+from src.result import BenchmarkResult
+
+
+def device_key(target: str) -> int:
+    """Identify the device backing a target directory or block device"""
+    info = os.stat(target)
+    return info.st_rdev if stat.S_ISBLK(info.st_mode) else info.st_dev
+
+
+async def terminate_process_group(process: asyncio.subprocess.Process, grace: float = 5.0) -> None:
+    """Stop a process started with start_new_session and everything it forked
+
+    SIGTERM lets FIO stop its jobs and remove temporary state; the group is
+    killed if it is still alive after the grace period.
+    """
+    if process.returncode is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(process.wait(), grace)
+    except asyncio.TimeoutError:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+class AsyncBenchmarkExecutor:
+    """Run the same suite concurrently against several target directories
+
+    Each target gets its own BenchmarkExecutor for test files, FIO command
+    construction and output parsing; this class only schedules the FIO
+    processes:
+
+    - Targets on the same device are serialized by a per-device lock, so two
+      suites never compete for one disk.
+    - A global semaphore caps the number of FIO processes running at once.
+    - FIO runs in its own session. Timeouts and task cancellation terminate
+      the whole process group, so no orphaned FIO workers keep doing I/O.
+
+    Completed tests go to each executor's checkpoint journal and raw output
+    archive like in a serial run, so an interrupted run can be resumed.
+    Device and host telemetry and preparation time are recorded per test as
+    well; host stats cover the whole machine, including the other targets.
+    Live interval stats and the Python-side steady-state detector need the
+    streamed output of the serial path and are not used here; fio's own
+    steadystate option still applies.
+    """
+
+    def __init__(
+        self,
+        config: BenchmarkConfig,
+        targets: List[str],
+        console: Optional[Console] = None,
+        max_concurrency: int = 0,
+    ):
+        """
+        Args:
+            config: Benchmark configuration shared by all targets
+            targets: Directories (or devices) to benchmark
+            console: Console for progress and messages
+            max_concurrency: Maximum concurrent FIO processes (0 = one per target)
+        """
+        if not targets:
+            raise ValueError("At least one target is required")
+        self.config = config
+        self.console = console or Console()
+        self.targets = list(targets)
+        self.max_concurrency = max_concurrency or len(self.targets)
+        self.executors: Dict[str, BenchmarkExecutor] = {
+            target: BenchmarkExecutor(config, self.console, target_dir=target)
+            for target in self.targets
+        }
+
+    def run_all_tests(self) -> List[BenchmarkResult]:
+        """Run the configured suite on every target, blocking until done"""
+        return asyncio.run(self.run())
+
+    async def run(self, test_configs: Optional[List[dict]] = None) -> List[BenchmarkResult]:
+        """Run a suite on every target concurrently
+
+        Returns:
+            Results grouped by target in target order, each tagged with `target`
+        """
+        if test_configs is None:
+            test_configs = self.executors[self.targets[0]]._get_test_configs()
+        if not test_configs:
+            self.console.print("[yellow]No tests to run[/yellow]")
+            return []
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        device_locks: Dict[int, asyncio.Lock] = {}
+        for target in self.targets:
+            device_locks.setdefault(device_key(target), asyncio.Lock())
+
+        self.console.print(
+            f"\n[bold]Running {len(test_configs)} tests on {len(self.targets)} targets "
+            f"({len(device_locks)} devices, up to {self.max_concurrency} at once)[/bold]\n"
+        )
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(complete_style="magenta", finished_style="green"),
+            TaskProgressColumn(),
+            TextColumn("{task.fields[current]}"),
+            console=self.console,
+        ) as progress:
+            tasks = [
+                asyncio.create_task(
+                    self._run_target(
+                        target,
+                        test_configs,
+                        semaphore,
+                        device_locks[device_key(target)],
+                        progress,
+                    )
+                )
+                for target in self.targets
+            ]
+            try:
+                per_target = await asyncio.gather(*tasks)
+            except BaseException:
+                # One target failing (or Ctrl-C) cancels the others cleanly
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+        return [result for results in per_target for result in results]
+
+    async def _run_target(
+        self,
+        target: str,
+        test_configs: List[dict],
+        semaphore: asyncio.Semaphore,
+        device_lock: asyncio.Lock,
+        progress: Progress,
+    ) -> List[BenchmarkResult]:
+        """Run a suite on one target, one test at a time"""
+        executor = self.executors[target]
+        done, pending = executor._resume_state(test_configs)
+        task = progress.add_task(f"  {target}", total=len(pending), current="")
+        results = []
+        try:
+            for test_config in pending:
+                async with device_lock, semaphore:
+                    progress.update(task, current=executor._describe(test_config))
+                    fills = len(executor.fill_reports)
+                    result = await self._run_test(executor, test_config)
+                # Kept apart so the planner can tell preparation from overhead
+                prepare_sec = sum(r.seconds for r in executor.fill_reports[fills:])
+                if prepare_sec:
+                    result.extra["prepare_sec"] = round(prepare_sec, 2)
+                results.append(executor._tag_target(result))
+                executor._journal_result(test_config, result)
+                progress.advance(task)
+            progress.update(task, current="[green]done[/green]")
+        finally:
+            await asyncio.to_thread(executor._release_test_files)
+        return executor._merge_resumed(test_configs, done, pending, results)
+
+    async def _run_test(
+        self, executor: BenchmarkExecutor, test_config: dict
+    ) -> BenchmarkResult:
+        """Run one FIO test on an executor's target"""
+        timeout = _calculate_timeout(self.config, executor.calibration)
+        wall_start = time.time()
+        test_file = executor._test_file_for(test_config)
+        skip_reason = executor._skip_reason(test_config)
+        if skip_reason:
+            self.console.print(f"[yellow]{skip_reason}: {executor.temp_dir}[/yellow]")
+            return executor._empty_result(test_config, skip_reason)
+
+        samplers = {}
+        try:
+            prepared = True
+            if test_config["test_type"] in ("read", "randread"):
+                test_file = await asyncio.to_thread(executor._acquire_read_file, timeout)
+                prepared = test_file is not None
+            elif test_config["test_type"] == "replay":
+                prepared = await asyncio.to_thread(
+                    executor._prepare_replay_file, test_config, test_file, timeout
+                )
+            if not prepared:
+                return executor._empty_result(
+                    test_config,
+                    "FAILED: Could not create test file",
+                    round(time.time() - wall_start, 2),
+                )
+
+            if executor.stress is not None:
+                executor.stress.prepare()
+            cmd = executor._build_fio_command(test_config, test_file)
+            # Started after file preparation so fills do not count as test I/O
+            samplers = executor._start_samplers()
+            try:
+                returncode, stdout, stderr = await self._exec_fio(cmd, timeout)
+            except asyncio.TimeoutError:
+                self.console.print(
+                    f"[red]Test timed out on {executor.temp_dir}: {test_config['test_type']}[/red]"
+                )
+                return executor._empty_result(
+                    test_config, "TIMED OUT", round(time.time() - wall_start, 2)
+                )
+
+            wall_time_sec = round(time.time() - wall_start, 2)
+            parsed = executor._parse_fio_json_output(stdout, test_config, allow_empty=True)
+            if returncode == 0 or parsed.io_time_sec > 0:
+                parsed.status_text = "OK"
+                parsed.extra["output_file"] = executor._output_file(test_file)
+                executor._archive_raw(parsed, test_config, stdout)
+                executor._record_telemetry(parsed, samplers)
+            else:
+                stderr_msg = stderr.strip() or "unknown error"
+                self.console.print(
+                    f"[red]FIO test failed on {executor.temp_dir}: {stderr_msg}[/red]"
+                )
+                parsed = executor._empty_result(test_config, f"FAILED: {stderr_msg}")
+            parsed.wall_time_sec = wall_time_sec
+            return parsed
+        finally:
+            for sampler in samplers.values():
+                sampler.stop()
+            executor._remove_test_file(test_file)
+
+    async def _exec_fio(self, cmd: List[str], timeout: float) -> Tuple[int, str, str]:
+        """Run FIO in its own process group
+
+        Raises:
+            asyncio.TimeoutError: If FIO does not finish within timeout; the
+                process group has been terminated by then
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except BaseException:
+            # Timeout or cancellation: never leave FIO running in the background
+            await terminate_process_group(process)
+            raise
+        return (
+            process.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
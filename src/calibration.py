@@ -0,0 +1,146 @@
+"""Quick disk probe calibrating timeouts and runtime estimates"""
+
+import json
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from src.pyengine import PythonEngine
+
+PROBE_FILE_NAME = ".disk_io_bm_calibration.dat"
+
+# Largest probe file and seconds spent on each probe pass
+PROBE_SIZE = 256 * 1024**2
+PROBE_RUNTIME = 3
+
+# Write speed assumed without a calibration: a very slow disk
+FALLBACK_WRITE_BPS = 10 * 1024 * 1024
+
+# Timeouts assume the disk may run at half the measured speed (e.g. after
+# burst credits of a cloud volume run out)
+SAFETY_FACTOR = 0.5
+
+
+@dataclass
+class Calibration:
+    """Measured speed of a benchmark target"""
+
+    target: str
+    seq_write_bps: float = 0.0  # 0 when not measured (block devices)
+    rand_read_iops: float = 0.0
+    measured_at: str = ""
+
+    def write_seconds(self, size_bytes: int, worst_case: bool = False) -> float:
+        """Seconds needed to write size_bytes sequentially
+
+        Args:
+            size_bytes: Bytes to write
+            worst_case: Assume the disk runs at SAFETY_FACTOR of the measured rate
+        """
+        if self.seq_write_bps <= 0:
+            return size_bytes / FALLBACK_WRITE_BPS
+        rate = self.seq_write_bps * (SAFETY_FACTOR if worst_case else 1)
+        return size_bytes / rate
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Calibration":
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+def probe_command(
+    path: Path, test_type: str, block_size: str, size: int, runtime: int, direct: bool
+) -> list:
+    """FIO command for one time-based probe pass at queue depth 1"""
+    cmd = [
+        "fio",
+        "--name=calibrate",
+        f"--filename={path}",
+        f"--size={size}",
+        f"--rw={test_type}",
+        f"--bs={block_size}",
+        "--iodepth=1",
+        "--numjobs=1",
+        "--time_based",
+        f"--runtime={runtime}",
+        "--output-format=json",
+    ]
+    if direct:
+        cmd.append("--direct=1")
+    return cmd
+
+
+def _fio_rates(output: str, direction: str) -> Tuple[float, float, int]:
+    """Return (bytes/s, IOPS, bytes moved) of one direction from FIO JSON output"""
+    start, end = output.find("{"), output.rfind("}") + 1
+    if start == -1 or end == 0:
+        return 0.0, 0.0, 0
+    try:
+        stats = json.loads(output[start:end])["jobs"][0][direction]
+    except (json.JSONDecodeError, KeyError, IndexError):
+        return 0.0, 0.0, 0
+    return stats.get("bw_bytes", 0), stats.get("iops", 0), stats.get("io_bytes", 0)
+
+
+def run_probe(
+    path: Path,
+    target: str,
+    write: bool = True,
+    direct: bool = True,
+    engine: Optional[PythonEngine] = None,
+    runtime: int = PROBE_RUNTIME,
+    runner: Callable[..., subprocess.CompletedProcess] = subprocess.run,
+) -> Optional[Calibration]:
+    """Measure sequential write and random read speed of a target
+
+    A sequential 1M write pass (the way test files are pre-created) runs for
+    `runtime` seconds on `path`, then a 4k random read pass over the bytes it
+    wrote, so the read never waits for a file layout. With `write=False`
+    (block devices) only the read pass runs, over the start of `path`.
+
+    Args:
+        path: Probe file to create, or block device to read
+        target: Target the calibration is recorded for
+        write: Run the write pass; the file is removed afterwards
+        direct: Bypass the page cache
+        engine: Python engine to probe with instead of fio
+
+    Returns:
+        The calibration, or None if the probe failed
+    """
+    calibration = Calibration(target=target, measured_at=time.strftime("%Y-%m-%d %H:%M:%S"))
+    readable = PROBE_SIZE
+    try:
+        if write:
+            if engine is not None:
+                stats = engine.run(path, "write", 1024 * 1024, PROBE_SIZE, runtime)["write"]
+                bw, io_bytes = stats["bw_bytes"], stats["io_bytes"]
+            else:
+                cmd = probe_command(path, "write", "1M", PROBE_SIZE, runtime, direct)
+                result = runner(cmd, capture_output=True, text=True, timeout=runtime + 60)
+                bw, _, io_bytes = _fio_rates(result.stdout, "write")
+            if bw <= 0:
+                return None
+            calibration.seq_write_bps = bw
+            readable = min(PROBE_SIZE, io_bytes) // (1024 * 1024) * 1024 * 1024
+            if readable == 0:
+                return calibration
+
+        if engine is not None:
+            calibration.rand_read_iops = engine.run(path, "randread", 4096, readable, runtime)[
+                "read"
+            ]["iops"]
+        else:
+            cmd = probe_command(path, "randread", "4k", readable, runtime, direct)
+            result = runner(cmd, capture_output=True, text=True, timeout=runtime + 60)
+            calibration.rand_read_iops = _fio_rates(result.stdout, "read")[1]
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        return None
+    finally:
+        if write:
+            path.unlink(missing_ok=True)
+    return calibration
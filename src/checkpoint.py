@@ -0,0 +1,128 @@
+"""Per-test checkpoint journal for resumable benchmark suites"""
+
+import json
+import os
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Optional
+
+# Test config keys that vary between attempts and do not identify a test
+_VOLATILE_KEYS = ("log_prefix",)
+
+# Run-level settings every journaled result depends on; resuming a run with
+# different values would merge results that are not comparable
+RUN_SETTINGS = (
+    "mode",
+    "filesize",
+    "runtime",
+    "direct_io",
+    "sync",
+    "io_depth",
+    "num_jobs",
+    "ioengine",
+    "python_engine",
+    "fill_pattern",
+)
+
+
+def config_key(test_config: dict) -> str:
+    """Stable identity of a test configuration"""
+    return json.dumps(
+        {k: v for k, v in test_config.items() if k not in _VOLATILE_KEYS}, sort_keys=True
+    )
+
+
+def run_settings(config) -> dict:
+    """The RUN_SETTINGS of a BenchmarkConfig as JSON-ready values"""
+    values = {name: getattr(config, name) for name in RUN_SETTINGS}
+    return {k: v.value if isinstance(v, Enum) else v for k, v in values.items()}
+
+
+def new_run_id() -> str:
+    """Return an id for a new checkpointed run"""
+    return time.strftime("%Y%m%d-%H%M%S")
+
+
+class CheckpointJournal:
+    """Append-only JSONL journal of completed tests
+
+    A header line holds the run-level settings the journal was started with,
+    each following line one test config and its parsed result. Lines are
+    flushed and fsynced as soon as a test finishes, so a crash or Ctrl-C
+    loses at most the test that was running. A truncated last line is
+    ignored on load.
+    """
+
+    def __init__(self, checkpoint_dir: str, run_id: str, settings: Optional[dict] = None):
+        self.run_id = run_id
+        self.path = Path(checkpoint_dir) / f"{run_id}.jsonl"
+        self.settings = settings  # run_settings() of the run writing or resuming it
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def differences(self) -> Dict[str, tuple]:
+        """Settings that differ from the journal header, as (journaled, current)
+
+        Journals without a header, or a journal opened without settings,
+        report no differences.
+        """
+        if self.settings is None or not self.path.exists():
+            return {}
+        with open(self.path, "r") as f:
+            try:
+                header = json.loads(f.readline()).get("settings")
+            except json.JSONDecodeError:
+                return {}
+        if header is None:
+            return {}
+        return {
+            name: (header.get(name), value)
+            for name, value in self.settings.items()
+            if header.get(name) != value
+        }
+
+    def check(self) -> None:
+        """Refuse to resume a run with other run-level settings
+
+        Raises:
+            ValueError: If a setting differs from the journal header
+        """
+        differences = self.differences()
+        if differences:
+            changed = ", ".join(
+                f"{name} {old!r} -> {new!r}" for name, (old, new) in differences.items()
+            )
+            raise ValueError(f"Run {self.run_id} was started with other settings: {changed}")
+
+    def load(self) -> Dict[str, dict]:
+        """Return completed results keyed by config_key()"""
+        done: Dict[str, dict] = {}
+        if not self.path.exists():
+            return done
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Interrupted while writing this entry
+                if "config" in entry:
+                    done[config_key(entry["config"])] = entry["result"]
+        return done
+
+    def record(self, test_config: dict, result: dict) -> None:
+        """Durably append one completed test"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({"config": test_config, "result": result}, default=str)
+        if self.settings is not None and not self.path.exists():
+            line = json.dumps({"settings": self.settings}) + "\n" + line
+        with open(self.path, "a") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def remove(self) -> None:
+        """Delete the journal once its results are safely stored"""
+        if self.path.exists():
+            self.path.unlink()
@@ -5,6 +5,20 @@ from dataclasses import dataclass, field
 from typing import List
 
 
+def parse_filesize_to_bytes(filesize: str) -> int:
+    """Parse filesize string (e.g., '10G', '1M', '512k') to bytes"""
+    filesize = filesize.strip().upper()
+    multipliers = {
+        "K": 1024,
+        "M": 1024**2,
+        "G": 1024**3,
+        "T": 1024**4,
+    }
+    if filesize[-1] in multipliers:
+        return int(float(filesize[:-1]) * multipliers[filesize[-1]])
+    return int(filesize)
+
+
 class StorageBackend(Enum):
     """Storage backend options"""
 
@@ -21,6 +35,9 @@ class Mode(Enum):
     LEAN = "lean"
     FULL = "full"
     INDIVIDUAL = "individual"
+    SWEEP = "sweep"
+    REPLAY = "replay"
+    PROFILE = "profile"
 
 
 @dataclass
@@ -36,6 +53,71 @@ class BenchmarkConfig:
     num_jobs: int = 1
     direct_io: bool = True
     sync: bool = True
+    status_interval: int = 1  # Seconds between live fio reports, 0 disables
+    per_job_breakdown: bool = False  # Keep per-worker stats when num_jobs > 1
+
+    # I/O engine spec such as "io_uring+fixedbufs" (empty = fio default, psync)
+    ioengine: str = ""
+    # Engine matrix: run every test once per engine (empty list = auto-detect)
+    engine_matrix: bool = False
+    engines: List[str] = field(default_factory=list)
+    # Built-in os.preadv/os.pwritev engine instead of fio (used when fio is missing)
+    python_engine: bool = False
+
+    # Steady-state early termination
+    steady_state: bool = False
+    ss_metric: str = "iops"  # "iops" or "bw"
+    ss_slope_limit: float = 0.3  # Max slope per second, % of mean
+    ss_deviation_limit: float = 5.0  # Max deviation from mean, %
+    ss_dur: int = 30  # Seconds of samples the criteria are evaluated over
+    ss_ramp: int = 10  # Seconds ignored at test start
+    ss_use_fio: bool = True  # Also use fio's built-in steadystate option
+
+    # Per-interval fio logs ingested into the time-series table
+    log_interval_ms: int = 0  # 0 disables interval logging
+    log_dir: str = "results/logs"
+
+    # Raw fio output kept gzip-compressed under its SHA-256 for later reparsing;
+    # the run command turns it on, library callers opt in
+    archive_raw: bool = False
+    archive_dir: str = "results/archive"
+
+    # Block-device telemetry sampled from sysfs while each test runs
+    device_stats_interval: float = 1.0  # Seconds between samples, 0 disables
+    # Host PSI, per-CPU time and dirty pages sampled while each test runs
+    host_stats_interval: float = 1.0  # Seconds between samples, 0 disables
+    host_stats_series: bool = False  # Also keep every sample, not just the summary
+
+    # Disk probe calibrating timeouts and estimates, cached per target in SQLite
+    calibrate: bool = True
+    recalibrate: bool = False  # Probe again even if a cached calibration exists
+    calibration_max_age_days: int = 30
+
+    # Prepared read test files
+    keep_test_files: bool = False  # Keep the prepared file pool across runs
+    fill_pattern: str = "random"
+    prepare_strategy: str = "auto"  # auto, sequential, parallel or refill (see src.prepare)
+
+    # Benchmark targets: directories or block devices (empty = current directory)
+    targets: List[str] = field(default_factory=list)
+    parallel_targets: bool = False  # Run targets concurrently (one suite per target)
+    max_concurrency: int = 0  # Max concurrent fio processes, 0 = one per target
+    allow_device_writes: bool = False  # Permit write tests on raw block devices
+
+    # Multi-file stress: every test drives several files or devices from one fio process
+    stress_targets: List[str] = field(default_factory=list)  # Files or block devices
+    stress_files: int = 0  # Files created in the target when no stress_targets, 0 disables
+    stress_shared: bool = False  # One job over all files (filename=a:b:c), not one per file
+    stress_nrfiles: int = 1  # Files per job; > 1 gives each job a directory of small files
+    stress_openfiles: int = 0  # Files a job keeps open at once, 0 = all of them
+    file_service_type: str = "roundrobin"  # How a job picks its next file (fio option)
+
+    # Distributed mode: fio --server endpoints ("host" or "host,port") driven together
+    clients: List[str] = field(default_factory=list)
+
+    # Checkpoint journal; completed tests of a run_id are skipped when rerun
+    run_id: str = ""  # Empty disables checkpointing
+    checkpoint_dir: str = "results/checkpoints"
 
     # Mode
     mode: Mode = Mode.LEAN
@@ -44,10 +126,32 @@ class BenchmarkConfig:
     concurrency: bool = False
     quick: bool = False
 
+    # Batch mode (whole suite in one fio process)
+    batch: bool = False
+    sections: List[str] = field(default_factory=list)
+
     # Individual tests
     test_types: List[str] = field(default_factory=list)
     block_sizes: List[str] = field(default_factory=list)
 
+    # Parameter sweep (Mode.SWEEP); empty lists fall back to the fixed values above
+    sweep_test_types: List[str] = field(default_factory=list)
+    sweep_block_sizes: List[str] = field(default_factory=list)
+    sweep_io_depths: List[int] = field(default_factory=list)
+    sweep_num_jobs: List[int] = field(default_factory=list)
+    sweep_rwmixread: List[int] = field(default_factory=list)
+    sweep_grid_file: str = ""  # JSON list of explicit sweep points
+
+    # Workload profiles (Mode.PROFILE): built-in names or TOML/YAML paths
+    profiles: List[str] = field(default_factory=list)
+
+    # Trace replay (Mode.REPLAY): fio iologs or CSV traces
+    trace_files: List[str] = field(default_factory=list)
+    trace_time_unit: str = "us"  # Timestamp unit of CSV traces
+    replay_time_scale: int = 100  # Replay rate in % of recorded timing
+    replay_no_stall: bool = False  # Ignore recorded timing
+    replay_loops: int = 1
+
     # Output
     results_dir: str = "results"
     output_format: str = "table"
@@ -0,0 +1,217 @@
+"""Block-device telemetry sampled from sysfs and /proc/diskstats while tests run"""
+
+import os
+import stat
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.sampler import PreadSampler
+
+DISKSTATS_PATH = "/proc/diskstats"
+SYSFS_DEV_BLOCK = "/sys/dev/block"
+
+# Request queue settings recorded once per test: they are configuration, not counters
+QUEUE_ATTRIBUTES = ("scheduler", "nr_requests", "rotational", "max_sectors_kb", "read_ahead_kb")
+
+# Counters are in 512-byte sectors regardless of the device's block size
+SECTOR_SIZE = 512
+
+# Indices into the stat fields (Documentation/block/stat.rst)
+READ_IOS, READ_MERGES, READ_SECTORS, READ_TICKS = 0, 1, 2, 3
+WRITE_IOS, WRITE_MERGES, WRITE_SECTORS, WRITE_TICKS = 4, 5, 6, 7
+IN_FLIGHT, IO_TICKS, TIME_IN_QUEUE = 8, 9, 10
+
+
+@dataclass
+class DeviceSample:
+    """Device activity over one sampling interval, like a line of iostat -x"""
+
+    t_ms: int  # End of the interval, since sampling started
+    util_pct: float  # Time the device had I/O in flight
+    aqu_sz: float  # Average number of requests queued or in service
+    read_iops: float
+    write_iops: float
+    read_bw: float  # bytes/s
+    write_bw: float
+    read_await_ms: float  # Average time a completed read spent queued and in service
+    write_await_ms: float
+    read_merge_pct: float  # Requests merged into an adjacent one before dispatch
+    write_merge_pct: float
+    inflight_read: int
+    inflight_write: int
+
+
+def _ratio(part: float, whole: float) -> float:
+    return part / whole if whole > 0 else 0.0
+
+
+def compute_sample(
+    prev: Tuple[int, ...], cur: Tuple[int, ...], dt: float, t_ms: int, inflight=(0, 0)
+) -> DeviceSample:
+    """Derive iostat-style metrics from two stat snapshots `dt` seconds apart"""
+    delta = [c - p for c, p in zip(cur, prev)]
+    dt_ms = dt * 1000
+    reads, writes = delta[READ_IOS], delta[WRITE_IOS]
+    return DeviceSample(
+        t_ms=t_ms,
+        util_pct=round(min(100.0, 100 * _ratio(delta[IO_TICKS], dt_ms)), 2),
+        aqu_sz=round(_ratio(delta[TIME_IN_QUEUE], dt_ms), 3),
+        read_iops=round(_ratio(reads, dt), 1),
+        write_iops=round(_ratio(writes, dt), 1),
+        read_bw=round(_ratio(delta[READ_SECTORS] * SECTOR_SIZE, dt), 1),
+        write_bw=round(_ratio(delta[WRITE_SECTORS] * SECTOR_SIZE, dt), 1),
+        read_await_ms=round(_ratio(delta[READ_TICKS], reads), 3),
+        write_await_ms=round(_ratio(delta[WRITE_TICKS], writes), 3),
+        read_merge_pct=round(100 * _ratio(delta[READ_MERGES], delta[READ_MERGES] + reads), 2),
+        write_merge_pct=round(100 * _ratio(delta[WRITE_MERGES], delta[WRITE_MERGES] + writes), 2),
+        inflight_read=inflight[0],
+        inflight_write=inflight[1],
+    )
+
+
+def parse_stat(text: str) -> Tuple[int, ...]:
+    """Parse the counters of a sysfs stat file"""
+    return tuple(int(field) for field in text.split()[: TIME_IN_QUEUE + 1])
+
+
+def parse_diskstats(text: str, name: str) -> Optional[Tuple[int, ...]]:
+    """Return the counters of device `name` from /proc/diskstats content"""
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) > 3 and fields[2] == name:
+            return parse_stat(" ".join(fields[3:]))
+    return None
+
+
+def resolve_device(path: str) -> Optional[str]:
+    """Return the sysfs directory of the block device backing `path`
+
+    A block device node resolves to itself, anything else to the device of the
+    filesystem it lives on. Returns None for filesystems without a block
+    device (tmpfs, overlay, NFS) and where sysfs is unavailable.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    dev = st.st_rdev if stat.S_ISBLK(st.st_mode) else st.st_dev
+    sysfs_dir = os.path.join(SYSFS_DEV_BLOCK, f"{os.major(dev)}:{os.minor(dev)}")
+    if not os.path.exists(os.path.join(sysfs_dir, "stat")):
+        return None
+    return os.path.realpath(sysfs_dir)
+
+
+def read_queue_settings(sysfs_dir: str) -> Dict[str, str]:
+    """Read the request queue settings; a partition uses its disk's queue"""
+    queue_dir = os.path.join(sysfs_dir, "queue")
+    if not os.path.isdir(queue_dir):
+        queue_dir = os.path.join(os.path.dirname(sysfs_dir), "queue")
+    settings = {}
+    for name in QUEUE_ATTRIBUTES:
+        try:
+            with open(os.path.join(queue_dir, name), "r") as f:
+                settings[name] = f.read().strip()
+        except OSError:
+            continue
+    return settings
+
+
+class DeviceSampler(PreadSampler):
+    """Sample one block device's counters
+
+    The sysfs stat file is preferred; /proc/diskstats carries the same
+    counters and is only read where it is missing.
+    """
+
+    def __init__(self, sysfs_dir: str, interval: float = 1.0):
+        super().__init__(interval)
+        self.sysfs_dir = sysfs_dir
+        self.name = os.path.basename(sysfs_dir)
+        self.queue = read_queue_settings(sysfs_dir)
+        self.samples: List[DeviceSample] = []
+        if not self._open("stat", os.path.join(sysfs_dir, "stat")):
+            self._open("diskstats", DISKSTATS_PATH)
+        self._open("inflight", os.path.join(sysfs_dir, "inflight"))
+
+    def read_counters(self) -> Optional[Tuple[int, ...]]:
+        """Current cumulative counters of the device"""
+        text = self._pread("stat")
+        if text is not None:
+            return parse_stat(text)
+        text = self._pread("diskstats")
+        return parse_diskstats(text, self.name) if text is not None else None
+
+    def read_inflight(self) -> Tuple[int, int]:
+        """Reads and writes currently in flight"""
+        text = self._pread("inflight")
+        if text is None:
+            return 0, 0
+        fields = text.split()
+        return int(fields[0]), int(fields[1])
+
+    def snapshot(self) -> Optional[Tuple[Tuple[int, ...], Tuple[int, int]]]:
+        counters = self.read_counters()
+        return (counters, self.read_inflight()) if counters is not None else None
+
+    def compute(self, prev, cur, dt: float, t_ms: int) -> DeviceSample:
+        return compute_sample(prev[0], cur[0], dt, t_ms, cur[1])
+
+    def summary(self) -> dict:
+        """Result fields summarizing the samples (empty without samples)"""
+        return summarize(self.samples)
+
+
+def summarize(samples: List[DeviceSample]) -> dict:
+    """Average utilization, queue size and awaits over the samples
+
+    Awaits are weighted by the I/Os completed in each interval, so idle
+    intervals at the start or end of a test do not dilute them.
+    """
+    if not samples:
+        return {}
+    reads = sum(s.read_iops for s in samples)
+    writes = sum(s.write_iops for s in samples)
+    return {
+        "dev_util_pct": round(sum(s.util_pct for s in samples) / len(samples), 2),
+        "dev_aqu_sz": round(sum(s.aqu_sz for s in samples) / len(samples), 3),
+        "dev_read_await_ms": round(
+            _ratio(sum(s.read_await_ms * s.read_iops for s in samples), reads), 3
+        ),
+        "dev_write_await_ms": round(
+            _ratio(sum(s.write_await_ms * s.write_iops for s in samples), writes), 3
+        ),
+        "dev_read_merge_pct": round(
+            _ratio(sum(s.read_merge_pct * s.read_iops for s in samples), reads), 2
+        ),
+        "dev_write_merge_pct": round(
+            _ratio(sum(s.write_merge_pct * s.write_iops for s in samples), writes), 2
+        ),
+    }
+
+
+def sample_dicts(samples: List[DeviceSample]) -> List[dict]:
+    return [asdict(sample) for sample in samples]
+
+
+# Sample fields stored in the time-series table as (metric, direction)
+SERIES_METRICS = {
+    "util_pct": ("dev_util_pct", ""),
+    "aqu_sz": ("dev_aqu_sz", ""),
+    "read_iops": ("dev_iops", "read"),
+    "write_iops": ("dev_iops", "write"),
+    "read_bw": ("dev_bw", "read"),
+    "write_bw": ("dev_bw", "write"),
+    "read_await_ms": ("dev_await_ms", "read"),
+    "write_await_ms": ("dev_await_ms", "write"),
+    "read_merge_pct": ("dev_merge_pct", "read"),
+    "write_merge_pct": ("dev_merge_pct", "write"),
+    "inflight_read": ("dev_inflight", "read"),
+    "inflight_write": ("dev_inflight", "write"),
+}
+
+
+def series_rows(samples: List[dict]) -> Iterator[Tuple[str, str, int, float]]:
+    """Flatten sample dicts into (metric, direction, t_ms, value) rows"""
+    for sample in samples:
+        for field, (metric, direction) in SERIES_METRICS.items():
+            yield metric, direction, sample["t_ms"], sample[field]
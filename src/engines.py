@@ -0,0 +1,185 @@
+"""FIO I/O engine selection and capability detection"""
+
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from src.result import ResultLike, as_records
+
+# Engines the tool knows how to drive, fastest-first on modern Linux
+SUPPORTED_ENGINES = ("io_uring", "libaio", "posixaio", "psync", "mmap")
+
+# Engine-specific boolean options that may be appended as "+flag"
+ENGINE_FLAGS = {
+    "io_uring": ("fixedbufs", "registerfiles", "hipri", "sqthread_poll"),
+    "libaio": ("hipri",),
+}
+
+# Engines that only ever have one I/O in flight per job
+SYNC_ENGINES = ("psync", "mmap")
+
+# Engine variants run by the engine matrix when none are given
+DEFAULT_MATRIX = (
+    "psync",
+    "posixaio",
+    "libaio",
+    "io_uring",
+    "io_uring+fixedbufs+registerfiles",
+)
+
+
+def parse_engine(spec: str) -> Tuple[str, List[str]]:
+    """Split an engine spec such as "io_uring+fixedbufs+hipri"
+
+    Returns:
+        Tuple of (engine name, flags)
+
+    Raises:
+        ValueError: If the engine or one of its flags is unknown
+    """
+    engine, *flags = spec.split("+")
+    if engine not in SUPPORTED_ENGINES:
+        raise ValueError(
+            f"Unknown I/O engine '{engine}' (supported: {', '.join(SUPPORTED_ENGINES)})"
+        )
+    unknown = [flag for flag in flags if flag not in ENGINE_FLAGS.get(engine, ())]
+    if unknown:
+        raise ValueError(f"Engine {engine} does not support: {', '.join(unknown)}")
+    return engine, flags
+
+
+def engine_fio_args(spec: str) -> List[str]:
+    """Return FIO arguments selecting an engine and its flags"""
+    engine, flags = parse_engine(spec)
+    return [f"--ioengine={engine}"] + [f"--{flag}=1" for flag in flags]
+
+
+def compiled_engines(
+    fio: str = "fio", runner: Callable[..., subprocess.CompletedProcess] = subprocess.run
+) -> List[str]:
+    """Engines the local fio binary was built with (`fio --enghelp`)"""
+    try:
+        result = runner([fio, "--enghelp"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    listed = {line.strip() for line in result.stdout.splitlines()}
+    return [engine for engine in SUPPORTED_ENGINES if engine in listed]
+
+
+def probe_engine(
+    spec: str,
+    directory: str,
+    fio: str = "fio",
+    runner: Callable[..., subprocess.CompletedProcess] = subprocess.run,
+) -> bool:
+    """Check that an engine spec works on this kernel and filesystem
+
+    Runs a tiny direct read job; compiled-in engines can still fail at
+    runtime, e.g. io_uring disabled by sysctl or seccomp, or hipri without
+    polled queues.
+    """
+    with tempfile.TemporaryDirectory(dir=directory, prefix=".engine_probe_") as tmp:
+        cmd = [
+            fio,
+            "--name=probe",
+            f"--filename={Path(tmp) / 'probe.dat'}",
+            "--size=1M",
+            "--rw=read",
+            "--bs=4k",
+            "--io_size=64k",
+            "--output-format=json",
+        ] + engine_fio_args(spec)
+        if parse_engine(spec)[0] not in ("mmap",):
+            cmd.append("--direct=1")
+        try:
+            result = runner(cmd, capture_output=True, text=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+    return result.returncode == 0
+
+
+def detect_engines(
+    directory: str,
+    candidates: Optional[List[str]] = None,
+    fio: str = "fio",
+    runner: Callable[..., subprocess.CompletedProcess] = subprocess.run,
+) -> List[str]:
+    """Return the engine specs from `candidates` that work here
+
+    Specs whose engine is not compiled into fio are dropped without probing.
+    """
+    compiled = set(compiled_engines(fio, runner))
+    usable = []
+    for spec in candidates or list(DEFAULT_MATRIX):
+        if parse_engine(spec)[0] in compiled and probe_engine(spec, directory, fio, runner):
+            usable.append(spec)
+    return usable
+
+
+def engine_matrix_configs(test_configs: List[dict], engines: List[str]) -> List[dict]:
+    """Run every test once per engine, engines varying fastest"""
+    return [dict(tc, ioengine=engine) for tc in test_configs for engine in engines]
+
+
+# Result fields besides test type and block size that identify the same test
+# run under different engines
+MATRIX_KEY_FIELDS = (
+    "io_depth",
+    "num_jobs",
+    "rwmixread",
+    "workload",
+    "target",
+    "host",
+)
+
+
+def engine_speedups(
+    results: Iterable[ResultLike], baseline: Optional[str] = None
+) -> List[dict]:
+    """Speedup of every engine over a baseline engine, per test
+
+    Args:
+        results: Results of an engine matrix run, each carrying `ioengine`
+        baseline: Engine spec to compare against; defaults to the first
+            engine that appears in the results (psync in the default matrix)
+
+    Returns:
+        One row per test and engine with total IOPS, bandwidth, mean latency
+        and `speedup` (IOPS relative to the baseline; None without a
+        successful baseline run)
+    """
+    ok = [r for r in as_records(results) if r.ok and r.extra.get("ioengine")]
+    if not ok:
+        return []
+    baseline = baseline or ok[0].extra["ioengine"]
+
+    groups: dict = {}
+    for result in ok:
+        key = (
+            result.test_type,
+            result.block_size,
+            *(result.extra.get(field) for field in MATRIX_KEY_FIELDS),
+        )
+        groups.setdefault(key, []).append(result)
+
+    rows = []
+    for runs in groups.values():
+        base = next((r for r in runs if r.extra["ioengine"] == baseline), None)
+        base_iops = (base.read_iops + base.write_iops) if base else 0
+        for result in runs:
+            iops = result.read_iops + result.write_iops
+            rows.append(
+                {
+                    "test_type": result.test_type,
+                    "block_size": result.block_size,
+                    "io_depth": result.extra.get("io_depth"),
+                    "target": result.extra.get("target"),
+                    "ioengine": result.extra["ioengine"],
+                    "iops": iops,
+                    "bw": result.read_bw + result.write_bw,
+                    "latency_us": max(result.read_latency_us, result.write_latency_us),
+                    "speedup": round(iops / base_iops, 2) if base_iops else None,
+                }
+            )
+    return rows
@@ -1,12 +1,14 @@
 """FIO command execution module"""
 
 import json
+import signal
 import subprocess
 import platform
+import tempfile
 import time
 import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from rich.console import Console
 from rich.progress import (
@@ -17,40 +19,81 @@ from rich.progress import (
     TaskProgressColumn,
 )
 
-from src.config import BenchmarkConfig, Mode
-
+from src.archive import RawArchive
+from src.calibration import PROBE_FILE_NAME, Calibration, run_probe
+from src.checkpoint import CheckpointJournal, config_key, run_settings
+from src.config import BenchmarkConfig, Mode, parse_filesize_to_bytes
+from src import devstats, hoststats
+from src.devstats import DeviceSampler, resolve_device
+from src.engines import DEFAULT_MATRIX, detect_engines, engine_fio_args, engine_matrix_configs
+from src.fio_logs import log_fio_args
+from src.fio_stream import IntervalSample, iter_interval_samples
+from src.hoststats import HostSampler, host_stats_available, iops_per_cpu_sec
+from src.mountinfo import describe_target, is_block_device
+from src.latency import (
+    LATENCY_KINDS,
+    PERCENTILE_FIO_ARGS,
+    extract_direction,
+    flat_percentiles,
+    merge_latency,
+)
+from src.planner import HISTORY_LIMIT, READ_TEST_TYPES, OverheadModel, PlannedTest, RunPlan
+from src.prepare import FillReport, prepare_file
+from src.profiles import profile_configs
+from src.pyengine import PythonEngine
+from src.result import BenchmarkResult
+from src.sampler import PreadSampler
+from src.sweep import sweep_configs
+from src.steadystate import SteadyStateDetector, fio_steadystate, steadystate_fio_args
+from src.stress import StressLayout, split_filenames
+from src.testfiles import PreparedFilePool
+from src.trace import converted_path, iolog_for, iolog_span, replay_fio_args, trace_span
+
+
+BATCH_JOB_PREFIX = "disk_io_bm_batch_"
+CLIENT_JOB_PREFIX = "disk_io_bm_client_"
+
+# Summary entry FIO adds to client_stats when more than one server ran
+ALL_CLIENTS_JOBNAME = "All clients"
+
+# Read "file" of a stress layout: fio lays out the layout's own files, and
+# there is nothing for _remove_test_file to delete
+STRESS_READ_FILE = Path("<stress layout>")
+
+# Per-worker and per-file breakdown entries keep these fields of their result
+BREAKDOWN_FIELDS = (
+    "read_iops",
+    "write_iops",
+    "read_bw",
+    "write_bw",
+    "read_latency_us",
+    "write_latency_us",
+)
 
-def _parse_filesize_to_bytes(filesize: str) -> int:
-    """Parse filesize string (e.g., '10G', '1M', '512k') to bytes"""
-    filesize = filesize.strip().upper()
-    multipliers = {
-        "K": 1024,
-        "M": 1024**2,
-        "G": 1024**3,
-        "T": 1024**4,
-    }
-    if filesize[-1] in multipliers:
-        return int(float(filesize[:-1]) * multipliers[filesize[-1]])
-    return int(filesize)
+# Per-test process startup and cleanup assumed by calibrated estimates
+TEST_OVERHEAD_SEC = 2
 
 
-def _calculate_timeout(config: BenchmarkConfig) -> int:
+def _calculate_timeout(config: BenchmarkConfig, calibration: Optional[Calibration] = None) -> int:
     """Calculate appropriate timeout based on filesize and runtime.
 
     For read tests, fio must first create the test file before reading.
-    On slow disks, this can take significant time. We estimate based on
-    a conservative 10 MB/s write speed for file creation.
+    On slow disks, this can take significant time. With a calibration the
+    creation time comes from the measured write speed (with a safety
+    margin); otherwise a conservative 10 MB/s write speed is assumed.
     """
     if config.timeout > 0:
         return config.timeout
 
     # Parse filesize to bytes
-    filesize_bytes = _parse_filesize_to_bytes(config.filesize)
-    filesize_gb = filesize_bytes / (1024**3)
+    filesize_bytes = parse_filesize_to_bytes(config.filesize)
 
-    # Estimate file creation time assuming worst-case 10 MB/s write speed
-    # This is conservative to handle very slow disks
-    file_creation_time = int(filesize_bytes / (10 * 1024 * 1024))
+    if calibration is not None:
+        file_creation_time = int(calibration.write_seconds(filesize_bytes, worst_case=True))
+    else:
+        # Estimate file creation time assuming worst-case 10 MB/s write speed
+        # This is conservative to handle very slow disks
+        file_creation_time = int(filesize_bytes / (10 * 1024 * 1024))
 
     # Timeout = runtime + file creation time + 60s buffer
     # Minimum 120 seconds to handle edge cases
@@ -70,37 +113,352 @@ def _format_time_hhmmss(seconds: float) -> str:
         return f"{minutes:02d}:{secs:02d}"
 
 
+def _write_job_file(prefix: str, text: str) -> Path:
+    """Write an FIO job file to the system temp directory and return its path
+
+    The target directory cannot hold it: on device targets it is the device node.
+    """
+    fd, path = tempfile.mkstemp(prefix=prefix, suffix=".fio")
+    with open(fd, "w") as f:
+        f.write(text)
+    return Path(path)
+
+
+def _format_live_sample(sample: IntervalSample) -> str:
+    """Format an interval sample for the live progress column"""
+    latency = max(sample.read_latency_us, sample.write_latency_us)
+    return (
+        f"[green]{sample.total_iops:,.0f} IOPS[/green] "
+        f"[blue]{sample.total_bw / 1024 / 1024:.1f} MB/s[/blue] "
+        f"[yellow]{latency:.0f}µs[/yellow]"
+    )
+
+
 class BenchmarkExecutor:
     """Execute FIO benchmark tests"""
 
-    def __init__(self, config: BenchmarkConfig, console: Optional[Console] = None):
+    def __init__(
+        self,
+        config: BenchmarkConfig,
+        console: Optional[Console] = None,
+        on_interval: Optional[Callable[[dict, IntervalSample], None]] = None,
+        target_dir: Optional[str] = None,
+        dry_run: bool = False,
+    ):
+        """
+        Args:
+            config: Benchmark configuration
+            console: Console for progress and messages
+            on_interval: Called with (test config, sample) for every FIO status
+                interval while a test runs
+            target_dir: Directory test files are created in (default: cwd)
+            dry_run: Only plan: never probe the target or write converted traces
+        """
         self.config = config
+        self.dry_run = dry_run
         self.console = console or Console()
-        from pathlib import Path
-
-        self.temp_dir = Path.cwd()
+        self.on_interval = on_interval
+        self.temp_dir = Path(target_dir) if target_dir else Path.cwd()
+        # A block device target is benchmarked in place instead of through files
+        self.is_block_device = is_block_device(str(self.temp_dir))
+        self.target_info = describe_target(str(self.temp_dir))
         self.is_macos = platform.system() == "Darwin"
+        self.file_pool = PreparedFilePool(self.temp_dir, persistent=config.keep_test_files)
+        self.journal = (
+            CheckpointJournal(config.checkpoint_dir, config.run_id, run_settings(config))
+            if config.run_id
+            else None
+        )
+        self._detected_engines: Optional[List[str]] = None
+        self.calibration: Optional[Calibration] = None
+        self.fill_reports: List[FillReport] = []
+        self.archive = RawArchive(config.archive_dir) if config.archive_raw else None
+        # Stored results of this target and file size the run planner learns from
+        self.history: List[dict] = []
+        self.python_engine = (
+            PythonEngine(direct=config.direct_io) if config.python_engine else None
+        )
+        # sysfs directory of the device behind the target, None where not sampled
+        self.device_sysfs = (
+            resolve_device(str(self.temp_dir)) if config.device_stats_interval > 0 else None
+        )
+        self.host_stats = config.host_stats_interval > 0 and host_stats_available()
+        # Files or devices every test is spread over, None for single-file tests
+        self.stress = StressLayout.from_config(config, self.temp_dir)
 
-    def run_all_tests(self) -> List[dict]:
+    def run_all_tests(self) -> List[BenchmarkResult]:
         """Run all benchmarks based on mode"""
-        results = []
-        test_configs = self._get_test_configs()
-        total_tests = len(test_configs)
-        runtime = self.config.runtime
+        return self.run_tests(self._get_test_configs())
+
+    def run_tests(
+        self, test_configs: List[dict], release_files: bool = True
+    ) -> List[BenchmarkResult]:
+        """Run the given test configurations
+
+        Prepared read files are evicted afterwards unless the pool is
+        configured to persist across runs or `release_files` is False, in
+        which case the caller releases them with _release_test_files() once
+        its last run is done. With a checkpoint journal, tests
+        already recorded for the run are skipped and their journaled results
+        are merged back in suite order.
+        """
+        results: List[BenchmarkResult] = []
 
-        if total_tests == 0:
+        if not test_configs:
             self.console.print("[yellow]No tests to run[/yellow]")
             return results
 
-        # Estimate total runtime (runtime per test * number of tests)
-        # Add ~10% overhead for file creation, cleanup, etc.
-        estimated_total_seconds = total_tests * runtime * 1.1
+        done, pending = self._resume_state(test_configs)
+        try:
+            if pending:
+                self._run_tests(pending, results)
+        finally:
+            if release_files:
+                self._release_test_files()
+        return self._merge_resumed(test_configs, done, pending, results)
+
+    def _resume_state(
+        self, test_configs: List[dict]
+    ) -> Tuple[Dict[str, BenchmarkResult], List[dict]]:
+        """Journaled results of a resumed run and the tests still to run
+
+        Failed tests are retried on resume.
+
+        Raises:
+            ValueError: If the journal was started with other run-level settings
+        """
+        if not self.journal:
+            return {}, test_configs
+        self.journal.check()
+        done = {
+            key: BenchmarkResult.from_dict(r)
+            for key, r in self.journal.load().items()
+            if r.get("status") == "OK"
+        }
+        pending = [tc for tc in test_configs if self._journal_key(tc) not in done]
+        if done:
+            self.console.print(
+                f"[cyan]Resuming run {self.journal.run_id} on {self.temp_dir}: "
+                f"{len(test_configs) - len(pending)} of {len(test_configs)} tests already done[/cyan]"
+            )
+        return done, pending
+
+    def _journal_result(self, test_config: dict, result: BenchmarkResult) -> None:
+        """Record a finished test in the checkpoint journal, if there is one"""
+        if self.journal:
+            self.journal.record(
+                dict(test_config, target=self.target_info["target"]), result.to_dict()
+            )
+
+    def _merge_resumed(
+        self,
+        test_configs: List[dict],
+        done: Dict[str, BenchmarkResult],
+        pending: List[dict],
+        results: List[BenchmarkResult],
+    ) -> List[BenchmarkResult]:
+        """Journaled and fresh results in suite order"""
+        if not done:
+            return results
+        fresh = {self._journal_key(tc): r for tc, r in zip(pending, results)}
+        merged = []
+        for tc in test_configs:
+            result = done.get(self._journal_key(tc)) or fresh.get(self._journal_key(tc))
+            if result:
+                merged.append(result)
+        return merged
+
+    def calibrate(self, storage=None, probe: bool = True) -> Optional[Calibration]:
+        """Measure the target's speed to size timeouts and runtime estimates
+
+        A calibration cached in `storage` (SQLiteStorage) for this target is
+        reused unless config.recalibrate is set; a new one is stored there.
+        Block devices are only read from. With `probe=False` only a cached
+        calibration is used.
+        """
+        target = self.target_info["target"]
+        if storage is not None and not self.config.recalibrate:
+            cached = storage.get_calibration(target, self.config.calibration_max_age_days)
+            if cached:
+                self.calibration = Calibration.from_dict(cached)
+                self.console.print(
+                    f"[dim]Using calibration of {target} from {self.calibration.measured_at}[/dim]"
+                )
+                return self.calibration
+        if not probe:
+            return None
+
+        with self.console.status(f"[bold]Calibrating {target}...[/bold]"):
+            self.calibration = run_probe(
+                self.temp_dir if self.is_block_device else self.temp_dir / PROBE_FILE_NAME,
+                target,
+                write=not self.is_block_device,
+                direct=self.config.direct_io and not self.is_macos,
+                engine=self.python_engine,
+            )
+        if self.calibration is None:
+            self.console.print("[yellow]Calibration failed, using conservative timeouts[/yellow]")
+            return None
+        self.console.print(
+            f"[dim]Calibrated {target}: "
+            f"{self.calibration.seq_write_bps / 1024 / 1024:.0f} MB/s sequential write, "
+            f"{self.calibration.rand_read_iops:,.0f} random read IOPS[/dim]"
+        )
+        if storage is not None:
+            storage.save_calibration(self.calibration.to_dict())
+        return self.calibration
+
+    def load_history(self, storage) -> List[dict]:
+        """Load past results of this target and file size from SQLiteStorage"""
+        self.history = storage.get_test_history(
+            self.target_info["target"], self.config.filesize, HISTORY_LIMIT
+        )
+        return self.history
+
+    def plan(self, test_configs: List[dict]) -> RunPlan:
+        """Commands, expected wall time and bytes written of each test
+
+        Per-test overheads come from self.history (see OverheadModel). Without
+        history they are 10% of the runtime, or TEST_OVERHEAD_SEC with a
+        calibration. The shared read file is prepared once, at the speed past
+        preparations reached, else at the calibrated write speed. A test is
+        never expected to outlast its timeout.
+        """
+        runtime = self.config.runtime
+        file_bytes = parse_filesize_to_bytes(self.config.filesize)
+        default = TEST_OVERHEAD_SEC if self.calibration is not None else runtime * 0.1
+        model = OverheadModel(self.history, default, file_bytes)
+        timeout = _calculate_timeout(self.config, self.calibration)
+        read_file_ready = (
+            self.is_block_device
+            or self.file_pool.get(self.config.filesize, self.config.fill_pattern) is not None
+        )
+
+        plan = RunPlan(target=self.target_info["target"])
+        for test_config in test_configs:
+            test_type = test_config["test_type"]
+            planned = PlannedTest(description=self._describe(test_config), command=None)
+            plan.tests.append(planned)
+            skip_reason = self._skip_reason(test_config)
+            if skip_reason:
+                planned.skip_reason = skip_reason
+                planned.write_bytes = 0
+                continue
+
+            test_file = self._test_file_for(test_config)
+            if test_type in READ_TEST_TYPES and self.stress is not None:
+                # fio lays out the generated files before the first read test
+                if not read_file_ready:
+                    num_jobs = self._dimensions(test_config)["num_jobs"]
+                    planned.prepare_bytes = self.stress.layout_bytes(file_bytes, num_jobs)
+                    read_file_ready = True
+            elif test_type in READ_TEST_TYPES and not self.is_block_device:
+                test_file = self.file_pool.path_for(self.config.filesize, self.config.fill_pattern)
+                if not read_file_ready:
+                    planned.prepare_bytes = file_bytes
+                    read_file_ready = True
+            elif test_type == "replay" and not self.is_block_device:
+                try:
+                    span = trace_span(test_config["trace"], self.config.trace_time_unit)
+                except (OSError, ValueError):
+                    span = 0
+                planned.prepare_bytes = max(file_bytes, span)
+            if planned.prepare_bytes:
+                prepare_bps = model.prepare_bps()
+                if prepare_bps:
+                    planned.prepare_sec = planned.prepare_bytes / prepare_bps
+                elif self.calibration is not None:
+                    planned.prepare_sec = self.calibration.write_seconds(planned.prepare_bytes)
+                planned.prepare_sec = min(planned.prepare_sec, timeout)
+
+            overhead, planned.basis = model.overhead(test_type, test_config["block_size"])
+            if planned.basis == "default" and self.calibration is not None:
+                planned.basis = "calibration"
+            planned.run_sec = min(runtime, timeout)
+            planned.overhead_sec = min(overhead, timeout - planned.run_sec)
+            planned.write_bytes = model.write_bytes(
+                test_type, test_config["block_size"], planned.run_sec
+            )
+            if self.python_engine is None:
+                planned.command = self._build_fio_command(test_config, test_file)
+                if self.config.status_interval > 0:
+                    planned.command.append(f"--status-interval={self.config.status_interval}")
+        return plan
+
+    def _estimate_total_seconds(self, test_configs: List[dict]) -> float:
+        """Expected wall time of a suite, from the run plan"""
+        return self.plan(test_configs).total_sec
+
+    def _journal_key(self, test_config: dict) -> str:
+        """Checkpoint identity of a test on this executor's target"""
+        return config_key(dict(test_config, target=self.target_info["target"]))
+
+    def _tag_target(self, result: BenchmarkResult) -> BenchmarkResult:
+        """Add the target, its mount, filesystem type and device to a result"""
+        result.extra.update(self.target_info)
+        return result
+
+    def _skip_reason(self, test_config: dict) -> Optional[str]:
+        """Reason a test must not run on this target, if any"""
+        if self.python_engine is not None and (
+            test_config["test_type"] in ("trim", "replay")
+            or test_config.get("fio_params")
+            or self.stress is not None
+        ):
+            return "SKIPPED: not supported by the Python engine"
+        if (
+            (self.is_block_device or (self.stress is not None and self.stress.has_block_device))
+            and test_config["test_type"] not in ("read", "randread")
+            and not self.config.allow_device_writes
+        ):
+            return "SKIPPED: writes to a block device need allow_device_writes"
+        return None
+
+    def _test_file_for(self, test_config: dict) -> Path:
+        """Path FIO does I/O on for a write or mixed test"""
+        if self.is_block_device:
+            return self.temp_dir
+        return self.temp_dir / f"test_{test_config['test_type']}_{test_config['block_size']}"
+
+    def _output_file(self, test_file: Path) -> str:
+        """What a result reports as the file it did I/O on"""
+        if self.stress is not None:
+            return ":".join(self.stress.paths)
+        return str(test_file)
+
+    def _release_test_files(self) -> None:
+        """Evict the prepared read files and remove generated stress files after a run"""
+        self.file_pool.release()
+        if self.stress is not None and not self.config.keep_test_files:
+            self.stress.cleanup()
+
+    def _remove_test_file(self, test_file: Optional[Path]) -> None:
+        """Delete a per-test file; pooled read files, stress layouts and devices are kept"""
+        if (
+            test_file is not None
+            and test_file is not STRESS_READ_FILE
+            and not self.is_block_device
+            and test_file.exists()
+            and not self.file_pool.contains(test_file)
+        ):
+            test_file.unlink()
+
+    def _run_tests(self, test_configs: List[dict], results: List[BenchmarkResult]) -> None:
+        """Run tests with progress display, appending results as they finish"""
+        total_tests = len(test_configs)
+        runtime = self.config.runtime
+
+        estimated_total_seconds = self._estimate_total_seconds(test_configs)
         estimated_total_str = _format_time_hhmmss(estimated_total_seconds)
 
         self.console.print(f"\n[bold]Starting {total_tests} benchmark tests[/bold]")
+        basis = (
+            f"from {len(self.history)} past results"
+            if self.history
+            else f"{total_tests} tests × {runtime}s each"
+        )
         self.console.print(
-            f"[dim]Estimated total runtime: ~{estimated_total_str} "
-            f"({total_tests} tests × {runtime}s each)[/dim]\n"
+            f"[dim]Estimated total runtime: ~{estimated_total_str} ({basis})[/dim]\n"
         )
 
         overall_start_time = time.time()
@@ -111,6 +469,7 @@ class BenchmarkExecutor:
             BarColumn(complete_style="magenta", finished_style="green"),
             TaskProgressColumn(),
             TextColumn("{task.fields[time_display]}"),
+            TextColumn("{task.fields[live]}"),
             console=self.console,
             refresh_per_second=2,
         ) as progress:
@@ -119,28 +478,41 @@ class BenchmarkExecutor:
                 "[bold magenta]Overall progress[/bold magenta]",
                 total=estimated_total_seconds,
                 time_display=f"[magenta]00:00[/magenta] / [magenta]~{estimated_total_str}[/magenta]",
+                live="",
             )
 
             for idx, test_config in enumerate(test_configs):
                 # Individual test progress (cyan colored)
-                description = f"  [{idx + 1}/{total_tests}] {test_config['test_type']} ({test_config['block_size']})"
+                description = f"  [{idx + 1}/{total_tests}] {self._describe(test_config)}"
                 task = progress.add_task(
                     description,
                     total=runtime,
                     time_display=f"[cyan]00:00[/cyan] / [cyan]~{_format_time_hhmmss(runtime)}[/cyan]",
+                    live="",
                 )
 
-                result, wall_time = self._run_single_test_with_progress(
-                    test_config,
-                    progress,
-                    task,
-                    runtime,
-                    overall_task,
-                    overall_start_time,
-                    estimated_total_seconds,
-                )
+                skip_reason = self._skip_reason(test_config)
+                if skip_reason:
+                    self.console.print(f"[yellow]{skip_reason}: {self.temp_dir}[/yellow]")
+                    result, wall_time = self._empty_result(test_config, skip_reason), 0.0
+                else:
+                    fills = len(self.fill_reports)
+                    result, wall_time = self._run_single_test_with_progress(
+                        test_config,
+                        progress,
+                        task,
+                        runtime,
+                        overall_task,
+                        overall_start_time,
+                        estimated_total_seconds,
+                    )
+                    # Kept apart so the planner can tell preparation from overhead
+                    prepare_sec = sum(r.seconds for r in self.fill_reports[fills:])
+                    if result and prepare_sec:
+                        result.extra["prepare_sec"] = round(prepare_sec, 2)
                 if result:
-                    results.append(result)
+                    results.append(self._tag_target(result))
+                    self._journal_result(test_config, result)
 
                 # Update individual test to show actual wall time when complete
                 actual_time_str = _format_time_hhmmss(wall_time)
@@ -161,6 +533,274 @@ class BenchmarkExecutor:
                 time_display=f"[green]{total_elapsed_str}[/green] / [green]{total_elapsed_str}[/green]",
             )
 
+    def run_batch(self, sections: Optional[List[str]] = None) -> List[BenchmarkResult]:
+        """Run the whole suite in a single FIO process
+
+        The suite is rendered into one job file with a stonewall-separated
+        section per test, so FIO pays process startup once and tests still run
+        one after another. The job file lives in the system temp directory,
+        since the target may be a device node, and is removed afterwards.
+
+        Args:
+            sections: Section names to run (FIO --section); all sections if empty
+
+        Returns:
+            One result per section that was run, in suite order
+        """
+        test_configs = self._get_test_configs()
+        if not test_configs:
+            self.console.print("[yellow]No tests to run[/yellow]")
+            return []
+
+        try:
+            results = self._run_batch(test_configs, sections or [])
+        finally:
+            self._release_test_files()
+        # Skipped and failed sections are collected first; restore the suite order
+        order = {self._section_name(idx, tc): idx for idx, tc in enumerate(test_configs)}
+        return sorted(results, key=lambda r: order[r.extra["section"]])
+
+    def _run_batch(
+        self, test_configs: List[dict], sections: List[str]
+    ) -> List[BenchmarkResult]:
+        """Render, run and split a batch job file"""
+        names = [self._section_name(idx, tc) for idx, tc in enumerate(test_configs)]
+        unknown = [name for name in sections if name not in names]
+        if unknown:
+            self.console.print(f"[yellow]Unknown batch sections: {', '.join(unknown)}[/yellow]")
+        if self.config.log_interval_ms > 0:
+            run_tag = time.strftime("%Y%m%d-%H%M%S")
+            test_configs = [
+                self._with_log_prefix(tc, f"{run_tag}_{name}")
+                for name, tc in zip(names, test_configs)
+            ]
+        selected = [
+            (name, tc) for name, tc in zip(names, test_configs) if not sections or name in sections
+        ]
+        if not selected:
+            return []
+
+        timeout = _calculate_timeout(self.config, self.calibration)
+        wall_start = time.time()
+        failed: List[BenchmarkResult] = []
+        for name, tc in selected:
+            skip_reason = self._skip_reason(tc)
+            if skip_reason:
+                result = self._empty_result(tc, skip_reason)
+                result.extra["section"] = name
+                failed.append(self._tag_target(result))
+        selected = [(name, tc) for name, tc in selected if not self._skip_reason(tc)]
+        if not selected:
+            return failed
+        if any(tc["test_type"] in ("read", "randread") for _, tc in selected):
+            if self._acquire_read_file(timeout) is None:
+                for name, tc in selected:
+                    if tc["test_type"] in ("read", "randread"):
+                        result = self._empty_result(tc, "FAILED: Could not create test file")
+                        result.extra["section"] = name
+                        failed.append(self._tag_target(result))
+                selected = [
+                    (name, tc)
+                    for name, tc in selected
+                    if tc["test_type"] not in ("read", "randread")
+                ]
+                if not selected:
+                    return failed
+
+        # Only runnable sections are rendered: fio would otherwise run skipped
+        # device writes and lay out a read file that could not be prepared
+        read_file = (
+            self.temp_dir
+            if self.is_block_device
+            else self.file_pool.path_for(self.config.filesize, self.config.fill_pattern)
+        )
+        test_files = [
+            read_file if tc["test_type"] in ("read", "randread") else self._test_file_for(tc)
+            for _, tc in selected
+        ]
+        job_file = _write_job_file(
+            BATCH_JOB_PREFIX,
+            self._render_job_file(
+                [tc for _, tc in selected], test_files, [name for name, _ in selected]
+            ),
+        )
+
+        cmd = ["fio", "--output-format=json+", str(job_file)]
+        self.console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
+
+        try:
+            with self.console.status(
+                f"[bold]Running {len(selected)} tests in one FIO batch[/bold]"
+            ):
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout * len(selected),
+                )
+        except subprocess.TimeoutExpired:
+            self.console.print("[red]Batch run timed out[/red]")
+            results = [self._empty_result(tc, "TIMED OUT") for _, tc in selected]
+        else:
+            results = self._split_batch_output(result.stdout, selected)
+            for parsed, (name, tc) in zip(results, selected):
+                self._archive_raw(parsed, tc, result.stdout, section=name)
+            if result.returncode != 0:
+                stderr_msg = result.stderr.strip() if result.stderr else "unknown error"
+                for parsed in results:
+                    if not parsed.ok:
+                        parsed.status_text = f"FAILED: {stderr_msg}"
+        finally:
+            job_file.unlink(missing_ok=True)
+            for test_file in test_files:
+                self._remove_test_file(test_file)
+
+        # Share the process overhead (startup, layout) evenly between sections
+        wall_time = time.time() - wall_start
+        overhead = max(0.0, wall_time - sum(r.io_time_sec for r in results)) / len(results)
+        for parsed, (name, _) in zip(results, selected):
+            self._tag_target(parsed)
+            parsed.extra["section"] = name
+            parsed.wall_time_sec = round(parsed.io_time_sec + overhead, 2)
+
+        return failed + results
+
+    def run_distributed(self) -> List[BenchmarkResult]:
+        """Run the suite on all FIO servers in config.clients at the same time
+
+        Each test is sent as a job file to every `fio --server` endpoint in a
+        single `fio --client` invocation, so all hosts load the storage
+        concurrently. Test files are created on the servers under this
+        executor's target directory and removed there when the job ends.
+
+        The aggregate is journaled with its per-host results, so a resumed
+        run restores every row of a completed test.
+
+        Returns:
+            Per test, the aggregate result (host "all") followed by one
+            result per host
+        """
+        test_configs = self._get_test_configs()
+        if not test_configs:
+            self.console.print("[yellow]No tests to run[/yellow]")
+            return []
+
+        done, pending = self._resume_state(test_configs)
+        aggregates: List[BenchmarkResult] = []
+        for idx, test_config in enumerate(pending):
+            skip_reason = self._skip_reason(test_config)
+            if skip_reason:
+                self.console.print(f"[yellow]{skip_reason}: {self.temp_dir}[/yellow]")
+                aggregate = self._empty_result(test_config, skip_reason)
+            else:
+                label = f"[{idx + 1}/{len(pending)}] {self._describe(test_config)}"
+                with self.console.status(
+                    f"[bold]{label} on {len(self.config.clients)} FIO servers[/bold]"
+                ):
+                    aggregate = self._run_client_test(test_config)
+            aggregates.append(self._tag_target(aggregate))
+            self._journal_result(test_config, aggregate)
+
+        results: List[BenchmarkResult] = []
+        for aggregate in self._merge_resumed(test_configs, done, pending, aggregates):
+            hosts = aggregate.extra.pop("hosts", [])
+            for result in [aggregate] + hosts:
+                result.status, result.detail = aggregate.status, aggregate.detail
+                result.wall_time_sec = aggregate.wall_time_sec
+                results.append(self._tag_target(result))
+        return results
+
+    def _run_client_test(self, test_config: dict) -> BenchmarkResult:
+        """Run one test on all FIO servers and return the aggregate result"""
+        timeout = _calculate_timeout(self.config, self.calibration)
+        # Servers have no prepared file pool; FIO lays files out itself and
+        # unlink removes them on the server once the job finishes
+        job_file = _write_job_file(
+            CLIENT_JOB_PREFIX,
+            self._render_job_file([test_config], [self._test_file_for(test_config)]) + "unlink=1\n",
+        )
+        cmd = ["fio", "--output-format=json+"]
+        for client in self.config.clients:
+            cmd.extend([f"--client={client}", str(job_file)])
+
+        wall_start = time.time()
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.console.print(f"[red]Test timed out: {self._describe(test_config)}[/red]")
+            return self._empty_result(
+                test_config, "TIMED OUT", round(time.time() - wall_start, 2)
+            )
+        finally:
+            job_file.unlink(missing_ok=True)
+
+        result = self._parse_fio_json_output(proc.stdout, test_config, allow_empty=True)
+        self._archive_raw(result, test_config, proc.stdout, host=result.extra.get("host"))
+        for host_result in result.extra.get("hosts", []):
+            self._archive_raw(host_result, test_config, proc.stdout, host=host_result.extra["host"])
+        if proc.returncode == 0 or result.io_time_sec > 0:
+            result.status_text = "OK"
+        else:
+            stderr_msg = proc.stderr.strip() if proc.stderr else "unknown error"
+            self.console.print(f"[red]FIO client run failed: {stderr_msg}[/red]")
+            result.status_text = f"FAILED: {stderr_msg}"
+        result.wall_time_sec = round(time.time() - wall_start, 2)
+        return result
+
+    def _with_log_prefix(self, test_config: dict, name: str) -> dict:
+        """Return a copy of a test config that writes FIO interval logs"""
+        log_dir = Path(self.config.log_dir)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        return dict(test_config, log_prefix=str(log_dir / name))
+
+    def _section_name(self, idx: int, test_config: dict) -> str:
+        """Return the job file section name for a test"""
+        return f"t{idx + 1:02d}_{test_config['test_type']}_{test_config['block_size']}"
+
+    def _render_job_file(
+        self,
+        test_configs: List[dict],
+        test_files: List[Path],
+        names: Optional[List[str]] = None,
+    ) -> str:
+        """Render test configurations as a FIO job file
+
+        Each test becomes its own section with the same options the command
+        line runner would pass, and `stonewall` so sections run sequentially.
+        Sections are named by suite position unless `names` are given.
+        """
+        if names is None:
+            names = [self._section_name(idx, tc) for idx, tc in enumerate(test_configs)]
+        lines = ["; Generated by disk-io-bm batch mode", ""]
+        for name, test_config, test_file in zip(names, test_configs, test_files):
+            lines.append(f"[{name}]")
+            lines.append("stonewall")
+            for arg in self._build_fio_command(test_config, test_file)[1:]:
+                if arg.startswith(("--name=", "--output-format=")):
+                    continue
+                lines.append(arg[2:])
+            lines.append("")
+        return "\n".join(lines)
+
+    def _split_batch_output(self, output: str, sections: List[tuple]) -> List[BenchmarkResult]:
+        """Split combined batch JSON into per-section results
+
+        Args:
+            output: FIO stdout of the batch run
+            sections: (section name, test config) pairs that were run
+        """
+        data = self._load_fio_json(output) or {}
+        jobs_by_section: dict = {}
+        for job in data.get("jobs", []):
+            jobs_by_section.setdefault(job.get("jobname"), []).append(job)
+
+        results = []
+        for name, test_config in sections:
+            jobs = jobs_by_section.get(name)
+            if not jobs:
+                results.append(self._empty_result(test_config, "No jobs in output"))
+                continue
+            results.append(self._parse_jobs(jobs, test_config))
         return results
 
     def _run_single_test_with_progress(
@@ -172,15 +812,20 @@ class BenchmarkExecutor:
         overall_task=None,
         overall_start_time: float = 0,
         estimated_total: float = 0,
-    ) -> tuple[Optional[dict], float]:
+    ) -> tuple[Optional[BenchmarkResult], float]:
         """Run a single FIO test with progress updates.
 
         Returns:
-            Tuple of (result dict or None, wall_time in seconds)
+            Tuple of (result or None, wall_time in seconds)
         """
-        test_file = self.temp_dir / f"test_{test_config['test_type']}_{test_config['block_size']}"
+        test_file = self._test_file_for(test_config)
         wall_start = time.time()
         stop_progress = threading.Event()
+        if self.config.log_interval_ms > 0:
+            log_name = f"{test_config['test_type']}_{test_config['block_size']}"
+            test_config = self._with_log_prefix(
+                test_config, f"{time.strftime('%Y%m%d-%H%M%S')}_{log_name}"
+            )
 
         # Check if this is a read-only test that needs file pre-creation
         test_type = test_config["test_type"]
@@ -211,173 +856,339 @@ class BenchmarkExecutor:
         progress_thread.start()
 
         # Calculate timeout based on filesize and runtime
-        timeout = _calculate_timeout(self.config)
+        timeout = _calculate_timeout(self.config, self.calibration)
+        samplers: Dict[str, PreadSampler] = {}
 
         try:
-            # Pre-create test file for read tests to avoid timeout during file creation
-            if is_read_test and not test_file.exists():
-                self.console.print(
-                    f"[dim]Pre-creating test file ({self.config.filesize}) for read test...[/dim]"
+            # Read tests share one prepared file from the pool to avoid rewriting
+            # the whole file before every test
+            prepared = True
+            if is_read_test:
+                test_file = self._acquire_read_file(timeout)
+                prepared = test_file is not None
+            elif test_type == "replay":
+                # Traces address arbitrary offsets, so the file is fully written first
+                prepared = self._prepare_replay_file(test_config, test_file, timeout)
+            if not prepared:
+                wall_time_sec = round(time.time() - wall_start, 2)
+                return (
+                    self._empty_result(
+                        test_config, "FAILED: Could not create test file", wall_time_sec
+                    ),
+                    wall_time_sec,
                 )
-                precreate_result = self._precreate_test_file(test_file, timeout)
-                if not precreate_result:
-                    wall_time_sec = round(time.time() - wall_start, 2)
-                    return {
-                        "test_type": test_config["test_type"],
-                        "block_size": test_config["block_size"],
-                        "status": "FAILED: Could not create test file",
-                        "read_iops": 0,
-                        "write_iops": 0,
-                        "read_bw": 0,
-                        "write_bw": 0,
-                        "read_latency_us": 0,
-                        "write_latency_us": 0,
-                        "cpu": "N/A",
-                        "io_time_sec": 0,
-                        "wall_time_sec": wall_time_sec,
-                    }, wall_time_sec
 
+            detector = (
+                SteadyStateDetector.from_config(self.config) if self.config.steady_state else None
+            )
+
+            def on_sample(sample: IntervalSample) -> bool:
+                progress.update(task, live=_format_live_sample(sample))
+                if self.on_interval is not None:
+                    self.on_interval(test_config, sample)
+                return detector is not None and detector.add(sample)
+
+            # Started after file preparation so fills do not count as test I/O
+            samplers = self._start_samplers()
+
+            if self.python_engine is not None:
+                parsed = self._run_python_test(test_config, test_file, on_sample)
+                self._record_telemetry(parsed, samplers)
+                self._record_convergence(parsed, detector)
+                parsed.extra["output_file"] = self._output_file(test_file)
+                parsed.wall_time_sec = round(time.time() - wall_start, 2)
+                return parsed, parsed.wall_time_sec
+
+            if self.stress is not None:
+                self.stress.prepare()
             cmd = self._build_fio_command(test_config, test_file)
+            if self.config.status_interval > 0:
+                cmd.append(f"--status-interval={self.config.status_interval}")
             self.console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            result = self._run_fio_streaming(cmd, timeout, on_sample)
 
             wall_time_sec = round(time.time() - wall_start, 2)
 
             if result.returncode == 0:
                 parsed = self._parse_fio_json_output(result.stdout, test_config, allow_empty=True)
-                parsed["status"] = "OK"
-                parsed["output_file"] = str(test_file)
-                parsed["wall_time_sec"] = wall_time_sec
+                self._archive_raw(parsed, test_config, result.stdout)
+                self._record_telemetry(parsed, samplers)
+                self._record_convergence(parsed, detector)
+                parsed.status_text = "OK"
+                parsed.extra["output_file"] = self._output_file(test_file)
+                parsed.wall_time_sec = wall_time_sec
                 return parsed, wall_time_sec
             else:
                 json_data = self._parse_fio_json_output(
                     result.stdout, test_config, allow_empty=True
                 )
                 is_valid_benchmark = (
-                    json_data.get("read_iops", 0) > 0
-                    or json_data.get("write_iops", 0) > 0
-                    or json_data.get("read_bw", 0) > 0
-                    or json_data.get("write_bw", 0) > 0
-                    or json_data.get("io_time_sec", 0) > 0
+                    json_data.read_iops > 0
+                    or json_data.write_iops > 0
+                    or json_data.read_bw > 0
+                    or json_data.write_bw > 0
+                    or json_data.io_time_sec > 0
                 )
 
                 if is_valid_benchmark:
-                    json_data["status"] = "OK"
-                    json_data["wall_time_sec"] = wall_time_sec
+                    self._archive_raw(json_data, test_config, result.stdout)
+                    self._record_telemetry(json_data, samplers)
+                    self._record_convergence(json_data, detector)
+                    json_data.status_text = "OK"
+                    json_data.wall_time_sec = wall_time_sec
                     return json_data, wall_time_sec
                 else:
                     stderr_msg = result.stderr.strip() if result.stderr else "unknown error"
                     self.console.print(f"[red]FIO test failed: {stderr_msg}[/red]")
-                    return {
-                        "test_type": test_config["test_type"],
-                        "block_size": test_config["block_size"],
-                        "status": f"FAILED: {stderr_msg}",
-                        "read_iops": 0,
-                        "write_iops": 0,
-                        "read_bw": 0,
-                        "write_bw": 0,
-                        "read_latency_us": 0,
-                        "write_latency_us": 0,
-                        "cpu": "N/A",
-                        "io_time_sec": 0,
-                        "wall_time_sec": wall_time_sec,
-                    }, wall_time_sec
+                    return (
+                        self._empty_result(test_config, f"FAILED: {stderr_msg}", wall_time_sec),
+                        wall_time_sec,
+                    )
 
         except subprocess.TimeoutExpired:
             wall_time_sec = round(time.time() - wall_start, 2)
             self.console.print(f"[red]Test timed out: {test_config['test_type']}[/red]")
-            return {
-                "test_type": test_config["test_type"],
-                "block_size": test_config["block_size"],
-                "status": "TIMED OUT",
-                "read_iops": 0,
-                "write_iops": 0,
-                "read_bw": 0,
-                "write_bw": 0,
-                "read_latency_us": 0,
-                "write_latency_us": 0,
-                "cpu": "N/A",
-                "io_time_sec": 0,
-                "wall_time_sec": wall_time_sec,
-            }, wall_time_sec
+            return self._empty_result(test_config, "TIMED OUT", wall_time_sec), wall_time_sec
         except Exception as e:
             wall_time_sec = round(time.time() - wall_start, 2)
             self.console.print(f"[red]Error running test: {e}[/red]")
-            return {
-                "test_type": test_config["test_type"],
-                "block_size": test_config["block_size"],
-                "status": f"ERROR: {str(e)}",
-                "read_iops": 0,
-                "write_iops": 0,
-                "read_bw": 0,
-                "write_bw": 0,
-                "read_latency_us": 0,
-                "write_latency_us": 0,
-                "cpu": "N/A",
-                "io_time_sec": 0,
-                "wall_time_sec": wall_time_sec,
-            }, wall_time_sec
+            return self._empty_result(test_config, f"ERROR: {str(e)}", wall_time_sec), wall_time_sec
         finally:
             # Stop progress thread
             stop_progress.set()
             progress_thread.join(timeout=1)
+            for sampler in samplers.values():
+                sampler.stop()
 
-            if test_file.exists():
-                test_file.unlink()
+            self._remove_test_file(test_file)
 
-    def _precreate_test_file(self, test_file: Path, timeout: int) -> bool:
-        """Pre-create a test file for read tests using fio.
+    def _run_python_test(
+        self,
+        test_config: dict,
+        test_file: Path,
+        on_sample: Callable[[IntervalSample], Optional[bool]],
+    ) -> BenchmarkResult:
+        """Run a test with the built-in Python engine and parse it like FIO output"""
+        dimensions = self._dimensions(test_config)
+        job = self.python_engine.run(
+            test_file,
+            test_config["test_type"],
+            block_size=parse_filesize_to_bytes(test_config["block_size"]),
+            size=parse_filesize_to_bytes(self.config.filesize),
+            runtime=self.config.runtime,
+            io_depth=dimensions["io_depth"],
+            num_jobs=dimensions["num_jobs"],
+            rwmixread=dimensions["rwmixread"],
+            fsync=self.config.sync,
+            rate_iops=test_config.get("rate_iops") or 0,
+            status_interval=self.config.status_interval,
+            on_sample=on_sample,
+        )
+        parsed = self._parse_job(job, test_config)
+        self._archive_raw(parsed, test_config, json.dumps({"jobs": [job]}))
+        return parsed
 
-        This ensures the file exists before running read benchmarks,
-        preventing timeouts on slow disks where file creation takes
-        significant time.
+    def _archive_raw(
+        self,
+        parsed: BenchmarkResult,
+        test_config: dict,
+        output: str,
+        section: Optional[str] = None,
+        host: Optional[str] = None,
+    ) -> None:
+        """Keep the raw FIO output behind a result so it can be parsed again later"""
+        if self.archive is None or not output:
+            return
+        try:
+            # Resolved dimensions make the archive parse the same on any machine
+            archived_config = dict(test_config, **self._dimensions(test_config))
+            parsed.extra["raw_output"] = self.archive.archive_test(
+                output, archived_config, section, host, self.config.per_job_breakdown
+            )
+        except OSError as e:
+            self.console.print(f"[yellow]Could not archive FIO output: {e}[/yellow]")
+
+    def _start_samplers(self) -> Dict[str, PreadSampler]:
+        """Start the device and host telemetry samplers of one test"""
+        samplers: Dict[str, PreadSampler] = {}
+        if self.device_sysfs is not None:
+            samplers["device"] = DeviceSampler(
+                self.device_sysfs, self.config.device_stats_interval
+            )
+        if self.host_stats:
+            samplers["host"] = HostSampler(self.config.host_stats_interval)
+        for sampler in samplers.values():
+            sampler.start()
+        return samplers
+
+    def _record_telemetry(
+        self, parsed: BenchmarkResult, samplers: Dict[str, PreadSampler]
+    ) -> None:
+        """Add the device and host telemetry of a finished test to its result"""
+        extra = parsed.extra
+        device = samplers.get("device")
+        if device is not None and device.stop():
+            extra.update(device.summary())
+            extra["device_stats"] = devstats.sample_dicts(device.samples)
+            extra["device_queue"] = device.queue
+        host = samplers.get("host")
+        if host is not None and host.stop():
+            extra.update(host.summary())
+            per_cpu_sec = iops_per_cpu_sec(parsed.read_iops + parsed.write_iops, host.samples)
+            if per_cpu_sec is not None:
+                extra["iops_per_cpu_sec"] = per_cpu_sec
+            if self.config.host_stats_series:
+                extra["host_stats"] = hoststats.sample_dicts(host.samples)
+
+    def _record_convergence(
+        self, parsed: BenchmarkResult, detector: Optional[SteadyStateDetector]
+    ) -> None:
+        """Record a Python-side steady-state stop if FIO did not report one"""
+        extra = parsed.extra
+        if detector is None or detector.converged_at is None or extra.get("ss_attained"):
+            return
+        extra["ss_attained"] = True
+        extra["ss_converged_sec"] = round(detector.converged_at, 2)
+        extra["ss_source"] = "detector"
+
+    def _run_fio_streaming(
+        self,
+        cmd: List[str],
+        timeout: int,
+        on_sample: Optional[Callable[[IntervalSample], Optional[bool]]] = None,
+    ) -> subprocess.CompletedProcess:
+        """Run FIO, parsing status-interval reports as they arrive
+
+        If `on_sample` returns True, FIO is interrupted with SIGINT, which
+        makes it stop all jobs and still print its final report.
 
         Returns:
-            True if file was created successfully, False otherwise
+            Completed process whose stdout holds only FIO's final JSON report
+
+        Raises:
+            subprocess.TimeoutExpired: If FIO does not finish within timeout
         """
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1
+        )
+        # Drain stderr separately so a chatty FIO cannot block on a full pipe
+        stderr_chunks: List[str] = []
+        stderr_thread = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True
+        )
+        stderr_thread.start()
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.daemon = True
+        timer.start()
+
+        final = None
         try:
-            # Use fio to create the file with a quick write pass
-            cmd = [
-                "fio",
-                "--name=precreate",
-                f"--filename={test_file}",
-                f"--size={self.config.filesize}",
-                "--rw=write",
-                "--bs=1M",  # Large block size for faster creation
-                "--output-format=json",
-                "--iodepth=1",
-                "--numjobs=1",
-            ]
+            stop_requested = False
+            for sample, data in iter_interval_samples(process.stdout):
+                final = data
+                if sample is not None and on_sample is not None:
+                    if on_sample(sample) and not stop_requested:
+                        stop_requested = True
+                        process.send_signal(signal.SIGINT)
+            process.wait()
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            stderr_thread.join(timeout=1)
 
-            if not self.is_macos:
-                cmd.append("--direct=1")
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+        stdout = json.dumps(final) if final is not None else ""
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, "".join(stderr_chunks))
 
-            if result.returncode == 0 or test_file.exists():
-                return True
-            else:
-                self.console.print(f"[red]Failed to pre-create test file: {result.stderr}[/red]")
-                return False
+    def _acquire_read_file(self, timeout: int) -> Optional[Path]:
+        """Return the pooled read test file, pre-creating it on first use
+
+        Stress layouts need no pooled file: fio lays out their files itself,
+        and STRESS_READ_FILE stands in for one.
+        """
+        if self.stress is not None:
+            return STRESS_READ_FILE
+        if self.is_block_device:
+            return self.temp_dir
+        filesize = self.config.filesize
+        pattern = self.config.fill_pattern
+        existing = self.file_pool.get(filesize, pattern)
+        if existing is not None:
+            self.console.print(f"[dim]Reusing prepared test file {existing}[/dim]")
+            return existing
+
+        self.console.print(f"[dim]Pre-creating test file ({filesize}) for read tests...[/dim]")
+        return self.file_pool.acquire(
+            filesize,
+            pattern,
+            lambda path, fill: self._precreate_test_file(path, timeout, fill),
+        )
+
+    def _prepare_replay_file(self, test_config: dict, test_file: Path, timeout: int) -> bool:
+        """Create the file a trace is replayed onto, large enough for every offset"""
+        if self.is_block_device:
+            return True
+        span = iolog_span(self._iolog(test_config))
+        size = max(parse_filesize_to_bytes(self.config.filesize), span)
+        self.console.print(f"[dim]Pre-creating replay file ({size} bytes)...[/dim]")
+        return self._precreate_test_file(test_file, timeout, self.config.fill_pattern, size)
+
+    def _iolog(self, test_config: dict) -> str:
+        """fio iolog for a replay test, converting CSV traces on first use
+
+        A dry run only names the conversion it would use.
+        """
+        cache_dir = str(Path(self.config.results_dir) / "traces")
+        if self.dry_run:
+            return converted_path(test_config["trace"], cache_dir)
+        return iolog_for(test_config["trace"], cache_dir, self.config.trace_time_unit)
+
+    def _precreate_test_file(
+        self, test_file: Path, timeout: int, pattern: str = "random", size: Optional[int] = None
+    ) -> bool:
+        """Pre-create a test file for read tests.
+
+        This ensures the file is completely written before running read
+        benchmarks, preventing timeouts on slow disks where file creation
+        takes significant time. The fill strategy comes from
+        config.prepare_strategy and its throughput is reported on its own.
 
+        Returns:
+            True if file was created successfully, False otherwise
+        """
+        try:
+            report = prepare_file(
+                test_file,
+                size or parse_filesize_to_bytes(self.config.filesize),
+                pattern,
+                self.config.prepare_strategy,
+                direct=not self.is_macos,
+                timeout=timeout,
+                engine=self.python_engine,
+            )
         except subprocess.TimeoutExpired:
             self.console.print(f"[red]Timeout while pre-creating test file[/red]")
             return False
         except Exception as e:
-            self.console.print(f"[red]Error pre-creating test file: {e}[/red]")
+            self.console.print(f"[red]Failed to pre-create test file: {e}[/red]")
             return False
 
+        self.fill_reports.append(report)
+        self.console.print(f"[dim]Prepared test file: {report.describe()}[/dim]")
+        return True
+
     def _get_test_configs(self) -> List[dict]:
         """Get list of test configurations based on mode"""
         configs = []
@@ -416,6 +1227,16 @@ class BenchmarkExecutor:
                     ]
                 )
             configs.append({"test_type": "randrw", "block_size": "4k"})
+        elif self.config.mode == Mode.SWEEP:
+            configs = sweep_configs(self.config)
+        elif self.config.mode == Mode.PROFILE:
+            for name in self.config.profiles:
+                configs.extend(profile_configs(name))
+        elif self.config.mode == Mode.REPLAY:
+            configs = [
+                {"test_type": "replay", "block_size": "iolog", "trace": trace}
+                for trace in self.config.trace_files
+            ]
         elif self.config.mode == Mode.INDIVIDUAL:
             if not self.config.test_types or not self.config.block_sizes:
                 self.console.print(
@@ -428,10 +1249,74 @@ class BenchmarkExecutor:
                         continue
                     configs.append({"test_type": test_type, "block_size": block_size})
 
+        if self.config.engine_matrix and configs:
+            configs = engine_matrix_configs(configs, self._matrix_engines())
+
         return configs
 
+    def _matrix_engines(self) -> List[str]:
+        """Engine specs for the engine matrix, auto-detected on first use"""
+        if self.config.engines:
+            return list(self.config.engines)
+        if self.dry_run:
+            # Detection runs probe jobs on the target; a plan shows every candidate
+            return list(DEFAULT_MATRIX)
+        if self._detected_engines is None:
+            # Probe files cannot be created on a raw device, use the cwd instead
+            probe_dir = Path.cwd() if self.is_block_device else self.temp_dir
+            self._detected_engines = detect_engines(str(probe_dir))
+            self.console.print(
+                f"[dim]Usable I/O engines: {', '.join(self._detected_engines) or 'none'}[/dim]"
+            )
+        return self._detected_engines
+
+    def _ioengine(self, test_config: dict) -> str:
+        """Engine spec a test runs with; fio's default is psync"""
+        if self.python_engine is not None:
+            return "python"
+        if self.is_macos:
+            return "psync"
+        return test_config.get("ioengine") or self.config.ioengine or "psync"
+
+    def _dimensions(self, test_config: dict) -> dict:
+        """Return the queue depth, job count and read mix a test actually runs with"""
+        if self.is_macos:
+            io_depth, num_jobs = 1, 1
+        elif self.config.concurrency:
+            io_depth, num_jobs = 16, 4
+        else:
+            io_depth = test_config.get("io_depth", self.config.io_depth)
+            num_jobs = test_config.get("num_jobs", self.config.num_jobs)
+        rwmixread = test_config.get(
+            "rwmixread", 70 if test_config["test_type"] == "randrw" else None
+        )
+        return {"io_depth": io_depth, "num_jobs": num_jobs, "rwmixread": rwmixread}
+
+    def _describe(self, test_config: dict) -> str:
+        """Short human-readable label for a test configuration"""
+        label = f"{test_config['test_type']} ({test_config['block_size']})"
+        if test_config.get("workload"):
+            label = f"{test_config['workload']}: {label}"
+        extras = []
+        if "io_depth" in test_config:
+            extras.append(f"qd={test_config['io_depth']}")
+        if "num_jobs" in test_config:
+            extras.append(f"jobs={test_config['num_jobs']}")
+        if "rwmixread" in test_config:
+            extras.append(f"mix={test_config['rwmixread']}")
+        if test_config.get("rate_iops"):
+            extras.append(f"rate={test_config['rate_iops']}")
+        if test_config.get("trace"):
+            extras.append(Path(test_config["trace"]).name)
+        if test_config.get("ioengine"):
+            extras.append(test_config["ioengine"])
+        return f"{label} {' '.join(extras)}" if extras else label
+
     def _build_fio_command(self, test_config: dict, test_file: Path) -> List[str]:
         """Build FIO command for a test"""
+        if test_config["test_type"] == "replay":
+            return self._build_replay_command(test_config, test_file)
+
         cmd = [
             "fio",
             "--name=benchmark",
@@ -439,9 +1324,14 @@ class BenchmarkExecutor:
             f"--size={self.config.filesize}",
             f"--rw={test_config['test_type']}",
             f"--bs={test_config['block_size']}",
-            "--output-format=json",
+            "--output-format=json+",
             "--time_based",
         ]
+        fio_params = test_config.get("fio_params") or {}
+        if "bssplit" in fio_params:
+            # Block sizes come from the bssplit distribution instead
+            cmd.remove(f"--bs={test_config['block_size']}")
+        cmd.extend(PERCENTILE_FIO_ARGS)
 
         if self.is_macos:
             cmd.extend(
@@ -454,10 +1344,12 @@ class BenchmarkExecutor:
         else:
             cmd.extend(
                 [
-                    f"--iodepth={self.config.io_depth}",
-                    f"--numjobs={self.config.num_jobs}",
+                    f"--iodepth={test_config.get('io_depth', self.config.io_depth)}",
+                    f"--numjobs={test_config.get('num_jobs', self.config.num_jobs)}",
                 ]
             )
+            if test_config.get("ioengine") or self.config.ioengine:
+                cmd.extend(engine_fio_args(self._ioengine(test_config)))
 
         cmd.append(f"--runtime={self.config.runtime}")
 
@@ -469,9 +1361,18 @@ class BenchmarkExecutor:
         else:
             cmd.append("--fsync=0")
 
-        if test_config["test_type"] == "randrw":
+        if "rwmixread" in test_config:
+            cmd.append(f"--rwmixread={test_config['rwmixread']}")
+        elif test_config["test_type"] == "randrw":
             cmd.append("--rwmixread=70")
 
+        if test_config.get("rate_iops"):
+            # FIO applies rate_iops per job; split the total offered load
+            num_jobs = self._dimensions(test_config)["num_jobs"]
+            if self.stress is not None:
+                num_jobs *= len(self.stress.slots)
+            cmd.append(f"--rate_iops={max(1, -(-test_config['rate_iops'] // num_jobs))}")
+
         if self.config.ssd and not self.is_macos:
             cmd.extend(
                 [
@@ -488,63 +1389,279 @@ class BenchmarkExecutor:
                 ]
             )
 
+        if self.config.steady_state and self.config.ss_use_fio:
+            cmd.extend(steadystate_fio_args(self.config))
+
+        if test_config.get("log_prefix"):
+            cmd.extend(log_fio_args(test_config["log_prefix"], self.config.log_interval_ms))
+
+        # Profile options come last so they override the defaults above
+        for key, value in fio_params.items():
+            if isinstance(value, bool):
+                value = int(value)
+            cmd.append(f"--{key}={value}")
+
+        if self.stress is not None:
+            # Everything above becomes global, one job section per file follows
+            single_file = ("--name=benchmark", f"--filename={test_file}")
+            cmd = [arg for arg in cmd if arg not in single_file]
+            cmd.extend(self.stress.fio_args())
+
+        return cmd
+
+    def _build_replay_command(self, test_config: dict, test_file: Path) -> List[str]:
+        """Build FIO command replaying a trace onto the test file
+
+        The I/O pattern, sizes and timing come from the iolog; replay_redirect
+        sends all of it to the test file regardless of the traced device.
+        """
+        cmd = [
+            "fio",
+            "--name=benchmark",
+            f"--replay_redirect={test_file}",
+            "--output-format=json+",
+        ]
+        cmd.extend(PERCENTILE_FIO_ARGS)
+        cmd.extend(
+            replay_fio_args(
+                self._iolog(test_config), self.config.replay_time_scale, self.config.replay_no_stall
+            )
+        )
+        if self.config.replay_loops > 1:
+            cmd.append(f"--loops={self.config.replay_loops}")
+        if not self.is_macos:
+            cmd.append(f"--iodepth={self._dimensions(test_config)['io_depth']}")
+            if test_config.get("ioengine") or self.config.ioengine:
+                cmd.extend(engine_fio_args(self._ioengine(test_config)))
+        if self.config.direct_io and not self.is_macos:
+            cmd.append("--direct=1")
+        if test_config.get("log_prefix"):
+            cmd.extend(log_fio_args(test_config["log_prefix"], self.config.log_interval_ms))
         return cmd
 
     def _parse_fio_json_output(
         self, output: str, test_config: dict, allow_empty: bool = False
-    ) -> dict:
+    ) -> BenchmarkResult:
         """Parse FIO JSON output"""
-        try:
-            # FIO may output non-JSON content (progress, warnings) before/after JSON
-            # Extract just the JSON portion
-            json_start = output.find("{")
-            json_end = output.rfind("}") + 1
-            if json_start == -1 or json_end == 0:
-                self.console.print("[red]No JSON found in FIO output[/red]")
-                if output.strip():
-                    self.console.print(f"[dim]Raw output: {output[:500]}[/dim]")
-                return self._empty_result(test_config, "No JSON in output")
-
-            json_str = output[json_start:json_end]
-            data = json.loads(json_str)
-            jobs = data.get("jobs", [])
+        data = self._load_fio_json(output)
+        if data is None:
+            reason = "No JSON in output" if output.find("{") == -1 else "JSON parse error"
+            return self._empty_result(test_config, reason)
 
-            if not jobs:
-                return self._empty_result(test_config, "No jobs in output")
-
-            job = jobs[0]
-            read = job.get("read", {})
-            write = job.get("write", {})
-
-            # Handle cases where read/write metrics might be None
-            read_iops = read.get("iops") if read else 0
-            write_iops = write.get("iops") if write else 0
-
-            return {
-                "test_type": test_config["test_type"],
-                "block_size": test_config["block_size"],
-                "read_iops": read_iops if read_iops is not None else 0,
-                "write_iops": write_iops if write_iops is not None else 0,
-                "read_bw": read.get("bw_bytes", 0) if read else 0,
-                "write_bw": write.get("bw_bytes", 0) if write else 0,
-                "read_latency_us": self._convert_latency(
-                    read.get("lat_ns", {}).get("mean", 0) if read else 0
-                ),
-                "write_latency_us": self._convert_latency(
-                    write.get("lat_ns", {}).get("mean", 0) if write else 0
-                ),
-                "cpu": self._extract_cpu(job),
-                "io_time_sec": job.get("job_runtime", 0) / 1000,
+        jobs = data.get("jobs", [])
+
+        # fio --client reports jobs of all servers in client_stats instead
+        if not jobs and data.get("client_stats"):
+            return self._parse_client_stats(data["client_stats"], test_config)
+
+        if not jobs:
+            return self._empty_result(test_config, "No jobs in output")
+
+        return self._parse_jobs(jobs, test_config)
+
+    def _parse_client_stats(
+        self, client_stats: List[dict], test_config: dict
+    ) -> BenchmarkResult:
+        """Aggregate fio --client output across servers
+
+        Every job of every server is tagged with the server's hostname and
+        port. FIO's own "All clients" summary is ignored; jobs are merged per
+        host and across all hosts the same way numjobs workers are merged, so
+        latency percentiles come from the combined histograms.
+
+        Returns:
+            The aggregate result (host "all") with per-host results in `hosts`
+        """
+        by_host: Dict[str, List[dict]] = {}
+        for entry in client_stats:
+            if entry.get("jobname") == ALL_CLIENTS_JOBNAME:
+                continue
+            hostname = entry.get("hostname") or "unknown"
+            host = f"{hostname}:{entry['port']}" if entry.get("port") else hostname
+            by_host.setdefault(host, []).append(entry)
+        if not by_host:
+            return self._empty_result(test_config, "No jobs in output")
+
+        result = self._parse_jobs([job for jobs in by_host.values() for job in jobs], test_config)
+        result.extra["host"] = "all"
+        hosts = []
+        for host, jobs in by_host.items():
+            host_result = self._parse_jobs(jobs, test_config)
+            host_result.extra["host"] = host
+            hosts.append(host_result)
+        result.extra["hosts"] = hosts
+        return result
+
+    def _parse_jobs(self, jobs: List[dict], test_config: dict) -> BenchmarkResult:
+        """Build one result from all FIO job entries of a test
+
+        With numjobs > 1 FIO reports every worker separately; the workers are
+        merged so the result reflects the whole device rather than one worker.
+        """
+        result = self._parse_job(self._merge_jobs(jobs), test_config)
+        if self.config.per_job_breakdown and len(jobs) > 1:
+            breakdown = []
+            for idx, job in enumerate(jobs):
+                parsed = self._parse_job(job, test_config)
+                entry = {"job": idx}
+                for key in BREAKDOWN_FIELDS:
+                    entry[key] = getattr(parsed, key)
+                breakdown.append(entry)
+            job_iops = [e["read_iops"] + e["write_iops"] for e in breakdown]
+            mean_iops = sum(job_iops) / len(job_iops)
+            result.extra["jobs"] = breakdown
+            result.extra["job_iops_spread"] = (
+                round((max(job_iops) - min(job_iops)) / mean_iops, 4) if mean_iops else 0
+            )
+        result.extra.update(self._file_breakdown(jobs, test_config))
+        return result
+
+    def _file_breakdown(self, jobs: List[dict], test_config: dict) -> dict:
+        """File count and per-file results of a multi-file test (see src.stress)
+
+        A stress layout runs one fio job per file, device or directory; the
+        entries of each job are merged, and the job's own options in fio's
+        output name its files. Single-file tests get nothing.
+        """
+        groups: Dict[str, List[dict]] = {}
+        for job in jobs:
+            groups.setdefault(job.get("jobname", ""), []).append(job)
+        options = [group[0].get("job options") or {} for group in groups.values()]
+        file_count = sum(
+            int(opts.get("nrfiles", 1))
+            if "directory" in opts
+            else len(split_filenames(opts.get("filename", "")))
+            for opts in options
+        )
+        if len(groups) == 1 and file_count <= 1:
+            return {}
+
+        fields: dict = {"file_count": file_count}
+        if len(groups) > 1:
+            breakdown = []
+            for (name, group), opts in zip(groups.items(), options):
+                parsed = self._parse_job(self._merge_jobs(group), test_config)
+                entry = {"file": opts.get("filename") or opts.get("directory") or name}
+                for key in BREAKDOWN_FIELDS:
+                    entry[key] = getattr(parsed, key)
+                for key in ("read_p99_us", "write_p99_us"):
+                    entry[key] = parsed.extra.get(key)
+                breakdown.append(entry)
+            file_iops = [e["read_iops"] + e["write_iops"] for e in breakdown]
+            mean_iops = sum(file_iops) / len(file_iops)
+            fields["files"] = breakdown
+            fields["file_iops_spread"] = (
+                round((max(file_iops) - min(file_iops)) / mean_iops, 4) if mean_iops else 0
+            )
+        return fields
+
+    def _merge_jobs(self, jobs: List[dict]) -> dict:
+        """Merge several FIO job entries into a single job entry
+
+        Throughput counters are summed, CPU usage is summed across workers and
+        the runtime is the longest worker runtime. Latency blocks are merged
+        with per-job sample counts as weights and percentiles recomputed from
+        the merged json+ histograms.
+        """
+        if len(jobs) == 1:
+            return jobs[0]
+
+        merged: dict = {
+            "jobname": jobs[0].get("jobname"),
+            "usr_cpu": sum(job.get("usr_cpu", 0) or 0 for job in jobs),
+            "sys_cpu": sum(job.get("sys_cpu", 0) or 0 for job in jobs),
+            "job_runtime": max(job.get("job_runtime", 0) or 0 for job in jobs),
+            "steadystate": next(
+                (job["steadystate"] for job in jobs if job.get("steadystate")), None
+            ),
+        }
+        for direction in ("read", "write"):
+            stats = [job.get(direction) or {} for job in jobs]
+            totals = {
+                key: sum(s.get(key, 0) or 0 for s in stats)
+                for key in ("iops", "bw_bytes", "io_bytes", "total_ios")
             }
+            for kind in LATENCY_KINDS:
+                blocks = []
+                for s in stats:
+                    block = dict(s.get(f"{kind}_ns") or {})
+                    if block and not block.get("N") and not block.get("bins"):
+                        block["N"] = s.get("total_ios", 0)
+                    blocks.append(block)
+                latency = merge_latency(blocks)
+                if latency:
+                    totals[f"{kind}_ns"] = latency
+            merged[direction] = totals
+        return merged
+
+    def _load_fio_json(self, output: str) -> Optional[dict]:
+        """Extract and decode the JSON document from FIO output
+
+        Returns:
+            Decoded JSON data, or None if no valid JSON was found
+        """
+        # FIO may output non-JSON content (progress, warnings) before/after JSON
+        # Extract just the JSON portion
+        json_start = output.find("{")
+        json_end = output.rfind("}") + 1
+        if json_start == -1 or json_end == 0:
+            self.console.print("[red]No JSON found in FIO output[/red]")
+            if output.strip():
+                self.console.print(f"[dim]Raw output: {output[:500]}[/dim]")
+            return None
+
+        try:
+            return json.loads(output[json_start:json_end])
         except json.JSONDecodeError as e:
             self.console.print(f"[red]Failed to parse FIO JSON output: {e}[/red]")
             if output.strip():
                 self.console.print(f"[dim]Raw output (first 500 chars): {output[:500]}[/dim]")
-            return self._empty_result(test_config, "JSON parse error")
+            return None
+
+    def _parse_job(self, job: dict, test_config: dict) -> BenchmarkResult:
+        """Build a result from one FIO job entry"""
+        # read/write blocks and their metrics may be missing or None
+        read = job.get("read") or {}
+        write = job.get("write") or {}
+        latency = {"read": extract_direction(read), "write": extract_direction(write)}
+
+        extra = {
+            **flat_percentiles("read", latency["read"]),
+            **flat_percentiles("write", latency["write"]),
+            "usr_cpu": job.get("usr_cpu") or 0,
+            "sys_cpu": job.get("sys_cpu") or 0,
+            **self._dimensions(test_config),
+            "ioengine": self._ioengine(test_config),
+        }
+        for key in ("rate_iops", "trace", "profile", "workload", "log_prefix"):
+            if test_config.get(key):
+                extra[key] = test_config[key]
+
+        result = BenchmarkResult(
+            test_type=test_config["test_type"],
+            block_size=test_config["block_size"],
+            read_iops=float(read.get("iops") or 0),
+            write_iops=float(write.get("iops") or 0),
+            read_bw=float(read.get("bw_bytes") or 0),
+            write_bw=float(write.get("bw_bytes") or 0),
+            read_latency_us=self._convert_latency((read.get("lat_ns") or {}).get("mean", 0)),
+            write_latency_us=self._convert_latency((write.get("lat_ns") or {}).get("mean", 0)),
+            io_time_sec=(job.get("job_runtime") or 0) / 1000,
+            cpu=self._extract_cpu(job),
+            latency=latency,
+            extra=extra,
+        )
+
+        steadystate = fio_steadystate(job)
+        if steadystate is not None:
+            extra["ss_attained"] = steadystate["attained"]
+            extra["ss_converged_sec"] = result.io_time_sec if steadystate["attained"] else None
+            extra["ss_source"] = "fio"
+        return result
 
     def _convert_latency(self, latency_ns: float) -> float:
         """Convert latency from nanoseconds to microseconds"""
-        return round(latency_ns / 1000, 2) if latency_ns else 0
+        return round(latency_ns / 1000, 2) if latency_ns else 0.0
 
     def _extract_cpu(self, job: dict) -> str:
         """Extract CPU usage from job data
@@ -557,20 +1674,7 @@ class BenchmarkExecutor:
         return f"usr={usr:.2f}%, sys={sys_val:.2f}%"
 
     def _empty_result(
-        self, test_config: dict, reason: str = "Empty result", allow_empty: bool = False
-    ) -> dict:
-        """Return empty result placeholder"""
-        return {
-            "test_type": test_config["test_type"],
-            "block_size": test_config["block_size"],
-            "status": reason,
-            "read_iops": 0,
-            "write_iops": 0,
-            "read_bw": 0,
-            "write_bw": 0,
-            "read_latency_us": 0,
-            "write_latency_us": 0,
-            "cpu": "N/A",
-            "io_time_sec": 0,
-            "wall_time_sec": 0,
-        }
+        self, test_config: dict, reason: str = "Empty result", wall_time_sec: float = 0.0
+    ) -> BenchmarkResult:
+        """Return a placeholder result for a test that produced no measurements"""
+        return BenchmarkResult.placeholder(test_config, reason, wall_time_sec)
@@ -0,0 +1,67 @@
+"""FIO per-interval log files (write_iops_log/write_bw_log/write_lat_log)"""
+
+import re
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+# Log metrics FIO writes, mapped to the factor converting raw values to the
+# units used elsewhere in results (IOPS, bytes/s, microseconds)
+LOG_METRICS = {
+    "iops": 1.0,
+    "bw": 1024.0,  # KiB/s -> bytes/s
+    "lat": 0.001,  # ns -> us
+    "clat": 0.001,
+    "slat": 0.001,
+}
+
+DIRECTIONS = {0: "read", 1: "write", 2: "trim"}
+
+_LOG_NAME = re.compile(r"_(iops|bw|lat|clat|slat)\.(\d+)\.log$")
+
+
+def log_fio_args(prefix: str, interval_ms: int) -> List[str]:
+    """Return FIO arguments writing averaged IOPS, bandwidth and latency logs"""
+    return [
+        f"--write_iops_log={prefix}",
+        f"--write_bw_log={prefix}",
+        f"--write_lat_log={prefix}",
+        f"--log_avg_msec={interval_ms}",
+    ]
+
+
+def find_log_files(prefix: str) -> List[Tuple[str, int, Path]]:
+    """Find log files FIO wrote for a prefix
+
+    Returns:
+        Sorted list of (metric, job number, path)
+    """
+    prefix_path = Path(prefix)
+    found = []
+    for path in prefix_path.parent.glob(f"{prefix_path.name}_*.log"):
+        match = _LOG_NAME.search(path.name)
+        if match and path.name == f"{prefix_path.name}{match.group(0)}":
+            found.append((match.group(1), int(match.group(2)), path))
+    return sorted(found)
+
+
+def iter_log_samples(path: Path, metric: str) -> Iterator[Tuple[int, str, float]]:
+    """Stream samples from one FIO log file without loading it into memory
+
+    Lines have the form `time_ms, value, direction, block_size, offset[, prio]`.
+
+    Yields:
+        Tuples of (time_ms, direction, value in result units)
+    """
+    factor = LOG_METRICS[metric]
+    with open(path, "r") as f:
+        for line in f:
+            fields = line.split(",")
+            if len(fields) < 3:
+                continue
+            try:
+                t_ms = int(fields[0])
+                value = float(fields[1]) * factor
+                direction = DIRECTIONS.get(int(fields[2]), "unknown")
+            except ValueError:
+                continue
+            yield t_ms, direction, value
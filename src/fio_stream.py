@@ -0,0 +1,143 @@
+"""Incremental parsing of FIO --status-interval JSON output"""
+
+import json
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional
+
+
+@dataclass
+class IntervalSample:
+    """I/O rates measured over one FIO status interval"""
+
+    elapsed_sec: float
+    read_iops: float = 0.0
+    write_iops: float = 0.0
+    read_bw: float = 0.0  # bytes/s
+    write_bw: float = 0.0  # bytes/s
+    read_latency_us: float = 0.0
+    write_latency_us: float = 0.0
+
+    @property
+    def total_iops(self) -> float:
+        return self.read_iops + self.write_iops
+
+    @property
+    def total_bw(self) -> float:
+        return self.read_bw + self.write_bw
+
+
+class FioJsonStream:
+    """Split a stream of concatenated FIO JSON documents
+
+    With --status-interval, FIO prints one complete JSON document per
+    interval followed by the final report, possibly interleaved with plain
+    text warnings. Text is fed in arbitrary chunks and each complete
+    top-level object is returned as soon as its closing brace arrives.
+    """
+
+    def __init__(self):
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> List[str]:
+        """Consume a chunk of output, returning completed JSON documents"""
+        documents = []
+        for char in chunk:
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    self._buffer = [char]
+                continue
+
+            self._buffer.append(char)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    documents.append("".join(self._buffer))
+                    self._buffer = []
+        return documents
+
+
+def _totals(data: dict) -> dict:
+    """Sum cumulative counters across all jobs of a FIO JSON document"""
+    totals = {"elapsed_ms": 0.0}
+    for direction in ("read", "write"):
+        totals[f"{direction}_ios"] = 0.0
+        totals[f"{direction}_bytes"] = 0.0
+        totals[f"{direction}_lat_ns"] = 0.0
+    for job in data.get("jobs", []):
+        totals["elapsed_ms"] = max(totals["elapsed_ms"], job.get("job_runtime", 0) or 0)
+        for direction in ("read", "write"):
+            stats = job.get(direction) or {}
+            ios = stats.get("total_ios", 0) or 0
+            lat = stats.get("lat_ns") or {}
+            totals[f"{direction}_ios"] += ios
+            totals[f"{direction}_bytes"] += stats.get("io_bytes", 0) or 0
+            totals[f"{direction}_lat_ns"] += (lat.get("mean", 0) or 0) * lat.get("N", ios)
+    return totals
+
+
+class IntervalTracker:
+    """Turn successive cumulative FIO reports into per-interval samples"""
+
+    def __init__(self):
+        self._previous: Optional[dict] = None
+
+    def update(self, data: dict) -> Optional[IntervalSample]:
+        """Record a report, returning the sample since the previous one
+
+        The first report is measured from the start of the job, so it yields
+        a sample covering its whole runtime so far. Returns None for reports
+        that did not advance the job runtime.
+        """
+        current = _totals(data)
+        previous = self._previous or {key: 0.0 for key in current}
+        delta_ms = current["elapsed_ms"] - previous["elapsed_ms"]
+        if delta_ms <= 0:
+            return None
+        self._previous = current
+
+        seconds = delta_ms / 1000
+        sample = IntervalSample(elapsed_sec=current["elapsed_ms"] / 1000)
+        for direction in ("read", "write"):
+            ios = current[f"{direction}_ios"] - previous[f"{direction}_ios"]
+            io_bytes = current[f"{direction}_bytes"] - previous[f"{direction}_bytes"]
+            lat_ns = current[f"{direction}_lat_ns"] - previous[f"{direction}_lat_ns"]
+            setattr(sample, f"{direction}_iops", ios / seconds)
+            setattr(sample, f"{direction}_bw", io_bytes / seconds)
+            setattr(sample, f"{direction}_latency_us", lat_ns / ios / 1000 if ios > 0 else 0.0)
+        return sample
+
+
+def iter_interval_samples(lines: Iterable[str]) -> Iterator[tuple]:
+    """Yield (sample, document) pairs from FIO --status-interval output
+
+    Args:
+        lines: Text chunks of FIO stdout, e.g. a subprocess pipe
+
+    Yields:
+        Tuple of (IntervalSample or None, decoded JSON document). The last
+        document yielded is FIO's final report.
+    """
+    stream = FioJsonStream()
+    tracker = IntervalTracker()
+    for chunk in lines:
+        for document in stream.feed(chunk):
+            try:
+                data = json.loads(document)
+            except json.JSONDecodeError:
+                continue
+            yield tracker.update(data), data
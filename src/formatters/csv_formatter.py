@@ -2,7 +2,9 @@
 
 import csv
 from pathlib import Path
-from typing import List
+from typing import Iterable
+
+from src.result import ResultLike, as_records, to_frame
 
 
 class CsvFormatter:
@@ -12,8 +14,9 @@ class CsvFormatter:
         self.output_path = Path(output_path)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def format(self, results: List[dict]) -> None:
+    def format(self, results: Iterable[ResultLike]) -> None:
         """Format results as CSV and save to file"""
+        results = as_records(results)
         if not results:
             return
 
@@ -38,24 +41,20 @@ class CsvFormatter:
             )
 
             for result in results:
-                # Support both old (runtime_sec) and new (io_time_sec) field names
-                io_time = result.get("io_time_sec") or result.get("runtime_sec") or 0
-                wall_time = result.get("wall_time_sec") or 0
-
                 writer.writerow(
                     [
-                        result.get("test_type", "N/A"),
-                        result.get("block_size", "N/A"),
-                        (result.get("read_iops") or 0),
-                        (result.get("write_iops") or 0),
-                        f"{(result.get('read_bw') or 0) / 1024 / 1024:.2f}",
-                        f"{(result.get('write_bw') or 0) / 1024 / 1024:.2f}",
-                        f"{(result.get('read_latency_us') or 0):.2f}",
-                        f"{(result.get('write_latency_us') or 0):.2f}",
-                        result.get("cpu", "N/A"),
-                        f"{io_time:.2f}",
-                        f"{wall_time:.2f}",
-                        result.get("status", "N/A"),
+                        result.test_type or "N/A",
+                        result.block_size or "N/A",
+                        result.read_iops,
+                        result.write_iops,
+                        f"{result.read_bw / 1024 / 1024:.2f}",
+                        f"{result.write_bw / 1024 / 1024:.2f}",
+                        f"{result.read_latency_us:.2f}",
+                        f"{result.write_latency_us:.2f}",
+                        result.cpu,
+                        f"{result.io_time_sec:.2f}",
+                        f"{result.wall_time_sec:.2f}",
+                        result.status_text,
                     ]
                 )
 
@@ -69,16 +68,15 @@ class ExcelFormatter:
         self.output_path = Path(output_path)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def format(self, results: List[dict]) -> None:
+    def format(self, results: Iterable[ResultLike]) -> None:
         """Format results as Excel with multiple sheets organized by metrics"""
         import pandas as pd
 
-        if not results:
+        df = to_frame(results)
+        if df.empty:
             print("No results to export")
             return
 
-        df = pd.DataFrame(results)
-
         summary_df = df.groupby(["test_type", "block_size"]).agg(
             {
                 "read_iops": ["mean", "min", "max"],
@@ -109,28 +107,22 @@ class ExcelFormatter:
             values=["read_latency_us", "write_latency_us"],
         )
 
-        # Support both old (runtime_sec) and new (io_time_sec, wall_time_sec) field names
-        raw_columns = [
-            "test_type",
-            "block_size",
-            "read_iops",
-            "write_iops",
-            "read_bw",
-            "write_bw",
-            "read_latency_us",
-            "write_latency_us",
-            "cpu",
+        raw_df = df[
+            [
+                "test_type",
+                "block_size",
+                "read_iops",
+                "write_iops",
+                "read_bw",
+                "write_bw",
+                "read_latency_us",
+                "write_latency_us",
+                "cpu",
+                "io_time_sec",
+                "wall_time_sec",
+                "status",
+            ]
         ]
-        # Add time columns based on what's available
-        if "io_time_sec" in df.columns:
-            raw_columns.append("io_time_sec")
-        elif "runtime_sec" in df.columns:
-            raw_columns.append("runtime_sec")
-        if "wall_time_sec" in df.columns:
-            raw_columns.append("wall_time_sec")
-        raw_columns.append("status")
-
-        raw_df = df[[col for col in raw_columns if col in df.columns]]
 
         with pd.ExcelWriter(
             self.output_path, engine="openpyxl", datetime_format="YYYY-MM-DD HH:MM:SS"
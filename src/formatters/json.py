@@ -2,9 +2,11 @@
 
 import json
 from pathlib import Path
-from typing import List
+from typing import Iterable
 from datetime import datetime
 
+from src.result import ResultLike, as_records
+
 
 class JsonFormatter:
     """JSON output formatter"""
@@ -13,13 +15,14 @@ class JsonFormatter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def format(self, results: List[dict]) -> None:
+    def format(self, results: Iterable[ResultLike]) -> None:
         """Format results as JSON and save to file"""
         timestamp = datetime.now().isoformat()
 
         output_file = self.output_dir / "benchmark_results.json"
 
         with open(output_file, "w") as f:
+            results = [result.to_dict() for result in as_records(results)]
             json.dump({"timestamp": timestamp, "results": results}, f, indent=2)
 
         print(f"Results saved to {output_file}")
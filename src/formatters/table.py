@@ -1,15 +1,21 @@
 """Table output formatter for benchmark results"""
 
-from typing import List, Optional
+from typing import Iterable, Optional
 from rich.console import Console
 from rich.table import Table
 
+from src.result import ResultLike, as_records
+
 
 class TableFormatter:
     """Rich table output formatter"""
 
-    def __init__(self, console: Optional[Console] = None):
+    # Percentile columns shown with show_percentiles: (label, result field suffix)
+    PERCENTILE_COLUMNS = [("p50", "p50"), ("p99", "p99"), ("p99.9", "p99_9")]
+
+    def __init__(self, console: Optional[Console] = None, show_percentiles: bool = False):
         self.console = console or Console()
+        self.show_percentiles = show_percentiles
 
     def _format_time(self, seconds: float) -> str:
         """Format time value intelligently based on magnitude"""
@@ -22,45 +28,83 @@ class TableFormatter:
             secs = int(seconds % 60)
             return f"{minutes:02d}:{secs:02d}"
 
-    def format(self, results: List[dict]) -> None:
+    def format(self, results: Iterable[ResultLike]) -> None:
         """Format results as a table"""
+        results = as_records(results)
         if not results:
             self.console.print("[yellow]No results to display[/yellow]")
             return
 
         table = Table(title="Disk I/O Benchmark Results")
+        # Distributed (fio --client) runs have per-host rows plus an "all" row
+        show_host = any(result.extra.get("host") for result in results)
+        # Engine matrix runs repeat each test once per I/O engine
+        show_engine = len({result.extra.get("ioengine") for result in results}) > 1
+        # Block-device telemetry (src.devstats) when the target's device was sampled
+        show_device = any(result.extra.get("dev_util_pct") is not None for result in results)
+        # Multi-file stress layouts (src.stress) spread each test over several files
+        show_files = any(result.extra.get("file_count") for result in results)
 
+        if show_host:
+            table.add_column("Host", style="cyan", no_wrap=True)
         table.add_column("Test Type", style="cyan", no_wrap=True)
         table.add_column("Block Size", style="magenta")
+        if show_engine:
+            table.add_column("Engine", style="magenta", no_wrap=True)
+        if show_files:
+            table.add_column("Files", justify="right", style="magenta")
         table.add_column("Read IOPS", justify="right", style="green")
         table.add_column("Write IOPS", justify="right", style="green")
         table.add_column("Read MB/s", justify="right", style="blue")
         table.add_column("Write MB/s", justify="right", style="blue")
         table.add_column("Read Lat (µs)", justify="right", style="yellow")
         table.add_column("Write Lat (µs)", justify="right", style="yellow")
+        if self.show_percentiles:
+            for direction in ("Read", "Write"):
+                for label, _ in self.PERCENTILE_COLUMNS:
+                    table.add_column(f"{direction} {label} (µs)", justify="right", style="yellow")
+        if show_device:
+            table.add_column("Dev Util", justify="right", style="red")
         table.add_column("CPU", justify="left", style="white")
         table.add_column("I/O Time", justify="right", style="white")
         table.add_column("Wall Time", justify="right", style="white")
         table.add_column("Status", justify="left", style="white")
 
         for result in results:
-            # Support both old (runtime_sec) and new (io_time_sec) field names
-            io_time = result.get("io_time_sec") or result.get("runtime_sec") or 0
-            wall_time = result.get("wall_time_sec") or 0
+            percentiles = []
+            if self.show_percentiles:
+                for direction in ("read", "write"):
+                    for _, suffix in self.PERCENTILE_COLUMNS:
+                        value = result.extra.get(f"{direction}_{suffix}_us") or 0
+                        percentiles.append(f"{value:.2f}")
+
+            host = [result.extra.get("host") or ""] if show_host else []
+            engine = [result.extra.get("ioengine") or ""] if show_engine else []
+            files = [str(result.extra.get("file_count") or 1)] if show_files else []
+            device = []
+            if show_device:
+                util = result.extra.get("dev_util_pct")
+                device = [f"{util:.0f}%" if util is not None else "N/A"]
 
+            wall_time = result.wall_time_sec
             table.add_row(
-                result.get("test_type", "N/A"),
-                result.get("block_size", "N/A"),
-                f"{(result.get('read_iops') or 0):.0f}",
-                f"{(result.get('write_iops') or 0):.0f}",
-                f"{(result.get('read_bw') or 0) / 1024 / 1024:.2f}",
-                f"{(result.get('write_bw') or 0) / 1024 / 1024:.2f}",
-                f"{(result.get('read_latency_us') or 0):.2f}",
-                f"{(result.get('write_latency_us') or 0):.2f}",
-                result.get("cpu", "N/A"),
-                self._format_time(io_time),
+                *host,
+                result.test_type or "N/A",
+                result.block_size or "N/A",
+                *engine,
+                *files,
+                f"{result.read_iops:.0f}",
+                f"{result.write_iops:.0f}",
+                f"{result.read_bw / 1024 / 1024:.2f}",
+                f"{result.write_bw / 1024 / 1024:.2f}",
+                f"{result.read_latency_us:.2f}",
+                f"{result.write_latency_us:.2f}",
+                *percentiles,
+                *device,
+                result.cpu,
+                self._format_time(result.io_time_sec),
                 self._format_time(wall_time) if wall_time > 0 else "N/A",
-                result.get("status", "N/A"),
+                result.status_text,
             )
 
         self.console.print(table)
@@ -0,0 +1,209 @@
+"""Host pressure and CPU-cost telemetry (PSI, /proc/stat, /proc/vmstat) while tests run"""
+
+import os
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.sampler import PreadSampler
+
+PROC_STAT_PATH = "/proc/stat"
+PROC_VMSTAT_PATH = "/proc/vmstat"
+PSI_PATHS = {"io": "/proc/pressure/io", "cpu": "/proc/pressure/cpu"}
+
+# /proc/stat holds a line per CPU plus long interrupt counters
+STAT_READ_SIZE = 1024 * 1024
+
+# Columns of the cpu lines in /proc/stat; guest time is already part of user
+USER, NICE, SYSTEM, IDLE, IOWAIT, IRQ, SOFTIRQ, STEAL = range(8)
+BUSY_COLUMNS = (USER, NICE, SYSTEM, IRQ, SOFTIRQ, STEAL)
+
+
+@dataclass
+class HostSample:
+    """Host-wide pressure and CPU use over one sampling interval"""
+
+    t_ms: int  # End of the interval, since sampling started
+    # Share of wall time some (or all) runnable tasks stalled on I/O or CPU;
+    # None where the kernel has no PSI
+    io_some_pct: Optional[float]
+    io_full_pct: Optional[float]
+    cpu_some_pct: Optional[float]
+    cpu_busy_pct: float  # Of all CPUs together
+    iowait_pct: float
+    softirq_pct: float
+    max_cpu_iowait_pct: float  # The single CPU with the most iowait
+    max_cpu_softirq_pct: float  # ... and softirq time (completion interrupts)
+    cpu_busy_sec: float  # CPU-seconds spent outside idle and iowait
+    dirty_bytes: int
+    writeback_bytes: int
+
+
+def parse_psi(text: str) -> Tuple[int, int]:
+    """Return the cumulative (some, full) stall microseconds of a pressure file"""
+    totals = {"some": 0, "full": 0}
+    for line in text.splitlines():
+        fields = line.split()
+        if fields and fields[0] in totals:
+            for field in fields[1:]:
+                if field.startswith("total="):
+                    totals[fields[0]] = int(field[6:])
+    return totals["some"], totals["full"]
+
+
+def parse_cpu_stat(text: str) -> Dict[str, Tuple[int, ...]]:
+    """Return the tick counters of the aggregate "cpu" line and each "cpuN" line"""
+    cpus = {}
+    for line in text.splitlines():
+        if not line.startswith("cpu"):
+            break  # cpu lines come first
+        fields = line.split()
+        cpus[fields[0]] = tuple(int(value) for value in fields[1 : STEAL + 2])
+    return cpus
+
+
+def parse_vmstat(text: str) -> Tuple[int, int]:
+    """Return the (dirty, writeback) page counts from /proc/vmstat"""
+    counts = {"nr_dirty": 0, "nr_writeback": 0}
+    for line in text.splitlines():
+        name, _, value = line.partition(" ")
+        if name in counts:
+            counts[name] = int(value)
+    return counts["nr_dirty"], counts["nr_writeback"]
+
+
+def _pct(part: float, whole: float) -> float:
+    return round(100 * part / whole, 2) if whole > 0 else 0.0
+
+
+def _psi_pct(prev: Optional[Tuple[int, int]], cur: Optional[Tuple[int, int]], dt: float):
+    if prev is None or cur is None:
+        return None, None
+    return (
+        min(100.0, _pct((cur[0] - prev[0]) / 1e6, dt)),
+        min(100.0, _pct((cur[1] - prev[1]) / 1e6, dt)),
+    )
+
+
+def compute_sample(
+    prev: dict, cur: dict, dt: float, t_ms: int, clk_tck: int, page_size: int
+) -> HostSample:
+    """Derive a host sample from two snapshots `dt` seconds apart"""
+    io_some, io_full = _psi_pct(prev.get("psi_io"), cur.get("psi_io"), dt)
+    cpu_some, _ = _psi_pct(prev.get("psi_cpu"), cur.get("psi_cpu"), dt)
+
+    deltas = {
+        name: [c - p for c, p in zip(ticks, prev["cpu"].get(name, ticks))]
+        for name, ticks in cur["cpu"].items()
+    }
+    total = deltas.get("cpu") or [0] * (STEAL + 1)
+    total_ticks = sum(total)
+    per_cpu = [delta for name, delta in deltas.items() if name != "cpu"]
+    busy_ticks = sum(total[column] for column in BUSY_COLUMNS)
+    dirty, writeback = cur["vmstat"]
+
+    return HostSample(
+        t_ms=t_ms,
+        io_some_pct=io_some,
+        io_full_pct=io_full,
+        cpu_some_pct=cpu_some,
+        cpu_busy_pct=_pct(busy_ticks, total_ticks),
+        iowait_pct=_pct(total[IOWAIT], total_ticks),
+        softirq_pct=_pct(total[SOFTIRQ], total_ticks),
+        max_cpu_iowait_pct=max((_pct(d[IOWAIT], sum(d)) for d in per_cpu), default=0.0),
+        max_cpu_softirq_pct=max((_pct(d[SOFTIRQ], sum(d)) for d in per_cpu), default=0.0),
+        cpu_busy_sec=round(busy_ticks / clk_tck, 3),
+        dirty_bytes=dirty * page_size,
+        writeback_bytes=writeback * page_size,
+    )
+
+
+def host_stats_available() -> bool:
+    """Return True where /proc/stat can be sampled (Linux)"""
+    return os.path.exists(PROC_STAT_PATH)
+
+
+class HostSampler(PreadSampler):
+    """Sample PSI, per-CPU time and dirty/writeback pages of the whole host"""
+
+    read_size = STAT_READ_SIZE
+
+    def __init__(self, interval: float = 1.0):
+        super().__init__(interval)
+        self.samples: List[HostSample] = []
+        self.clk_tck = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self._open("stat", PROC_STAT_PATH)
+        self._open("vmstat", PROC_VMSTAT_PATH)
+        for resource, path in PSI_PATHS.items():
+            self._open(f"psi_{resource}", path)
+
+    def snapshot(self) -> Optional[dict]:
+        stat = self._pread("stat")
+        if stat is None:
+            return None
+        snapshot = {"cpu": parse_cpu_stat(stat)}
+        vmstat = self._pread("vmstat")
+        snapshot["vmstat"] = parse_vmstat(vmstat) if vmstat is not None else (0, 0)
+        for resource in PSI_PATHS:
+            text = self._pread(f"psi_{resource}")
+            snapshot[f"psi_{resource}"] = parse_psi(text) if text is not None else None
+        return snapshot
+
+    def compute(self, prev: dict, cur: dict, dt: float, t_ms: int) -> HostSample:
+        return compute_sample(prev, cur, dt, t_ms, self.clk_tck, self.page_size)
+
+    def summary(self) -> dict:
+        """Result fields summarizing the samples (empty without samples)"""
+        return summarize(self.samples)
+
+
+def _mean(values: List[Optional[float]]) -> Optional[float]:
+    values = [value for value in values if value is not None]
+    return round(sum(values) / len(values), 2) if values else None
+
+
+def summarize(samples: List[HostSample]) -> dict:
+    """Average pressure and CPU use, peak per-CPU and page-cache figures
+
+    PSI fields are left out where the kernel has no pressure information.
+    """
+    if not samples:
+        return {}
+    summary = {
+        "host_io_some_pct": _mean([s.io_some_pct for s in samples]),
+        "host_io_full_pct": _mean([s.io_full_pct for s in samples]),
+        "host_cpu_some_pct": _mean([s.cpu_some_pct for s in samples]),
+        "host_cpu_busy_pct": _mean([s.cpu_busy_pct for s in samples]),
+        "host_iowait_pct": _mean([s.iowait_pct for s in samples]),
+        "host_softirq_pct": _mean([s.softirq_pct for s in samples]),
+        "host_max_cpu_iowait_pct": max(s.max_cpu_iowait_pct for s in samples),
+        "host_max_cpu_softirq_pct": max(s.max_cpu_softirq_pct for s in samples),
+        "host_cpu_sec": round(sum(s.cpu_busy_sec for s in samples), 3),
+        "host_dirty_max_bytes": max(s.dirty_bytes for s in samples),
+        "host_writeback_max_bytes": max(s.writeback_bytes for s in samples),
+    }
+    return {key: value for key, value in summary.items() if value is not None}
+
+
+def iops_per_cpu_sec(iops: float, samples: List[HostSample]) -> Optional[float]:
+    """I/Os completed per host CPU-second over the sampled window, given a test's IOPS
+
+    Counts every CPU-second on the host, so it is the submission and
+    completion cost per I/O only when nothing else keeps the CPUs busy.
+    """
+    cpu_sec = sum(s.cpu_busy_sec for s in samples)
+    if not samples or cpu_sec <= 0:
+        return None
+    return round(iops * samples[-1].t_ms / 1000 / cpu_sec, 1)
+
+
+def sample_dicts(samples: List[HostSample]) -> List[dict]:
+    return [asdict(sample) for sample in samples]
+
+
+def series_rows(samples: List[dict]) -> Iterator[Tuple[str, str, int, float]]:
+    """Flatten sample dicts into (metric, direction, t_ms, value) rows as host_* metrics"""
+    for sample in samples:
+        for field, value in sample.items():
+            if field != "t_ms" and value is not None:
+                yield f"host_{field}", "", sample["t_ms"], value
@@ -0,0 +1,181 @@
+"""Saturation knee search under a p99 latency SLO"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from src.executor import BenchmarkExecutor
+from src.result import BenchmarkResult
+
+# Dimensions the search can raise to increase offered load
+KNEE_DIMENSIONS = ("io_depth", "num_jobs", "rate_iops")
+
+
+@dataclass
+class KneePoint:
+    """One measured point of the latency-vs-throughput curve"""
+
+    value: int  # Value of the searched dimension
+    iops: float
+    p99_us: float
+    result: BenchmarkResult = field(repr=False)
+
+    def meets(self, slo_p99_us: float) -> bool:
+        return self.result.ok and 0 < self.p99_us <= slo_p99_us
+
+
+@dataclass
+class KneeResult:
+    """Outcome of a knee search"""
+
+    test_type: str
+    block_size: str
+    dimension: str
+    slo_p99_us: float
+    knee: Optional[KneePoint]
+    curve: List[KneePoint]
+
+    def summary(self) -> dict:
+        """Flat summary suitable for storage"""
+        return {
+            "test_type": self.test_type,
+            "block_size": self.block_size,
+            "dimension": self.dimension,
+            "slo_p99_us": self.slo_p99_us,
+            "knee_value": self.knee.value if self.knee else None,
+            "knee_iops": self.knee.iops if self.knee else None,
+            "knee_p99_us": self.knee.p99_us if self.knee else None,
+        }
+
+
+class KneeFinder:
+    """Find the highest sustainable IOPS for one workload under a p99 target
+
+    For io_depth and num_jobs the load is doubled until the SLO is violated
+    or IOPS stop growing, then the last good and first bad values are
+    bisected. For rate_iops the unthrottled maximum is measured first and
+    the offered rate is bisected between zero and that maximum. Every probe
+    is a normal benchmark run, so the full curve is available afterwards;
+    the prepared read file is shared by all probes of a search.
+    """
+
+    def __init__(
+        self,
+        executor: BenchmarkExecutor,
+        test_type: str,
+        block_size: str,
+        slo_p99_us: float,
+        dimension: str = "io_depth",
+        max_value: int = 1024,
+        tolerance: float = 0.05,
+        max_probes: int = 12,
+    ):
+        if dimension not in KNEE_DIMENSIONS:
+            raise ValueError(f"Unknown knee dimension: {dimension}")
+        self.executor = executor
+        self.test_type = test_type
+        self.block_size = block_size
+        self.slo_p99_us = slo_p99_us
+        self.dimension = dimension
+        self.max_value = max_value
+        self.tolerance = tolerance
+        self.max_probes = max_probes
+        self._measured: Dict[int, KneePoint] = {}
+
+    def _p99(self, result: BenchmarkResult) -> float:
+        """p99 latency of the direction(s) the workload exercises"""
+        read_p99 = result.extra.get("read_p99_us") or 0
+        write_p99 = result.extra.get("write_p99_us") or 0
+        if self.test_type in ("read", "randread"):
+            return read_p99
+        if self.test_type in ("write", "randwrite", "trim"):
+            return write_p99
+        return max(read_p99, write_p99)
+
+    def measure(self, value: int) -> KneePoint:
+        """Run one probe with the searched dimension set to `value`"""
+        if value in self._measured:
+            return self._measured[value]
+
+        test_config = {"test_type": self.test_type, "block_size": self.block_size}
+        if value:
+            test_config[self.dimension] = value
+        # The read file stays prepared between probes; search() releases it
+        results = self.executor.run_tests([test_config], release_files=False)
+        result = (
+            results[0] if results else BenchmarkResult.placeholder(test_config, "FAILED: no result")
+        )
+        point = KneePoint(
+            value=value,
+            iops=result.read_iops + result.write_iops,
+            p99_us=self._p99(result),
+            result=result,
+        )
+        self._measured[value] = point
+        return point
+
+    def search(self) -> KneeResult:
+        """Run the search and return the knee with the measured curve"""
+        try:
+            if self.dimension == "rate_iops":
+                self._search_rate()
+            else:
+                self._search_concurrency()
+        finally:
+            self.executor._release_test_files()
+
+        curve = sorted(self._measured.values(), key=lambda p: p.value)
+        good = [p for p in curve if p.meets(self.slo_p99_us)]
+        knee = max(good, key=lambda p: p.iops) if good else None
+        return KneeResult(
+            test_type=self.test_type,
+            block_size=self.block_size,
+            dimension=self.dimension,
+            slo_p99_us=self.slo_p99_us,
+            knee=knee,
+            curve=curve,
+        )
+
+    def _search_concurrency(self) -> None:
+        """Exponential probe on io_depth/num_jobs, then integer bisection"""
+        low: Optional[KneePoint] = None
+        high: Optional[int] = None
+        value = 1
+        while value <= self.max_value and len(self._measured) < self.max_probes:
+            point = self.measure(value)
+            if not point.meets(self.slo_p99_us):
+                high = value
+                break
+            if low is not None and point.iops < low.iops * (1 + self.tolerance):
+                # Throughput saturated before latency crossed the SLO
+                return
+            low = point
+            value *= 2
+
+        if low is None or high is None:
+            return
+
+        lo, hi = low.value, high
+        while hi - lo > 1 and len(self._measured) < self.max_probes:
+            mid = (lo + hi) // 2
+            if self.measure(mid).meets(self.slo_p99_us):
+                lo = mid
+            else:
+                hi = mid
+
+    def _search_rate(self) -> None:
+        """Measure the unthrottled maximum, then bisect the offered rate"""
+        peak = self.measure(0)
+        if peak.meets(self.slo_p99_us) or peak.iops <= 0:
+            return
+
+        lo, hi = 0.0, peak.iops
+        while (hi - lo) / hi > self.tolerance and len(self._measured) < self.max_probes:
+            mid = int((lo + hi) / 2)
+            if mid <= 0:
+                break
+            point = self.measure(mid)
+            # The offered rate only counts as sustained if the device kept up
+            if point.meets(self.slo_p99_us) and point.iops >= mid * (1 - self.tolerance):
+                lo = mid
+            else:
+                hi = mid
@@ -0,0 +1,173 @@
+"""Latency distribution extraction from FIO json+ output"""
+
+from typing import Dict, List, Optional
+
+# Percentiles requested from FIO and stored with each result
+PERCENTILES = (50.0, 90.0, 99.0, 99.9, 99.99)
+
+# FIO latency kinds: submission, completion and total latency
+LATENCY_KINDS = ("slat", "clat", "lat")
+
+PERCENTILE_FIO_ARGS = [
+    "--clat_percentiles=1",
+    "--lat_percentiles=1",
+    "--slat_percentiles=1",
+    "--percentile_list=" + ":".join(f"{p:g}" for p in PERCENTILES),
+]
+
+
+def percentile_field(percentile: float) -> str:
+    """Return the column suffix for a percentile, e.g. 99.9 -> 'p99_9'"""
+    return "p" + f"{percentile:g}".replace(".", "_")
+
+
+def percentile_columns(direction: str) -> List[str]:
+    """Return flat result column names for a direction's percentiles"""
+    return [f"{direction}_{percentile_field(p)}_us" for p in PERCENTILES]
+
+
+def _lookup_percentile(percentiles: dict, percentile: float) -> Optional[float]:
+    """Find a percentile in FIO's string-keyed map ("99.900000": value)"""
+    for key, value in percentiles.items():
+        try:
+            if abs(float(key) - percentile) < 1e-6:
+                return value
+        except ValueError:
+            continue
+    return None
+
+
+def extract_kind(stats: dict) -> Dict[str, float]:
+    """Summarize one FIO latency block (slat_ns/clat_ns/lat_ns) in microseconds"""
+    summary = {
+        "min_us": round((stats.get("min", 0) or 0) / 1000, 2),
+        "max_us": round((stats.get("max", 0) or 0) / 1000, 2),
+        "mean_us": round((stats.get("mean", 0) or 0) / 1000, 2),
+        "stddev_us": round((stats.get("stddev", 0) or 0) / 1000, 2),
+    }
+    percentiles = stats.get("percentile") or {}
+    for percentile in PERCENTILES:
+        value = _lookup_percentile(percentiles, percentile)
+        summary[f"{percentile_field(percentile)}_us"] = round((value or 0) / 1000, 2)
+    return summary
+
+
+def extract_bins(stats: dict) -> List[List[int]]:
+    """Return json+ histogram bins as sorted [latency_ns, count] pairs"""
+    bins = stats.get("bins") or {}
+    return sorted([int(value), int(count)] for value, count in bins.items() if count)
+
+
+def extract_direction(direction_stats: dict) -> dict:
+    """Extract the full latency distribution for one I/O direction
+
+    Returns:
+        Dict with a summary per latency kind and the raw clat histogram bins
+    """
+    if not direction_stats or not direction_stats.get("total_ios", 1):
+        return {}
+    distribution = {}
+    for kind in LATENCY_KINDS:
+        stats = direction_stats.get(f"{kind}_ns")
+        if stats:
+            distribution[kind] = extract_kind(stats)
+    bins = extract_bins(direction_stats.get("clat_ns") or {})
+    if bins:
+        distribution["clat_bins"] = bins
+    return distribution
+
+
+def flat_percentiles(direction: str, distribution: dict) -> Dict[str, float]:
+    """Flatten a direction's total latency percentiles into result columns
+
+    Total latency (lat) is preferred; completion latency (clat) is used when
+    FIO did not report total latency percentiles.
+    """
+    source = distribution.get("lat") or {}
+    if not any(source.get(f"{percentile_field(p)}_us") for p in PERCENTILES):
+        source = distribution.get("clat") or {}
+    return {
+        column: source.get(f"{percentile_field(p)}_us", 0)
+        for column, p in zip(percentile_columns(direction), PERCENTILES)
+    }
+
+
+def merge_bins(bin_maps: List[dict]) -> Dict[str, int]:
+    """Sum json+ histogram bins ({"latency_ns": count}) across jobs"""
+    merged: Dict[str, int] = {}
+    for bins in bin_maps:
+        for value, count in (bins or {}).items():
+            merged[value] = merged.get(value, 0) + int(count)
+    return merged
+
+
+def percentiles_from_bins(bins: dict, percentiles=PERCENTILES) -> Dict[str, float]:
+    """Compute FIO-style percentiles ("99.900000": ns) from histogram bins"""
+    pairs = sorted((int(value), int(count)) for value, count in bins.items() if count)
+    total = sum(count for _, count in pairs)
+    if total == 0:
+        return {}
+    result = {}
+    for percentile in percentiles:
+        threshold = total * percentile / 100
+        seen = 0
+        for value, count in pairs:
+            seen += count
+            if seen >= threshold:
+                result[f"{percentile:f}"] = value
+                break
+    return result
+
+
+def _sample_count(block: dict) -> int:
+    """Number of samples in a latency block"""
+    return int(block.get("N") or sum(int(c) for c in (block.get("bins") or {}).values()))
+
+
+def merge_latency(blocks: List[dict]) -> dict:
+    """Merge one FIO latency block (e.g. clat_ns) across several jobs
+
+    Min and max are taken over all jobs, mean and stddev are pooled with the
+    sample count of each job as weight (FIO's N, or the histogram total).
+    Percentiles are recomputed exactly from the merged histogram when json+
+    bins are present; otherwise they are averaged with the same weights.
+    """
+    weighted_blocks = [(b, _sample_count(b)) for b in blocks if b]
+    weighted_blocks = [(b, n) for b, n in weighted_blocks if n > 0]
+    if not weighted_blocks:
+        return {}
+    blocks = [b for b, _ in weighted_blocks]
+    counts = [n for _, n in weighted_blocks]
+    total = sum(counts)
+    mean = sum(b.get("mean", 0) * n for b, n in zip(blocks, counts)) / total
+    variance = (
+        sum(
+            n * ((b.get("stddev", 0) or 0) ** 2 + (b.get("mean", 0) - mean) ** 2)
+            for b, n in zip(blocks, counts)
+        )
+        / total
+    )
+    merged = {
+        "N": total,
+        "min": min(b.get("min", 0) for b in blocks),
+        "max": max(b.get("max", 0) for b in blocks),
+        "mean": mean,
+        "stddev": variance**0.5,
+    }
+
+    if all(b.get("bins") for b in blocks):
+        merged["bins"] = merge_bins([b["bins"] for b in blocks])
+        merged["percentile"] = percentiles_from_bins(merged["bins"])
+    elif any(b.get("percentile") for b in blocks):
+        merged["percentile"] = {}
+        for percentile in PERCENTILES:
+            weighted = [
+                (_lookup_percentile(b.get("percentile") or {}, percentile), n)
+                for b, n in zip(blocks, counts)
+            ]
+            weighted = [(value, n) for value, n in weighted if value is not None]
+            if weighted:
+                merged["percentile"][f"{percentile:f}"] = sum(v * n for v, n in weighted) / sum(
+                    n for _, n in weighted
+                )
+    return merged
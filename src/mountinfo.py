@@ -0,0 +1,112 @@
+"""Resolve benchmark targets to their mount, filesystem type and backing device"""
+
+import os
+import stat
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+
+@dataclass
+class MountEntry:
+    """One line of /proc/self/mountinfo"""
+
+    mount_point: str
+    fstype: str
+    source: str  # Backing device, or a pseudo source such as "tmpfs"
+    dev: str  # major:minor of the mounted filesystem
+
+
+def _unescape(field: str) -> str:
+    """Decode the octal escapes mountinfo uses for spaces, tabs and newlines"""
+    for code, char in (("\\040", " "), ("\\011", "\t"), ("\\012", "\n"), ("\\134", "\\")):
+        field = field.replace(code, char)
+    return field
+
+
+def parse_mountinfo(text: str) -> List[MountEntry]:
+    """Parse mountinfo content
+
+    Lines look like
+    `36 35 98:0 /mnt1 /mnt/parent rw,noatime master:1 - ext3 /dev/root rw`,
+    with a variable number of optional fields before the `-` separator.
+    """
+    entries = []
+    for line in text.splitlines():
+        fields = line.split()
+        if "-" not in fields:
+            continue
+        sep = fields.index("-")
+        if sep < 6 or len(fields) < sep + 3:
+            continue
+        entries.append(
+            MountEntry(
+                mount_point=_unescape(fields[4]),
+                fstype=fields[sep + 1],
+                source=_unescape(fields[sep + 2]),
+                dev=fields[2],
+            )
+        )
+    return entries
+
+
+def read_mountinfo(path: str = MOUNTINFO_PATH) -> List[MountEntry]:
+    """Read the mount table, or return an empty list where it is unavailable"""
+    try:
+        with open(path, "r") as f:
+            return parse_mountinfo(f.read())
+    except OSError:
+        return []
+
+
+def find_mount(path: str, entries: List[MountEntry]) -> Optional[MountEntry]:
+    """Return the mount a path lives on (the longest matching mount point)"""
+    resolved = os.path.realpath(path)
+    best, best_len = None, -1
+    for entry in entries:
+        mount_point = entry.mount_point.rstrip("/")  # "" for the root mount
+        if resolved == mount_point or resolved.startswith(mount_point + "/"):
+            # Later entries shadow earlier mounts on the same point
+            if len(mount_point) >= best_len:
+                best, best_len = entry, len(mount_point)
+    return best
+
+
+def is_block_device(path: str) -> bool:
+    """Return True if path is a block device node"""
+    try:
+        return stat.S_ISBLK(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def describe_target(path: str, entries: Optional[List[MountEntry]] = None) -> dict:
+    """Describe a benchmark target for tagging results
+
+    Returns:
+        Dict with target, mount_point, fstype and device. For a block device
+        the device is the target itself and the mount fields are only set if
+        it is currently mounted.
+    """
+    if entries is None:
+        entries = read_mountinfo()
+    target = str(Path(path).resolve())
+    info = {"target": target, "mount_point": "", "fstype": "", "device": ""}
+
+    if is_block_device(target):
+        info["device"] = target
+        for entry in entries:
+            if os.path.realpath(entry.source) == target:
+                info["mount_point"] = entry.mount_point
+                info["fstype"] = entry.fstype
+                break
+        return info
+
+    entry = find_mount(target, entries)
+    if entry is not None:
+        info["mount_point"] = entry.mount_point
+        info["fstype"] = entry.fstype
+        info["device"] = entry.source
+    return info
@@ -0,0 +1,102 @@
+"""Run planning: expected wall time and bytes written of each test"""
+
+from dataclasses import dataclass, field
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+READ_TEST_TYPES = ("read", "randread")
+
+# Stored results considered per target and file size, newest first
+HISTORY_LIMIT = 500
+
+
+@dataclass
+class PlannedTest:
+    """One test of a run as the executor would run it"""
+
+    description: str
+    command: Optional[List[str]]  # None when no fio process is started
+    run_sec: float = 0.0
+    overhead_sec: float = 0.0  # Process startup, layout, cleanup, timeouts
+    prepare_sec: float = 0.0  # Writing the test file first
+    prepare_bytes: int = 0
+    write_bytes: Optional[int] = None  # None when there is no history to go by
+    basis: str = "default"  # Where overhead_sec comes from: history, calibration or default
+    skip_reason: str = ""
+
+    @property
+    def wall_sec(self) -> float:
+        return self.prepare_sec + self.run_sec + self.overhead_sec
+
+    @property
+    def bytes_written(self) -> int:
+        return self.prepare_bytes + (self.write_bytes or 0)
+
+
+@dataclass
+class RunPlan:
+    """The tests of a run on one target with their estimates"""
+
+    target: str
+    tests: List[PlannedTest] = field(default_factory=list)
+
+    @property
+    def total_sec(self) -> float:
+        return sum(test.wall_sec for test in self.tests)
+
+    @property
+    def total_bytes_written(self) -> int:
+        return sum(test.bytes_written for test in self.tests)
+
+    @property
+    def unknown_writes(self) -> int:
+        """Tests that may write but have no history to estimate how much"""
+        return sum(
+            1 for test in self.tests if test.write_bytes is None and not test.skip_reason
+        )
+
+
+class OverheadModel:
+    """Per-test costs learned from stored results of one target and file size
+
+    The overhead of a past test is what its wall time spent outside fio's I/O:
+    wall_time_sec - io_time_sec - prepare_sec. It covers process startup, file
+    layout and cleanup, and a test that timed out shows up with its whole
+    timeout. The median of the closest match is used: same test type and block
+    size, else same test type, else any test; `default` without history.
+    """
+
+    def __init__(self, rows: List[dict], default: float, file_bytes: int = 0):
+        self.default = default
+        self.file_bytes = file_bytes
+        self._overheads: Dict[Tuple[str, ...], List[float]] = {}
+        self._write_bw: Dict[Tuple[str, str], List[float]] = {}
+        self._prepare_bps: List[float] = []
+        for row in rows:
+            prepare = row.get("prepare_sec") or 0
+            overhead = (row.get("wall_time_sec") or 0) - (row.get("io_time_sec") or 0) - prepare
+            key = (row["test_type"], row["block_size"])
+            for group in (key, key[:1], ()):
+                self._overheads.setdefault(group, []).append(max(0.0, overhead))
+            if row.get("status") == "OK":
+                self._write_bw.setdefault(key, []).append(row.get("write_bw") or 0)
+            if prepare > 0 and file_bytes and row["test_type"] in READ_TEST_TYPES:
+                self._prepare_bps.append(file_bytes / prepare)
+
+    def overhead(self, test_type: str, block_size: str) -> Tuple[float, str]:
+        """Expected overhead of a test and whether it comes from history"""
+        for group in ((test_type, block_size), (test_type,), ()):
+            if group in self._overheads:
+                return median(self._overheads[group]), "history"
+        return self.default, "default"
+
+    def write_bytes(self, test_type: str, block_size: str, run_sec: float) -> Optional[int]:
+        """Bytes a test writes at the median write bandwidth of its past runs"""
+        samples = self._write_bw.get((test_type, block_size))
+        if not samples:
+            return None
+        return int(median(samples) * run_sec)
+
+    def prepare_bps(self) -> Optional[float]:
+        """Measured speed of past read-file preparations, in bytes/s"""
+        return median(self._prepare_bps) if self._prepare_bps else None
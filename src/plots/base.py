@@ -2,15 +2,18 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import Iterable
 import webbrowser
 
+from src.result import ResultLike, as_dicts
+
 
 class BasePlotter(ABC):
     """Abstract base class for plotters"""
 
-    def __init__(self, results: List[dict], config: dict):
-        self.results = results
+    def __init__(self, results: Iterable[ResultLike], config: dict):
+        # Frames are built from flat rows so sweep dimensions become columns
+        self.results = as_dicts(results)
         self.config = config
         self.output_dir = Path(config.get("plot_output_dir", "results/plots"))
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -4,6 +4,9 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 
+from src.config import parse_filesize_to_bytes
+from src.sweep import SWEEP_DIMENSIONS
+
 from .base import BasePlotter
 
 
@@ -23,6 +26,8 @@ class PlotlyPlotter(BasePlotter):
                 self._generate_radar_chart()
             elif plot_type == "line":
                 self._generate_line_trends()
+            elif plot_type == "sweep":
+                self._generate_sweep_plot()
 
     def _generate_bar_charts(self) -> None:
         """Generate bar charts for IOPS, bandwidth, latency"""
@@ -248,6 +253,69 @@ class PlotlyPlotter(BasePlotter):
 
         return fig
 
+    def _generate_sweep_plot(self) -> None:
+        """Generate a line chart of a metric pivoted on a sweep dimension"""
+        df = pd.DataFrame(self.results)
+        pivot = self.config.get("pivot", "io_depth")
+        metric = self.config.get("pivot_metric", "iops")
+
+        if df.empty or pivot not in df.columns:
+            return
+
+        fig = self._create_sweep_chart(df, pivot, metric)
+        self._save_html(fig, f"sweep_{metric}_by_{pivot}.html")
+
+    def _create_sweep_chart(self, df: pd.DataFrame, pivot: str, metric: str) -> go.Figure:
+        """Create line chart with one trace per combination of the other dimensions
+
+        Args:
+            pivot: Sweep dimension on the x axis (e.g. io_depth)
+            metric: "iops", "bw", "latency" or any numeric result column
+        """
+        df = df.copy()
+        if metric == "iops":
+            df["value"] = df["read_iops"].fillna(0) + df["write_iops"].fillna(0)
+            y_label = "IOPS"
+        elif metric == "bw":
+            df["value"] = (df["read_bw"].fillna(0) + df["write_bw"].fillna(0)) / 1024 / 1024
+            y_label = "MB/s"
+        elif metric == "latency":
+            df["value"] = df[["read_latency_us", "write_latency_us"]].max(axis=1)
+            y_label = "Latency (µs)"
+        else:
+            df["value"] = df[metric]
+            y_label = metric
+
+        series_dims = [
+            dim
+            for dim in SWEEP_DIMENSIONS
+            if dim != pivot and dim in df.columns and df[dim].nunique(dropna=True) > 1
+        ]
+
+        fig = go.Figure()
+        groups = df.groupby(series_dims, dropna=False) if series_dims else [((), df)]
+        for key, group in groups:
+            key = key if isinstance(key, tuple) else (key,)
+            name = ", ".join(f"{dim}={value}" for dim, value in zip(series_dims, key)) or metric
+            if pivot == "block_size":
+                group = group.iloc[group[pivot].map(parse_filesize_to_bytes).argsort()]
+            else:
+                group = group.sort_values(pivot)
+            fig.add_trace(
+                go.Scatter(x=group[pivot], y=group["value"], mode="lines+markers", name=name)
+            )
+
+        fig.update_layout(
+            title=f"{y_label} by {pivot}",
+            xaxis_title=pivot,
+            yaxis_title=y_label,
+            hovermode="x unified",
+        )
+        if pivot in ("io_depth", "num_jobs"):
+            fig.update_xaxes(type="log")
+
+        return fig
+
     def _generate_line_trends(self) -> None:
         """Generate line chart for performance trends"""
         pass
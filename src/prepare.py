@@ -0,0 +1,193 @@
+"""Test-file preparation strategies for read benchmarks"""
+
+import json
+import os
+import platform
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from src.pyengine import PythonEngine
+from src.testfiles import FILL_PATTERNS
+
+# sequential: one job at queue depth 1, the historical way of laying out files
+# parallel:   preallocate, then several jobs fill disjoint ranges at high iodepth
+# refill:     like parallel, but every block gets fresh random data so the file
+#             cannot be compressed or deduplicated by the storage
+PREPARE_STRATEGIES = ("auto", "sequential", "parallel", "refill")
+
+FILL_BLOCK_SIZE = 1024 * 1024
+FILL_IODEPTH = 32
+MAX_FILL_JOBS = 8
+MIN_JOB_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class FillReport:
+    """How a test file was prepared and how fast"""
+
+    strategy: str
+    size_bytes: int
+    seconds: float
+    jobs: int = 1
+
+    @property
+    def bw(self) -> float:
+        """Fill throughput in bytes/s"""
+        return self.size_bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def describe(self) -> str:
+        return (
+            f"{self.size_bytes / 1024**3:.1f} GiB in {self.seconds:.1f}s "
+            f"({self.bw / 1024 / 1024:.0f} MB/s, {self.strategy}, {self.jobs} jobs)"
+        )
+
+
+def choose_strategy(requested: str, pattern: str) -> str:
+    """Resolve "auto" to a concrete strategy
+
+    Random files are refilled with unique data: fio otherwise reuses the same
+    random buffer for every block, which deduplicating or compressing storage
+    stores once, so reads would not touch real media. Zero files are meant to
+    be compressible anyway and use the plain parallel fill.
+    """
+    if requested not in PREPARE_STRATEGIES:
+        raise ValueError(f"Unknown prepare strategy: {requested}")
+    if requested != "auto":
+        return requested
+    return "refill" if pattern == "random" else "parallel"
+
+
+def fill_jobs(size: int) -> int:
+    """Number of parallel fill jobs for a file of `size` bytes"""
+    return max(1, min(MAX_FILL_JOBS, os.cpu_count() or 1, size // MIN_JOB_BYTES))
+
+
+def job_ranges(size: int, jobs: int) -> List[Tuple[int, int]]:
+    """Split a file into block-aligned (offset, length) ranges, one per job"""
+    chunk = max(FILL_BLOCK_SIZE, size // jobs // FILL_BLOCK_SIZE * FILL_BLOCK_SIZE)
+    ranges = []
+    offset = 0
+    while offset < size and len(ranges) < jobs:
+        length = chunk if len(ranges) < jobs - 1 else size - offset
+        length = min(length, size - offset)
+        ranges.append((offset, length))
+        offset += length
+    return ranges
+
+
+def preallocate(path: Path, size: int) -> None:
+    """Reserve the file's blocks up front so parallel writers never extend it"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except (AttributeError, OSError):
+            # macOS has no posix_fallocate; some filesystems refuse it
+            os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+
+
+def fill_command(
+    path: Path,
+    size: int,
+    strategy: str,
+    pattern: str = "random",
+    direct: bool = True,
+    ioengine: Optional[str] = None,
+) -> List[str]:
+    """Build the FIO command writing every byte of a test file"""
+    if strategy == "sequential":
+        cmd = [
+            "fio",
+            "--name=precreate",
+            f"--filename={path}",
+            f"--size={size}",
+            "--rw=write",
+            "--bs=1M",  # Large block size for faster creation
+            "--output-format=json",
+            "--iodepth=1",
+            "--numjobs=1",
+        ]
+        cmd.extend(FILL_PATTERNS[pattern])
+        if direct:
+            cmd.append("--direct=1")
+        return cmd
+
+    # Options before the first --name apply to every job
+    cmd = [
+        "fio",
+        f"--filename={path}",
+        "--rw=write",
+        "--bs=1M",
+        f"--iodepth={FILL_IODEPTH}",
+        "--fallocate=none",
+        "--output-format=json",
+    ]
+    if ioengine:
+        cmd.append(f"--ioengine={ioengine}")
+    cmd.extend(FILL_PATTERNS[pattern])
+    if strategy == "refill" and pattern != "zero":
+        cmd.append("--refill_buffers")
+    if direct:
+        cmd.append("--direct=1")
+    for idx, (offset, length) in enumerate(job_ranges(size, fill_jobs(size))):
+        cmd.extend([f"--name=fill{idx}", f"--offset={offset}", f"--size={length}"])
+    return cmd
+
+
+def written_bytes(output: str) -> int:
+    """Total bytes FIO reports as written, across all jobs"""
+    start, end = output.find("{"), output.rfind("}") + 1
+    if start == -1 or end == 0:
+        return 0
+    try:
+        jobs = json.loads(output[start:end]).get("jobs", [])
+    except json.JSONDecodeError:
+        return 0
+    return sum((job.get("write") or {}).get("io_bytes", 0) or 0 for job in jobs)
+
+
+def prepare_file(
+    path: Path,
+    size: int,
+    pattern: str = "random",
+    strategy: str = "auto",
+    direct: bool = True,
+    timeout: Optional[int] = None,
+    engine: Optional[PythonEngine] = None,
+    runner: Callable[..., subprocess.CompletedProcess] = subprocess.run,
+) -> FillReport:
+    """Write a test file completely with the chosen strategy
+
+    Read benchmarks on thin-provisioned storage need every block to really
+    be written: preallocated but unwritten extents are served without
+    touching the media. The file is therefore only accepted when FIO reports
+    having written at least `size` bytes; preallocation alone never counts.
+
+    Raises:
+        RuntimeError: If the file was not completely written
+        subprocess.TimeoutExpired: If FIO does not finish within timeout
+    """
+    strategy = choose_strategy(strategy, pattern)
+    jobs = 1 if strategy == "sequential" else fill_jobs(size)
+    start = time.time()
+
+    if engine is not None:
+        ranges = [(0, size)] if strategy == "sequential" else job_ranges(size, jobs)
+        engine.fill(path, size, pattern, ranges=ranges, refill=strategy == "refill")
+        return FillReport(strategy, size, time.time() - start, len(ranges))
+
+    if strategy != "sequential":
+        preallocate(path, size)
+    ioengine = "posixaio" if platform.system() == "Darwin" else "libaio"
+    cmd = fill_command(path, size, strategy, pattern, direct, ioengine)
+    result = runner(cmd, capture_output=True, text=True, timeout=timeout)
+    written = written_bytes(result.stdout)
+    if written < size:
+        stderr_msg = result.stderr.strip() if result.stderr else "no error output"
+        raise RuntimeError(f"only {written} of {size} bytes written ({stderr_msg})")
+    return FillReport(strategy, size, time.time() - start, jobs)
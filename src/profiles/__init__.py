@@ -0,0 +1,124 @@
+"""Declarative workload profiles loaded from TOML or YAML files
+
+A profile is a named list of tests. Each test sets the fio pattern with
+`rw` and optionally `bs`, `iodepth`, `numjobs` and `rwmixread`; every other
+key is passed to fio verbatim, e.g. `bssplit`, `random_distribution` or
+`thinktime`. A top-level `fio` table holds defaults for all tests:
+
+    name = "oltp"
+    description = "..."
+
+    [fio]
+    norandommap = 1
+
+    [[tests]]
+    name = "oltp-8k"
+    rw = "randrw"
+    bs = "8k"
+    rwmixread = 70
+    random_distribution = "zipf:1.2"
+"""
+
+from pathlib import Path
+from typing import List
+
+PROFILE_DIR = Path(__file__).parent
+PROFILE_SUFFIXES = (".toml", ".yaml", ".yml")
+
+# Test keys with a dedicated test config field; everything else goes to fio
+_TEST_FIELDS = {
+    "rw": "test_type",
+    "bs": "block_size",
+    "iodepth": "io_depth",
+    "numjobs": "num_jobs",
+    "rwmixread": "rwmixread",
+}
+
+# Block size label for tests whose sizes come from a bssplit distribution
+MIXED_BLOCK_SIZE = "mixed"
+
+
+def _load_toml(path: Path) -> dict:
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ValueError("TOML profiles need Python 3.11+ or the tomli package")
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _load_yaml(path: Path) -> dict:
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError("YAML profiles need the PyYAML package")
+    with open(path, "r") as f:
+        return yaml.safe_load(f) or {}
+
+
+def builtin_profiles() -> List[str]:
+    """Names of the profiles shipped with the tool"""
+    return sorted(p.stem for p in PROFILE_DIR.iterdir() if p.suffix in PROFILE_SUFFIXES)
+
+
+def find_profile(name: str) -> Path:
+    """Resolve a profile name or file path to a profile file"""
+    path = Path(name)
+    if path.suffix in PROFILE_SUFFIXES and path.exists():
+        return path
+    for suffix in PROFILE_SUFFIXES:
+        candidate = PROFILE_DIR / f"{name}{suffix}"
+        if candidate.exists():
+            return candidate
+    raise ValueError(
+        f"Unknown profile '{name}' (built-in profiles: {', '.join(builtin_profiles())})"
+    )
+
+
+def load_profile(name: str) -> dict:
+    """Load and validate a profile by name or path"""
+    path = find_profile(name)
+    data = _load_toml(path) if path.suffix == ".toml" else _load_yaml(path)
+    if not isinstance(data, dict):
+        raise ValueError(f"Profile {path} must be a table/mapping")
+    tests = data.get("tests")
+    if not isinstance(tests, list) or not tests:
+        raise ValueError(f"Profile {path} needs a non-empty 'tests' list")
+    for idx, test in enumerate(tests):
+        if not isinstance(test, dict) or "rw" not in test:
+            raise ValueError(f"Profile {path} test {idx} needs an 'rw' pattern")
+        if "bs" not in test and "bssplit" not in test:
+            raise ValueError(f"Profile {path} test {idx} needs 'bs' or 'bssplit'")
+    data.setdefault("name", path.stem)
+    data.setdefault("description", "")
+    return data
+
+
+def profile_configs(name: str) -> List[dict]:
+    """Expand a profile into executor test configs
+
+    Test configs carry the profile and test name, and any extra fio options
+    in `fio_params`.
+    """
+    profile = load_profile(name)
+    defaults = profile.get("fio") or {}
+    configs = []
+    for idx, test in enumerate(profile["tests"]):
+        params = dict(defaults)
+        params.update(test)
+        config = {
+            "profile": profile["name"],
+            "workload": params.pop("name", f"{profile['name']}-{idx + 1}"),
+        }
+        for key, field in _TEST_FIELDS.items():
+            if key in params:
+                config[field] = params.pop(key)
+        if "bssplit" in params:
+            config.setdefault("block_size", MIXED_BLOCK_SIZE)
+        if params:
+            config["fio_params"] = params
+        configs.append(config)
+    return configs
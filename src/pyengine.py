@@ -0,0 +1,400 @@
+"""Pure-Python benchmark engine used when fio is not installed"""
+
+import fcntl
+import itertools
+import mmap
+import os
+import random
+import shutil
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.fio_stream import IntervalSample
+from src.latency import PERCENTILES
+
+# Test types the engine implements: (random offsets, reads, writes)
+ACCESS_PATTERNS = {
+    "read": (False, True, False),
+    "write": (False, False, True),
+    "randread": (True, True, False),
+    "randwrite": (True, False, True),
+    "rw": (False, True, True),
+    "readwrite": (False, True, True),
+    "randrw": (True, True, True),
+}
+
+# O_DIRECT needs buffers, offsets and sizes aligned to the logical block size
+DIRECT_ALIGNMENT = 4096
+
+# Latency samples each worker preallocates per direction, and the most it keeps
+LATENCY_CAPACITY = 1 << 16
+MAX_LATENCY_SAMPLES = 1 << 22
+
+# Block size used when filling test files
+FILL_BLOCK_SIZE = 1024 * 1024
+
+
+def fio_available(fio: str = "fio") -> bool:
+    """Check whether the fio binary is on PATH"""
+    return shutil.which(fio) is not None
+
+
+class LatencyRecorder:
+    """Per-I/O latencies in a preallocated numpy array
+
+    The array doubles until MAX_LATENCY_SAMPLES; after that every other
+    sample is dropped and only every 2nd, 4th, ... I/O is recorded, so memory
+    stays bounded while samples remain spread over the whole run. Count,
+    sum, min and max always cover every I/O.
+    """
+
+    def __init__(self, capacity: int = LATENCY_CAPACITY, max_samples: int = MAX_LATENCY_SAMPLES):
+        self.samples = np.empty(capacity, dtype=np.int64)
+        self.max_samples = max_samples
+        self.size = 0
+        self.stride = 1
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def add(self, latency_ns: int) -> None:
+        """Record one I/O latency in nanoseconds"""
+        if self.count == 0 or latency_ns < self.min_ns:
+            self.min_ns = latency_ns
+        if latency_ns > self.max_ns:
+            self.max_ns = latency_ns
+        self.count += 1
+        self.total_ns += latency_ns
+        if self.count % self.stride:
+            return
+        if self.size == len(self.samples):
+            if self.size < self.max_samples:
+                self.samples = np.resize(self.samples, min(self.size * 2, self.max_samples))
+            else:
+                kept = self.samples[::2].copy()
+                self.samples[: len(kept)] = kept
+                self.size = len(kept)
+                self.stride *= 2
+        self.samples[self.size] = latency_ns
+        self.size += 1
+
+    def values(self) -> np.ndarray:
+        return self.samples[: self.size]
+
+
+def latency_block(recorders: List[LatencyRecorder]) -> dict:
+    """Summarize recorded latencies as a FIO json+ latency block (nanoseconds)
+
+    Histogram bins are the samples rounded down to whole microseconds.
+    """
+    count = sum(r.count for r in recorders)
+    if count == 0:
+        return {}
+    samples = np.concatenate([r.values() for r in recorders])
+    bins, counts = np.unique(samples // 1000 * 1000, return_counts=True)
+    return {
+        "N": count,
+        "min": min(r.min_ns for r in recorders if r.count),
+        "max": max(r.max_ns for r in recorders),
+        "mean": sum(r.total_ns for r in recorders) / count,
+        "stddev": float(samples.std()) if len(samples) else 0.0,
+        "percentile": {
+            f"{p:f}": int(v) for p, v in zip(PERCENTILES, np.percentile(samples, PERCENTILES))
+        },
+        "bins": {str(int(b)): int(c) for b, c in zip(bins, counts)},
+    }
+
+
+class _Worker:
+    """Counters and latency recorders of one I/O thread"""
+
+    def __init__(self):
+        self.ios = {"read": 0, "write": 0}
+        self.bytes = {"read": 0, "write": 0}
+        self.latency = {"read": LatencyRecorder(), "write": LatencyRecorder()}
+        self.error: Optional[OSError] = None
+
+
+class PythonEngine:
+    """Run benchmark tests with os.preadv/os.pwritev instead of fio
+
+    Every test runs io_depth threads per job for num_jobs jobs; each thread
+    keeps one synchronous I/O in flight on an O_DIRECT descriptor with its
+    own page-aligned mmap buffer. Results are returned as a FIO job entry so
+    they go through the same parsing as fio output.
+    """
+
+    def __init__(self, direct: bool = True):
+        """
+        Args:
+            direct: Bypass the page cache (O_DIRECT, or F_NOCACHE on macOS)
+        """
+        self.direct = direct
+
+    def _open(self, path: Path, flags: int, direct: bool = True) -> int:
+        """Open a test file, falling back to buffered I/O where O_DIRECT is refused"""
+        direct = direct and self.direct
+        direct_flag = getattr(os, "O_DIRECT", 0)
+        if direct and direct_flag:
+            try:
+                return os.open(path, flags | direct_flag, 0o644)
+            except OSError:
+                # e.g. tmpfs does not support O_DIRECT
+                pass
+        fd = os.open(path, flags, 0o644)
+        if direct and hasattr(fcntl, "F_NOCACHE"):
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+        return fd
+
+    def fill(
+        self,
+        path: Path,
+        size: int,
+        pattern: str = "random",
+        ranges: Optional[List[Tuple[int, int]]] = None,
+        refill: bool = False,
+    ) -> None:
+        """Write a test file completely so reads hit allocated blocks
+
+        Args:
+            path: File to write
+            size: File size in bytes
+            pattern: "random" or "zero"
+            ranges: Disjoint (offset, length) ranges written by one thread
+                each (default: the whole file in one thread)
+            refill: Fresh random data for every block instead of one reused
+                random block, so the file cannot be deduplicated
+
+        Raises:
+            OSError: If any write fails
+        """
+        os.close(self._open(path, os.O_WRONLY | os.O_CREAT))
+        errors: List[OSError] = []
+
+        def write_range(offset: int, length: int) -> None:
+            buffer = mmap.mmap(-1, FILL_BLOCK_SIZE)
+            if pattern != "zero":
+                buffer.write(os.urandom(FILL_BLOCK_SIZE))
+            fd = self._open(path, os.O_WRONLY)
+            try:
+                end = offset + length
+                while offset < end:
+                    chunk = min(FILL_BLOCK_SIZE, end - offset)
+                    if refill and pattern != "zero":
+                        buffer[:chunk] = os.urandom(chunk)
+                    if chunk % DIRECT_ALIGNMENT:
+                        # A partial tail cannot be written with O_DIRECT
+                        os.close(fd)
+                        fd = os.open(path, os.O_WRONLY)
+                    view = memoryview(buffer)[:chunk]
+                    os.pwritev(fd, [view], offset)
+                    view.release()
+                    offset += chunk
+                os.fsync(fd)
+            except OSError as e:
+                errors.append(e)
+            finally:
+                os.close(fd)
+                buffer.close()
+
+        threads = [
+            threading.Thread(target=write_range, args=r, daemon=True) for r in ranges or [(0, size)]
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    def run(
+        self,
+        path: Path,
+        test_type: str,
+        block_size: int,
+        size: int,
+        runtime: int,
+        io_depth: int = 1,
+        num_jobs: int = 1,
+        rwmixread: Optional[int] = None,
+        fsync: bool = False,
+        rate_iops: int = 0,
+        status_interval: int = 1,
+        on_sample: Optional[Callable[[IntervalSample], Optional[bool]]] = None,
+    ) -> dict:
+        """Run one time-based test
+
+        Args:
+            path: Test file or block device
+            test_type: One of ACCESS_PATTERNS
+            block_size: I/O size in bytes
+            size: Bytes of the file the I/O is spread over
+            runtime: Seconds to run for
+            io_depth: Threads per job, each with one I/O in flight
+            num_jobs: Jobs, each with its own descriptor and sequential cursor
+            rwmixread: Read percentage of mixed tests (default 50, like fio)
+            fsync: fsync after every write
+            rate_iops: Total IOPS cap, 0 for unlimited
+            status_interval: Seconds between on_sample calls, 0 disables them
+            on_sample: Called with live rates; returning True stops the test
+
+        Returns:
+            FIO-style job entry with read/write stats, CPU usage and job_runtime
+
+        Raises:
+            ValueError: For test types the engine does not implement
+            OSError: If the file cannot be opened or an I/O fails
+        """
+        if test_type not in ACCESS_PATTERNS:
+            raise ValueError(f"Test type '{test_type}' is not supported by the Python engine")
+        is_random, reads, writes = ACCESS_PATTERNS[test_type]
+        if reads and writes:
+            read_share = (rwmixread if rwmixread is not None else 50) / 100
+        else:
+            read_share = 1.0 if reads else 0.0
+
+        flags = (os.O_RDWR if writes else os.O_RDONLY) | (0 if path.exists() else os.O_CREAT)
+        aligned = block_size % DIRECT_ALIGNMENT == 0
+        fds = [self._open(path, flags, direct=aligned) for _ in range(num_jobs)]
+        try:
+            if stat.S_ISBLK(os.fstat(fds[0]).st_mode):
+                size = min(size, os.lseek(fds[0], 0, os.SEEK_END))
+            elif writes and os.fstat(fds[0]).st_size < size:
+                os.posix_fallocate(fds[0], 0, size)
+            blocks = size // block_size
+            if blocks == 0:
+                raise ValueError(f"File size {size} is smaller than the block size {block_size}")
+
+            workers = [_Worker() for _ in range(num_jobs * io_depth)]
+            cursors = [itertools.count() for _ in range(num_jobs)]
+            stop = threading.Event()
+            interval = len(workers) / rate_iops if rate_iops else 0.0
+
+            def work(worker: _Worker, job: int, seed: int) -> None:
+                fd, cursor = fds[job], cursors[job]
+                rng = random.Random(seed)
+                buffer = mmap.mmap(-1, block_size)
+                buffer.write(os.urandom(block_size))
+                view = memoryview(buffer)
+                next_at = time.perf_counter()
+                try:
+                    while not stop.is_set():
+                        if interval:
+                            next_at += interval
+                            delay = next_at - time.perf_counter()
+                            if delay > 0:
+                                time.sleep(delay)
+                        block = rng.randrange(blocks) if is_random else next(cursor) % blocks
+                        direction = "read" if rng.random() < read_share else "write"
+                        start = time.perf_counter_ns()
+                        if direction == "read":
+                            os.preadv(fd, [view], block * block_size)
+                        else:
+                            os.pwritev(fd, [view], block * block_size)
+                            if fsync:
+                                os.fsync(fd)
+                        worker.latency[direction].add(time.perf_counter_ns() - start)
+                        worker.ios[direction] += 1
+                        worker.bytes[direction] += block_size
+                except OSError as e:
+                    worker.error = e
+                    stop.set()
+                finally:
+                    view.release()
+                    buffer.close()
+
+            threads = [
+                threading.Thread(target=work, args=(w, idx // io_depth, idx), daemon=True)
+                for idx, w in enumerate(workers)
+            ]
+            cpu_start = os.times()
+            wall_start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            self._monitor(workers, stop, wall_start, runtime, status_interval, on_sample)
+            stop.set()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - wall_start
+            cpu_end = os.times()
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+        errors = [w.error for w in workers if w.error is not None]
+        if errors:
+            raise errors[0]
+
+        job: Dict[str, object] = {
+            "jobname": "python",
+            "usr_cpu": (cpu_end.user - cpu_start.user) / elapsed * 100,
+            "sys_cpu": (cpu_end.system - cpu_start.system) / elapsed * 100,
+            "job_runtime": int(elapsed * 1000),
+        }
+        for direction in ("read", "write"):
+            total_ios = sum(w.ios[direction] for w in workers)
+            io_bytes = sum(w.bytes[direction] for w in workers)
+            block = latency_block([w.latency[direction] for w in workers])
+            job[direction] = {
+                "iops": total_ios / elapsed,
+                "bw_bytes": io_bytes / elapsed,
+                "io_bytes": io_bytes,
+                "total_ios": total_ios,
+                # I/O is synchronous, so completion and total latency coincide
+                "clat_ns": block,
+                "lat_ns": block,
+            }
+        return job
+
+    def _monitor(
+        self,
+        workers: List[_Worker],
+        stop: threading.Event,
+        wall_start: float,
+        runtime: int,
+        status_interval: int,
+        on_sample: Optional[Callable[[IntervalSample], Optional[bool]]],
+    ) -> None:
+        """Wait for the runtime to pass, reporting interval rates on the way"""
+        deadline = wall_start + runtime
+        tick = status_interval if on_sample is not None and status_interval > 0 else runtime
+        last_time, last = wall_start, self._snapshot(workers)
+        while not stop.is_set():
+            now = time.perf_counter()
+            if now >= deadline:
+                return
+            stop.wait(min(tick, deadline - now))
+            if on_sample is None or status_interval <= 0:
+                continue
+            now, current = time.perf_counter(), self._snapshot(workers)
+            span = now - last_time
+            if span <= 0:
+                continue
+            sample = IntervalSample(elapsed_sec=now - wall_start)
+            for direction in ("read", "write"):
+                ios = current[direction][0] - last[direction][0]
+                setattr(sample, f"{direction}_iops", ios / span)
+                setattr(sample, f"{direction}_bw", (current[direction][1] - last[direction][1]) / span)
+                if ios:
+                    latency_ns = current[direction][2] - last[direction][2]
+                    setattr(sample, f"{direction}_latency_us", latency_ns / ios / 1000)
+            last_time, last = now, current
+            if on_sample(sample):
+                return
+
+    def _snapshot(self, workers: List[_Worker]) -> Dict[str, tuple]:
+        """Total (ios, bytes, latency ns) per direction across workers"""
+        return {
+            direction: (
+                sum(w.ios[direction] for w in workers),
+                sum(w.bytes[direction] for w in workers),
+                sum(w.latency[direction].total_ns for w in workers),
+            )
+            for direction in ("read", "write")
+        }
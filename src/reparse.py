@@ -0,0 +1,119 @@
+"""Rebuild derived result columns from archived raw fio output"""
+
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Iterable, Optional, Tuple
+
+from rich.console import Console
+
+from src.archive import RawArchive
+from src.config import BenchmarkConfig
+from src.executor import BenchmarkExecutor
+
+# Fields a reparse cannot reproduce: they describe the machine doing the
+# parsing or the run around fio rather than fio's output
+KEEP_FIELDS = ("ioengine", "status", "wall_time_sec", "target")
+
+# Rows handed to a worker process at a time
+CHUNK_SIZE = 16
+
+
+@lru_cache(maxsize=2)
+def _parser(per_job_breakdown: bool) -> BenchmarkExecutor:
+    """An executor used only for its parsing methods, one per worker process
+
+    It points at the temp directory and samples nothing, so reparsing never
+    touches a benchmark target.
+    """
+    config = BenchmarkConfig(
+        per_job_breakdown=per_job_breakdown,
+        device_stats_interval=0,
+        host_stats_interval=0,
+        archive_raw=False,
+    )
+    return BenchmarkExecutor(config, Console(quiet=True), target_dir=tempfile.gettempdir())
+
+
+def parse_archived(manifest: dict, output: str) -> Optional[dict]:
+    """Parse archived output the way the executor parsed it when it ran
+
+    Returns:
+        The result fields, or None if the output holds no usable result
+    """
+    executor = _parser(bool(manifest.get("per_job_breakdown")))
+    test_config = manifest["test_config"]
+    if manifest.get("section"):
+        result = executor._split_batch_output(output, [(manifest["section"], test_config)])[0]
+    else:
+        result = executor._parse_fio_json_output(output, test_config, allow_empty=True)
+        host = manifest.get("host")
+        if result.ok and host and host != "all":
+            hosts = result.extra.get("hosts", [])
+            result = next((r for r in hosts if r.extra["host"] == host), None)
+            if result is None:
+                return None
+    # Unusable output parses to a placeholder, which is never OK
+    if not result.ok:
+        return None
+    fields = result.to_dict()
+    fields.pop("hosts", None)
+    for field in KEEP_FIELDS:
+        fields.pop(field, None)
+    return fields
+
+
+def reparse_one(task: Tuple[int, str, str]) -> Tuple[int, Optional[dict]]:
+    """Reparse one benchmark row given as (row id, manifest digest, archive dir)"""
+    benchmark_id, digest, archive_dir = task
+    archive = RawArchive(archive_dir)
+    try:
+        manifest = archive.get_json(digest)
+        output = archive.get(manifest["output"]).decode()
+    except (OSError, ValueError, KeyError):
+        return benchmark_id, None
+    return benchmark_id, parse_archived(manifest, output)
+
+
+def reparse_history(
+    storage,
+    archive_dir: str,
+    workers: Optional[int] = None,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> Tuple[int, int]:
+    """Reparse every archived benchmark row and update its derived columns
+
+    Parsing runs in `workers` processes (default: one per CPU; 1 parses
+    in this process). Rows are written back in batches as results arrive.
+
+    Returns:
+        (rows updated, rows whose archive entry is missing or unusable)
+    """
+    rows = storage.custom_query(
+        "SELECT id, raw_output FROM benchmarks WHERE raw_output IS NOT NULL ORDER BY id"
+    )
+    tasks = [(row["id"], row["raw_output"], archive_dir) for row in rows]
+    updated = failed = 0
+    batch = []
+
+    def consume(results: Iterable[Tuple[int, Optional[dict]]]) -> None:
+        nonlocal updated, failed, batch
+        for benchmark_id, result in results:
+            if result is None:
+                failed += 1
+            else:
+                batch.append((benchmark_id, result))
+            if len(batch) >= CHUNK_SIZE * 4:
+                updated += storage.update_results(batch)
+                batch = []
+            if on_progress is not None:
+                on_progress(1)
+
+    if workers == 1 or len(tasks) <= 1:
+        consume(map(reparse_one, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            consume(pool.map(reparse_one, tasks, chunksize=CHUNK_SIZE))
+    if batch:
+        updated += storage.update_results(batch)
+    return updated, failed
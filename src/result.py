@@ -0,0 +1,217 @@
+"""Typed benchmark result records and their columnar form"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+class Status(Enum):
+    """Outcome of one test
+
+    Stored and displayed as text: "OK", "TIMED OUT", or "<KIND>: <detail>"
+    such as "FAILED: Could not create test file". Placeholders for output
+    that held no result ("Empty result", "No jobs in output") are NO_RESULT
+    and keep their text as the detail.
+    """
+
+    OK = "OK"
+    FAILED = "FAILED"
+    TIMED_OUT = "TIMED OUT"
+    ERROR = "ERROR"
+    SKIPPED = "SKIPPED"
+    NO_RESULT = "NO RESULT"
+
+    @classmethod
+    def parse(cls, text: str) -> Tuple["Status", str]:
+        """Split status text into its kind and detail"""
+        kind, _, detail = text.partition(":")
+        try:
+            return cls(kind.strip()), detail.strip()
+        except ValueError:
+            return cls.NO_RESULT, text
+
+    def text(self, detail: str = "") -> str:
+        if self is Status.NO_RESULT:
+            return detail or self.value
+        return f"{self.value}: {detail}" if detail else self.value
+
+
+# Per-direction throughput and mean latency, in fio's units (bytes/s, µs)
+NUMERIC_FIELDS = (
+    "read_iops",
+    "write_iops",
+    "read_bw",
+    "write_bw",
+    "read_latency_us",
+    "write_latency_us",
+    "io_time_sec",
+    "wall_time_sec",
+)
+
+# Columns of the frame form besides the numeric ones
+TEXT_FIELDS = ("test_type", "block_size", "cpu", "status")
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """One test's result with the fields every consumer relies on
+
+    Numeric fields are never None: fio output without a value and stored
+    rows with NULLs read as 0. Everything else a test records (percentiles,
+    sweep dimensions, target, telemetry summaries) stays in `extra`, and the
+    latency distribution from src.latency in `latency`. The per-host results
+    of a distributed run are records themselves, in `extra["hosts"]`.
+    """
+
+    test_type: str = ""
+    block_size: str = ""
+    status: Status = Status.OK
+    detail: str = ""  # Text after the status kind, e.g. the failure message
+    read_iops: float = 0.0
+    write_iops: float = 0.0
+    read_bw: float = 0.0
+    write_bw: float = 0.0
+    read_latency_us: float = 0.0
+    write_latency_us: float = 0.0
+    io_time_sec: float = 0.0
+    wall_time_sec: float = 0.0
+    cpu: str = "N/A"
+    latency: Optional[dict] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.status is Status.OK
+
+    @property
+    def status_text(self) -> str:
+        return self.status.text(self.detail)
+
+    @status_text.setter
+    def status_text(self, text: str) -> None:
+        self.status, self.detail = Status.parse(text)
+
+    @classmethod
+    def placeholder(
+        cls, test_config: dict, status: str, wall_time_sec: float = 0.0
+    ) -> "BenchmarkResult":
+        """A result without measurements for a test that did not produce one"""
+        kind, detail = Status.parse(status)
+        extra = {"ioengine": test_config["ioengine"]} if test_config.get("ioengine") else {}
+        return cls(
+            test_type=test_config["test_type"],
+            block_size=test_config["block_size"],
+            status=kind,
+            detail=detail,
+            wall_time_sec=wall_time_sec,
+            extra=extra,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "BenchmarkResult":
+        """Build a record from a result dict or a stored row
+
+        Rows written before io_time_sec existed carry runtime_sec instead.
+        """
+        extra = dict(data)
+        numbers = {name: float(extra.pop(name, None) or 0) for name in NUMERIC_FIELDS}
+        runtime_sec = extra.pop("runtime_sec", None)
+        if not numbers["io_time_sec"] and runtime_sec:
+            numbers["io_time_sec"] = float(runtime_sec)
+        status, detail = Status.parse(extra.pop("status", None) or "N/A")
+        if "hosts" in extra:
+            extra["hosts"] = [cls.from_dict(host) for host in extra["hosts"]]
+        return cls(
+            test_type=extra.pop("test_type", None) or "",
+            block_size=extra.pop("block_size", None) or "",
+            status=status,
+            detail=detail,
+            cpu=extra.pop("cpu", None) or "N/A",
+            latency=extra.pop("latency", None),
+            extra=extra,
+            **numbers,
+        )
+
+    def to_dict(self) -> dict:
+        """The flat result dict written to journals, JSON output and stored metadata"""
+        data = {
+            "test_type": self.test_type,
+            "block_size": self.block_size,
+            "status": self.status_text,
+            **{name: getattr(self, name) for name in NUMERIC_FIELDS},
+            "cpu": self.cpu,
+            **self.extra,
+        }
+        if "hosts" in data:
+            data["hosts"] = [host.to_dict() for host in data["hosts"]]
+        if self.latency is not None:
+            data["latency"] = self.latency
+        return data
+
+
+ResultLike = Union[BenchmarkResult, Mapping[str, Any]]
+
+
+def as_records(results: Iterable[ResultLike]) -> List[BenchmarkResult]:
+    """Records for a batch of results given as records or dicts"""
+    return [r if isinstance(r, BenchmarkResult) else BenchmarkResult.from_dict(r) for r in results]
+
+
+def as_dicts(results: Iterable[ResultLike]) -> List[dict]:
+    """Flat dicts for a batch of results given as records or dicts"""
+    return [r.to_dict() if isinstance(r, BenchmarkResult) else dict(r) for r in results]
+
+
+def to_columns(records: List[BenchmarkResult]) -> Dict[str, np.ndarray]:
+    """Numeric fields of a batch as float64 arrays, one per field"""
+    count = len(records)
+    return {
+        name: np.fromiter((getattr(r, name) for r in records), dtype=np.float64, count=count)
+        for name in NUMERIC_FIELDS
+    }
+
+
+def to_frame(results: Iterable[ResultLike]) -> pd.DataFrame:
+    """A batch as a DataFrame with the text and numeric columns of a record"""
+    records = as_records(results)
+    columns: Dict[str, Any] = {
+        "test_type": [r.test_type for r in records],
+        "block_size": [r.block_size for r in records],
+        "cpu": [r.cpu for r in records],
+        "status": [r.status_text for r in records],
+    }
+    columns.update(to_columns(records))
+    return pd.DataFrame(columns)
+
+
+def from_frame(frame: pd.DataFrame) -> List[BenchmarkResult]:
+    """Records from a frame; columns that are not record fields go to `extra`"""
+    count = len(frame)
+    numeric = {
+        name: (frame[name].fillna(0).to_numpy(np.float64) if name in frame else np.zeros(count))
+        for name in NUMERIC_FIELDS
+    }
+    text = {
+        name: (frame[name].to_numpy(object) if name in frame else np.full(count, None))
+        for name in TEXT_FIELDS
+    }
+    others = [name for name in frame.columns if name not in NUMERIC_FIELDS + TEXT_FIELDS]
+    extras = frame[others].to_dict("records") if others else [{} for _ in range(count)]
+    records = []
+    for i in range(count):
+        status, detail = Status.parse(text["status"][i] or "N/A")
+        records.append(
+            BenchmarkResult(
+                test_type=text["test_type"][i] or "",
+                block_size=text["block_size"][i] or "",
+                status=status,
+                detail=detail,
+                cpu=text["cpu"][i] or "N/A",
+                extra=extras[i],
+                **{name: float(values[i]) for name, values in numeric.items()},
+            )
+        )
+    return records
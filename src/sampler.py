@@ -0,0 +1,106 @@
+"""Background sampling of procfs/sysfs counters with os.pread"""
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+# Enough for every field of one stat line or a large /proc/diskstats
+READ_SIZE = 64 * 1024
+
+
+class PreadSampler(ABC):
+    """Sample procfs/sysfs counters in a background thread
+
+    Each source is opened once and re-read with os.pread at offset 0, so a
+    sample costs a few syscalls and no new file objects, keeping the sampler
+    from perturbing the benchmark it observes. Subclasses open their sources
+    and implement snapshot() and compute().
+    """
+
+    read_size = READ_SIZE
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self.samples: list = []
+        self._fds: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._prev = None
+        self._start = self._prev_time = 0.0
+
+    def _open(self, source: str, path: str) -> bool:
+        try:
+            self._fds[source] = os.open(path, os.O_RDONLY)
+        except OSError:
+            return False
+        return True
+
+    def _pread(self, source: str) -> Optional[str]:
+        fd = self._fds.get(source)
+        if fd is None:
+            return None
+        try:
+            return os.pread(fd, self.read_size, 0).decode()
+        except OSError:
+            return None
+
+    @abstractmethod
+    def snapshot(self):
+        """Current state of the sources, or None if they cannot be read"""
+        pass
+
+    @abstractmethod
+    def compute(self, prev, cur, dt: float, t_ms: int):
+        """Sample for the `dt` seconds between two snapshots"""
+        pass
+
+    def start(self) -> "PreadSampler":
+        """Take the baseline snapshot and start sampling"""
+        self._start = self._prev_time = time.monotonic()
+        self._prev = self.snapshot()
+        if self._prev is not None:
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> list:
+        """Stop sampling, close the sources and return the samples
+
+        The interval cut short by stopping is kept as a final sample unless it
+        is under a tenth of the sampling interval, too short to be meaningful.
+        """
+        if self._stop.is_set():
+            return self.samples
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            if time.monotonic() - self._prev_time >= self.interval / 10:
+                self._take_sample()
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+        return self.samples
+
+    def __enter__(self) -> "PreadSampler":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _take_sample(self) -> bool:
+        now = time.monotonic()
+        cur = self.snapshot()
+        if cur is None:
+            return False
+        self.samples.append(
+            self.compute(self._prev, cur, now - self._prev_time, int((now - self._start) * 1000))
+        )
+        self._prev, self._prev_time = cur, now
+        return True
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            if not self._take_sample():
+                return
@@ -0,0 +1,113 @@
+"""Steady-state detection for early benchmark termination"""
+
+from collections import deque
+from typing import List, Optional
+
+from src.config import BenchmarkConfig
+from src.fio_stream import IntervalSample
+
+
+def steadystate_fio_args(config: BenchmarkConfig) -> List[str]:
+    """Return FIO arguments enabling its built-in steady-state slope check"""
+    return [
+        f"--steadystate={config.ss_metric}_slope:{config.ss_slope_limit:g}%",
+        f"--ss_dur={config.ss_dur}",
+        f"--ss_ramp={config.ss_ramp}",
+    ]
+
+
+class SteadyStateDetector:
+    """Detect convergence of IOPS or bandwidth over FIO interval samples
+
+    After a ramp period, the last `window_sec` seconds of samples are checked
+    for both a flat trend and a narrow spread:
+
+    - slope: least-squares slope per second as a percentage of the mean
+    - deviation: largest distance from the mean as a percentage of the mean
+
+    The test is considered steady once both are at or below their limits.
+    """
+
+    def __init__(
+        self,
+        metric: str = "iops",
+        slope_limit_pct: float = 0.3,
+        deviation_limit_pct: float = 5.0,
+        window_sec: float = 30.0,
+        ramp_sec: float = 10.0,
+    ):
+        if metric not in ("iops", "bw"):
+            raise ValueError(f"Unknown steady-state metric: {metric}")
+        self.metric = metric
+        self.slope_limit_pct = slope_limit_pct
+        self.deviation_limit_pct = deviation_limit_pct
+        self.window_sec = window_sec
+        self.ramp_sec = ramp_sec
+        self.converged_at: Optional[float] = None
+        self.slope_pct: Optional[float] = None
+        self.deviation_pct: Optional[float] = None
+        self._window: deque = deque()
+
+    @classmethod
+    def from_config(cls, config: BenchmarkConfig) -> "SteadyStateDetector":
+        return cls(
+            metric=config.ss_metric,
+            slope_limit_pct=config.ss_slope_limit,
+            deviation_limit_pct=config.ss_deviation_limit,
+            window_sec=config.ss_dur,
+            ramp_sec=config.ss_ramp,
+        )
+
+    def add(self, sample: IntervalSample) -> bool:
+        """Add a sample, returning True once the metric has converged"""
+        if self.converged_at is not None:
+            return True
+        if sample.elapsed_sec <= self.ramp_sec:
+            return False
+
+        value = sample.total_iops if self.metric == "iops" else sample.total_bw
+        self._window.append((sample.elapsed_sec, value))
+        while self._window and self._window[0][0] < sample.elapsed_sec - self.window_sec:
+            self._window.popleft()
+
+        # Require a window that spans (almost) the full duration
+        covered = sample.elapsed_sec - self._window[0][0]
+        if len(self._window) < 3 or covered < self.window_sec * 0.9:
+            return False
+
+        times = [t for t, _ in self._window]
+        values = [v for _, v in self._window]
+        mean = sum(values) / len(values)
+        if mean <= 0:
+            return False
+
+        mean_t = sum(times) / len(times)
+        denom = sum((t - mean_t) ** 2 for t in times)
+        slope = sum((t - mean_t) * (v - mean) for t, v in zip(times, values)) / denom
+        self.slope_pct = abs(slope) / mean * 100
+        self.deviation_pct = max(abs(v - mean) for v in values) / mean * 100
+
+        if (
+            self.slope_pct <= self.slope_limit_pct
+            and self.deviation_pct <= self.deviation_limit_pct
+        ):
+            self.converged_at = sample.elapsed_sec
+            return True
+        return False
+
+
+def fio_steadystate(job: dict) -> Optional[dict]:
+    """Summarize FIO's steadystate block for a job, if present
+
+    Returns:
+        Dict with attained flag and criterion, or None without steady state
+    """
+    block = job.get("steadystate")
+    if not block:
+        return None
+    return {
+        "attained": bool(block.get("attained")),
+        "criterion": block.get("criterion", ""),
+        "slope": block.get("slope"),
+        "max_deviation": block.get("max_deviation"),
+    }
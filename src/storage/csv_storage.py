@@ -2,9 +2,11 @@
 
 import csv
 from pathlib import Path
-from typing import List
+from typing import Iterable
 from datetime import datetime
 
+from src.result import ResultLike, as_records
+
 
 class CsvStorage:
     """CSV file storage for benchmark results"""
@@ -13,7 +15,7 @@ class CsvStorage:
         self.results_dir = Path(results_dir)
         self.results_dir.mkdir(parents=True, exist_ok=True)
 
-    def save_results(self, results: List[dict], config) -> None:
+    def save_results(self, results: Iterable[ResultLike], config) -> None:
         """Save results as CSV with metadata comments"""
         timestamp = datetime.now().isoformat()
 
@@ -48,24 +50,20 @@ class CsvStorage:
                 ]
             )
 
-            for result in results:
-                # Support both old (runtime_sec) and new (io_time_sec) field names
-                io_time = result.get("io_time_sec") or result.get("runtime_sec") or 0
-                wall_time = result.get("wall_time_sec") or 0
-
+            for result in as_records(results):
                 writer.writerow(
                     [
-                        result.get("test_type", "N/A"),
-                        result.get("block_size", "N/A"),
-                        (result.get("read_iops") or 0),
-                        (result.get("write_iops") or 0),
-                        f"{(result.get('read_bw') or 0) / 1024 / 1024:.2f}",
-                        f"{(result.get('write_bw') or 0) / 1024 / 1024:.2f}",
-                        f"{(result.get('read_latency_us') or 0):.2f}",
-                        f"{(result.get('write_latency_us') or 0):.2f}",
-                        result.get("cpu", "N/A"),
-                        f"{io_time:.2f}",
-                        f"{wall_time:.2f}",
-                        result.get("status", "N/A"),
+                        result.test_type or "N/A",
+                        result.block_size or "N/A",
+                        result.read_iops,
+                        result.write_iops,
+                        f"{result.read_bw / 1024 / 1024:.2f}",
+                        f"{result.write_bw / 1024 / 1024:.2f}",
+                        f"{result.read_latency_us:.2f}",
+                        f"{result.write_latency_us:.2f}",
+                        result.cpu,
+                        f"{result.io_time_sec:.2f}",
+                        f"{result.wall_time_sec:.2f}",
+                        result.status_text,
                     ]
                 )
@@ -2,13 +2,78 @@
 
 import sqlite3
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 import json
 
+import numpy as np
+
+from src import devstats, hoststats
+from src.fio_logs import find_log_files, iter_log_samples
+from src.latency import LATENCY_KINDS, PERCENTILES, percentile_columns, percentile_field
+from src.result import ResultLike, as_records
+
+# Optional result fields stored as real columns on the benchmarks table, as
+# (column name, SQL type). Missing fields are stored as NULL.
+RESULT_COLUMNS = [
+    # Flat total-latency percentiles (read_p50_us, ..., write_p99_99_us)
+    *((column, "REAL") for column in percentile_columns("read") + percentile_columns("write")),
+    # Sweep dimensions
+    ("io_depth", "INTEGER"),
+    ("num_jobs", "INTEGER"),
+    ("rwmixread", "INTEGER"),
+    ("rate_iops", "INTEGER"),
+    ("trace", "TEXT"),
+    ("profile", "TEXT"),
+    ("workload", "TEXT"),
+    ("ioengine", "TEXT"),
+    # Benchmark target and what backs it
+    ("target", "TEXT"),
+    ("mount_point", "TEXT"),
+    ("fstype", "TEXT"),
+    ("device", "TEXT"),
+    # fio server a row was measured on; "all" for the cross-host aggregate
+    ("host", "TEXT"),
+    # Multi-file stress layout (see src.stress); the per-file breakdown is in metadata
+    ("file_count", "INTEGER"),
+    ("file_iops_spread", "REAL"),
+    # Steady-state convergence
+    ("ss_attained", "INTEGER"),
+    ("ss_converged_sec", "REAL"),
+    # Block-device telemetry averaged over the test (see src.devstats)
+    ("dev_util_pct", "REAL"),
+    ("dev_aqu_sz", "REAL"),
+    ("dev_read_await_ms", "REAL"),
+    ("dev_write_await_ms", "REAL"),
+    ("dev_read_merge_pct", "REAL"),
+    ("dev_write_merge_pct", "REAL"),
+    # fio's own CPU use and host-wide pressure and CPU cost (see src.hoststats)
+    ("usr_cpu", "REAL"),
+    ("sys_cpu", "REAL"),
+    ("host_io_some_pct", "REAL"),
+    ("host_io_full_pct", "REAL"),
+    ("host_cpu_some_pct", "REAL"),
+    ("host_cpu_busy_pct", "REAL"),
+    ("host_iowait_pct", "REAL"),
+    ("host_softirq_pct", "REAL"),
+    ("host_max_cpu_iowait_pct", "REAL"),
+    ("host_max_cpu_softirq_pct", "REAL"),
+    ("host_cpu_sec", "REAL"),
+    ("host_dirty_max_bytes", "INTEGER"),
+    ("host_writeback_max_bytes", "INTEGER"),
+    ("iops_per_cpu_sec", "REAL"),
+    # Seconds spent writing the test file before the test (run planner input)
+    ("prepare_sec", "REAL"),
+    # Manifest digest of the raw fio output in the archive (see src.archive)
+    ("raw_output", "TEXT"),
+]
+
 
 class SQLiteStorage:
     """SQLite database storage for benchmark results"""
 
+    # Rows inserted per executemany() call when ingesting interval logs
+    TIMESERIES_BATCH_SIZE = 5000
+
     def __init__(self, db_path: str):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -39,6 +104,72 @@ class SQLiteStorage:
                     metadata TEXT
                 )
             """)
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS latency_stats (
+                    benchmark_id INTEGER NOT NULL REFERENCES benchmarks(id),
+                    direction TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    min_us REAL,
+                    max_us REAL,
+                    mean_us REAL,
+                    stddev_us REAL,
+                    {", ".join(f"{percentile_field(p)}_us REAL" for p in PERCENTILES)},
+                    PRIMARY KEY (benchmark_id, direction, kind)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS latency_histograms (
+                    benchmark_id INTEGER NOT NULL REFERENCES benchmarks(id),
+                    direction TEXT NOT NULL,
+                    bin_count INTEGER,
+                    bins BLOB,
+                    PRIMARY KEY (benchmark_id, direction)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS timeseries (
+                    benchmark_id INTEGER NOT NULL REFERENCES benchmarks(id),
+                    metric TEXT NOT NULL,
+                    job INTEGER NOT NULL,
+                    direction TEXT NOT NULL,
+                    t_ms INTEGER NOT NULL,
+                    value REAL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS knee_searches (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    test_type TEXT,
+                    block_size TEXT,
+                    dimension TEXT,
+                    slo_p99_us REAL,
+                    knee_value INTEGER,
+                    knee_iops REAL,
+                    knee_p99_us REAL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS knee_points (
+                    search_id INTEGER NOT NULL REFERENCES knee_searches(id),
+                    value INTEGER NOT NULL,
+                    iops REAL,
+                    p99_us REAL,
+                    benchmark_id INTEGER REFERENCES benchmarks(id)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS calibrations (
+                    target TEXT PRIMARY KEY,
+                    seq_write_bps REAL,
+                    rand_read_iops REAL,
+                    measured_at DATETIME
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_timeseries_benchmark
+                ON timeseries(benchmark_id, metric)
+            """)
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_timestamp ON benchmarks(timestamp)
             """)
@@ -54,6 +185,12 @@ class SQLiteStorage:
                 conn.execute("ALTER TABLE benchmarks ADD COLUMN wall_time_sec REAL DEFAULT 0")
             except sqlite3.OperationalError:
                 pass  # Column already exists
+            for column, sql_type in RESULT_COLUMNS:
+                try:
+                    conn.execute(f"ALTER TABLE benchmarks ADD COLUMN {column} {sql_type}")
+                except sqlite3.OperationalError:
+                    pass  # Column already exists
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_device ON benchmarks(device)")
             # Migration: Copy runtime_sec to io_time_sec if runtime_sec exists
             try:
                 conn.execute(
@@ -63,39 +200,279 @@ class SQLiteStorage:
                 pass  # runtime_sec column doesn't exist
             conn.commit()
 
-    def save_results(self, results: List[dict], config) -> None:
-        """Save benchmark results to database"""
+    def save_results(self, results: Iterable[ResultLike], config) -> List[int]:
+        """Save benchmark results to database
+
+        Returns:
+            Row ids of the inserted benchmarks, in result order
+        """
+        mode = config.mode.value if hasattr(config.mode, "value") else str(config.mode)
+        sql = f"""
+            INSERT INTO benchmarks (
+                mode, filesize, runtime, test_type, block_size,
+                read_iops, write_iops, read_bw, write_bw,
+                read_latency_us, write_latency_us, cpu, status,
+                io_time_sec, wall_time_sec, metadata,
+                {", ".join(column for column, _ in RESULT_COLUMNS)}
+            ) VALUES ({", ".join(["?"] * (16 + len(RESULT_COLUMNS)))})
+        """
+        ids = []
         with sqlite3.connect(self.db_path) as conn:
-            for result in results:
-                conn.execute(
-                    """
-                    INSERT INTO benchmarks (
-                        mode, filesize, runtime, test_type, block_size,
-                        read_iops, write_iops, read_bw, write_bw,
-                        read_latency_us, write_latency_us, cpu, status,
-                        io_time_sec, wall_time_sec, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            for result in as_records(results):
+                extra = result.extra
+                # The latency distribution and device series live in their own tables
+                metadata = {
+                    k: v
+                    for k, v in result.to_dict().items()
+                    if k not in ("latency", "device_stats", "host_stats")
+                }
+                cursor = conn.execute(
+                    sql,
                     (
-                        config.mode.value if hasattr(config.mode, "value") else str(config.mode),
+                        mode,
                         config.filesize,
                         config.runtime,
-                        result.get("test_type", ""),
-                        result.get("block_size", ""),
-                        result.get("read_iops", 0),
-                        result.get("write_iops", 0),
-                        result.get("read_bw", 0),
-                        result.get("write_bw", 0),
-                        result.get("read_latency_us", 0),
-                        result.get("write_latency_us", 0),
-                        result.get("cpu", ""),
-                        result.get("status", ""),
-                        result.get("io_time_sec", 0),
-                        result.get("wall_time_sec", 0),
-                        json.dumps(result),
+                        result.test_type,
+                        result.block_size,
+                        result.read_iops,
+                        result.write_iops,
+                        result.read_bw,
+                        result.write_bw,
+                        result.read_latency_us,
+                        result.write_latency_us,
+                        result.cpu,
+                        result.status_text,
+                        result.io_time_sec,
+                        result.wall_time_sec,
+                        json.dumps(metadata),
+                        *(extra.get(column) for column, _ in RESULT_COLUMNS),
                     ),
                 )
+                ids.append(cursor.lastrowid)
+                if result.latency:
+                    self._save_latency(conn, cursor.lastrowid, result.latency)
+                if extra.get("log_prefix"):
+                    self._save_timeseries(conn, cursor.lastrowid, extra["log_prefix"])
+                for key, module in (("device_stats", devstats), ("host_stats", hoststats)):
+                    if extra.get(key):
+                        conn.executemany(
+                            "INSERT INTO timeseries VALUES (?, ?, 0, ?, ?, ?)",
+                            ((cursor.lastrowid, *row) for row in module.series_rows(extra[key])),
+                        )
             conn.commit()
+        return ids
+
+    def update_results(self, updates: List[Tuple[int, dict]]) -> int:
+        """Overwrite stored benchmark rows with re-derived result fields
+
+        Only fields that are columns of the benchmarks table are written; the
+        metadata JSON is merged with the new fields and the latency tables
+        are replaced.
+
+        Args:
+            updates: (benchmark id, result fields) pairs
+
+        Returns:
+            Number of rows updated
+        """
+        updated = 0
+        with sqlite3.connect(self.db_path) as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(benchmarks)")}
+            columns -= {"id", "timestamp", "metadata"}
+            for benchmark_id, result in updates:
+                row = conn.execute(
+                    "SELECT metadata FROM benchmarks WHERE id = ?", (benchmark_id,)
+                ).fetchone()
+                if row is None:
+                    continue
+                metadata = json.loads(row[0] or "{}")
+                metadata.update({k: v for k, v in result.items() if k != "latency"})
+                fields = [key for key in result if key in columns]
+                conn.execute(
+                    f"UPDATE benchmarks SET metadata = ?"
+                    f"{''.join(f', {key} = ?' for key in fields)} WHERE id = ?",
+                    (json.dumps(metadata), *(result[key] for key in fields), benchmark_id),
+                )
+                if result.get("latency"):
+                    self._save_latency(conn, benchmark_id, result["latency"])
+                updated += 1
+            conn.commit()
+        return updated
+
+    def save_knee_search(
+        self, summary: dict, points: List[Tuple[int, float, float, Optional[int]]]
+    ) -> int:
+        """Save a knee search and its latency-vs-throughput curve
+
+        Args:
+            summary: Search parameters and knee (see KneeResult.summary)
+            points: Curve as (value, iops, p99_us, benchmark_id) tuples
+
+        Returns:
+            Id of the knee search row
+        """
+        fields = [
+            "test_type",
+            "block_size",
+            "dimension",
+            "slo_p99_us",
+            "knee_value",
+            "knee_iops",
+            "knee_p99_us",
+        ]
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                f"INSERT INTO knee_searches ({', '.join(fields)}) VALUES "
+                f"({', '.join(['?'] * len(fields))})",
+                tuple(summary.get(f) for f in fields),
+            )
+            search_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT INTO knee_points VALUES (?, ?, ?, ?, ?)",
+                [(search_id, *point) for point in points],
+            )
+            conn.commit()
+        return search_id
+
+    def get_knee_searches(self, limit: int = 10) -> List[dict]:
+        """Get recent knee searches, newest first"""
+        return self.custom_query(
+            "SELECT * FROM knee_searches ORDER BY id DESC LIMIT ?",
+            (limit,),
+        )
+
+    def get_knee_points(self, search_id: int) -> List[dict]:
+        """Get the measured curve of a knee search, ordered by load"""
+        return self.custom_query(
+            "SELECT value, iops, p99_us, benchmark_id FROM knee_points "
+            "WHERE search_id = ? ORDER BY value",
+            (search_id,),
+        )
+
+    def save_calibration(self, calibration: dict) -> None:
+        """Store the disk probe result of a target, replacing an older one"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO calibrations VALUES (?, ?, ?, ?)",
+                (
+                    calibration["target"],
+                    calibration["seq_write_bps"],
+                    calibration["rand_read_iops"],
+                    calibration["measured_at"],
+                ),
+            )
+            conn.commit()
+
+    def get_calibration(self, target: str, max_age_days: int = 30) -> Optional[dict]:
+        """Get the stored disk probe result of a target unless it is too old"""
+        rows = self.custom_query(
+            "SELECT * FROM calibrations WHERE target = ? AND measured_at >= datetime('now', 'localtime', ?)",
+            (target, f"-{max_age_days} days"),
+        )
+        return rows[0] if rows else None
+
+    def _save_timeseries(self, conn: sqlite3.Connection, benchmark_id: int, log_prefix: str) -> int:
+        """Ingest FIO interval logs for one benchmark row
+
+        Log files are streamed line by line and inserted in fixed-size
+        batches, so memory use does not grow with the number of samples.
+
+        Returns:
+            Number of samples stored
+        """
+        stored = 0
+        batch = []
+        for metric, job, path in find_log_files(log_prefix):
+            for t_ms, direction, value in iter_log_samples(path, metric):
+                batch.append((benchmark_id, metric, job, direction, t_ms, value))
+                if len(batch) >= self.TIMESERIES_BATCH_SIZE:
+                    conn.executemany("INSERT INTO timeseries VALUES (?, ?, ?, ?, ?, ?)", batch)
+                    stored += len(batch)
+                    batch = []
+        if batch:
+            conn.executemany("INSERT INTO timeseries VALUES (?, ?, ?, ?, ?, ?)", batch)
+            stored += len(batch)
+        return stored
+
+    def get_timeseries(self, benchmark_id: int, metric: Optional[str] = None) -> List[dict]:
+        """Get interval samples for a benchmark row, ordered by time
+
+        Values are in result units: IOPS, bytes/s for bw, microseconds for latencies.
+        Device telemetry uses the dev_* metrics of src.devstats.SERIES_METRICS,
+        host telemetry host_* metrics named after src.hoststats.HostSample fields.
+        """
+        query = "SELECT metric, job, direction, t_ms, value FROM timeseries WHERE benchmark_id = ?"
+        params: tuple = (benchmark_id,)
+        if metric:
+            query += " AND metric = ?"
+            params += (metric,)
+        return self.custom_query(query + " ORDER BY metric, job, t_ms", params)
+
+    def _save_latency(self, conn: sqlite3.Connection, benchmark_id: int, latency: dict) -> None:
+        """Save latency summaries and clat histogram bins for one benchmark row
+
+        Histogram bins are stored as a packed int64 array of (latency_ns, count)
+        pairs to keep rows compact.
+        """
+        stat_fields = ["min_us", "max_us", "mean_us", "stddev_us"] + [
+            f"{percentile_field(p)}_us" for p in PERCENTILES
+        ]
+        for direction, distribution in latency.items():
+            for kind in LATENCY_KINDS:
+                summary = distribution.get(kind)
+                if not summary:
+                    continue
+                conn.execute(
+                    f"""
+                    INSERT OR REPLACE INTO latency_stats (
+                        benchmark_id, direction, kind, {", ".join(stat_fields)}
+                    ) VALUES ({", ".join(["?"] * (3 + len(stat_fields)))})
+                """,
+                    (benchmark_id, direction, kind, *(summary.get(f, 0) for f in stat_fields)),
+                )
+            bins = distribution.get("clat_bins")
+            if bins:
+                packed = np.asarray(bins, dtype=np.int64).tobytes()
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO latency_histograms (
+                        benchmark_id, direction, bin_count, bins
+                    ) VALUES (?, ?, ?, ?)
+                """,
+                    (benchmark_id, direction, len(bins), packed),
+                )
+
+    def get_latency_stats(self, benchmark_id: int) -> List[dict]:
+        """Get latency summaries (min/max/mean/stddev/percentiles) for a benchmark row"""
+        return self.custom_query(
+            "SELECT * FROM latency_stats WHERE benchmark_id = ? ORDER BY direction, kind",
+            (benchmark_id,),
+        )
+
+    def get_latency_histogram(
+        self, benchmark_id: int, direction: str
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Get clat histogram bins for a benchmark row
+
+        Returns:
+            Tuple of (latency_ns, count) arrays, or None if no histogram was stored
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT bins FROM latency_histograms WHERE benchmark_id = ? AND direction = ?",
+                (benchmark_id, direction),
+            ).fetchone()
+        if row is None:
+            return None
+        pairs = np.frombuffer(row[0], dtype=np.int64).reshape(-1, 2)
+        return pairs[:, 0], pairs[:, 1]
+
+    def get_device_history(self, device: str, limit: int = 10) -> List[dict]:
+        """Get recent benchmark results for one backing device or target"""
+        return self.custom_query(
+            "SELECT * FROM benchmarks WHERE device = ? OR target = ? ORDER BY id DESC LIMIT ?",
+            (device, device, limit),
+        )
 
     def get_history(self, limit: int = 10) -> List[dict]:
         """Get recent benchmark results"""
@@ -111,6 +488,15 @@ class SQLiteStorage:
             )
             return [dict(row) for row in cursor]
 
+    def get_test_history(self, target: str, filesize: str, limit: int = 500) -> List[dict]:
+        """Get the timing of recent tests on a target with a file size, newest first"""
+        return self.custom_query(
+            "SELECT test_type, block_size, status, wall_time_sec, io_time_sec, prepare_sec, "
+            "write_bw FROM benchmarks WHERE target = ? AND filesize = ? AND wall_time_sec > 0 "
+            "ORDER BY id DESC LIMIT ?",
+            (target, filesize, limit),
+        )
+
     def custom_query(self, sql: str, params: tuple = ()) -> List[dict]:
         """Execute custom SQL query"""
         with sqlite3.connect(self.db_path) as conn:
@@ -0,0 +1,163 @@
+"""Multi-file stress layouts: one fio process driving several files or devices
+
+One file cannot keep an md-RAID, an LVM stripe or a multi-disk pool busy.
+A stress layout turns every test into a single fio invocation with one job
+per file or device, so all members are driven at once and fio reports each
+job separately for a per-file breakdown. Alternatively every job can spread
+its I/O over all files (filename=a:b:c), or get a directory of many small
+files with nrfiles and openfiles for metadata-heavy workloads.
+"""
+
+import re
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from src.mountinfo import is_block_device
+
+# Names of the files and directories a layout creates in the target
+STRESS_PREFIX = "stress_"
+
+# fio file_service_type: random, roundrobin, sequential (optionally ":<ios per switch>")
+# or a skewed distribution with its parameter, such as zipf:1.2
+_FILE_SERVICE_PATTERN = re.compile(
+    r"^(?:(?:random|roundrobin|sequential)(?::\d+)?|(?:zipf|pareto|normal|gauss):[\d.]+)$"
+)
+
+
+def validate_file_service_type(spec: str) -> str:
+    """Check a fio file_service_type value
+
+    Raises:
+        ValueError: If fio would not accept it
+    """
+    if not _FILE_SERVICE_PATTERN.match(spec):
+        raise ValueError(
+            f"'{spec}' is not a file service type like random, roundrobin, "
+            "sequential or zipf:1.2"
+        )
+    return spec
+
+
+def escape_filename(path: str) -> str:
+    """Escape colons, which separate files in fio's filename option"""
+    return path.replace(":", "\\:")
+
+
+def split_filenames(value: str) -> List[str]:
+    """Files of a fio filename option, honouring escaped colons"""
+    return [name.replace("\\:", ":") for name in re.split(r"(?<!\\):", value) if name]
+
+
+@dataclass
+class StressSlot:
+    """One fio job of a multi-file test"""
+
+    name: str  # fio job name
+    paths: List[str]  # Files or devices; the job's directory when directory is set
+    directory: bool = False
+
+    def fio_args(self, nrfiles: int) -> List[str]:
+        args = [f"--name={self.name}"]
+        if self.directory:
+            args += [f"--directory={escape_filename(self.paths[0])}", f"--nrfiles={nrfiles}"]
+        else:
+            args.append(f"--filename={':'.join(escape_filename(p) for p in self.paths)}")
+        return args
+
+
+class StressLayout:
+    """The files or devices every test of a run is spread over
+
+    Paths are either given (files, block devices or, with nrfiles > 1,
+    directories) or created in the target and removed by cleanup().
+    """
+
+    def __init__(
+        self,
+        paths: List[str],
+        generated: bool = False,
+        shared: bool = False,
+        nrfiles: int = 1,
+        openfiles: int = 0,
+        file_service_type: str = "roundrobin",
+    ):
+        self.paths = paths
+        self.generated = generated
+        self.nrfiles = nrfiles
+        self.openfiles = openfiles
+        self.file_service_type = file_service_type
+        # Write tests on these need allow_device_writes like a device target
+        self.has_block_device = any(is_block_device(path) for path in paths)
+        if nrfiles > 1:
+            self.slots = [
+                StressSlot(f"dir{idx}", [path], directory=True) for idx, path in enumerate(paths)
+            ]
+        elif shared:
+            self.slots = [StressSlot("files", list(paths))]
+        else:
+            self.slots = [StressSlot(f"file{idx}", [path]) for idx, path in enumerate(paths)]
+
+    @classmethod
+    def from_config(cls, config, target_dir: Path) -> Optional["StressLayout"]:
+        """The layout a configuration asks for, None without stress options"""
+        if config.stress_targets:
+            paths, generated = list(config.stress_targets), False
+        elif config.stress_files > 0:
+            paths = [f"{target_dir / STRESS_PREFIX}{idx}" for idx in range(config.stress_files)]
+            generated = True
+        else:
+            return None
+        return cls(
+            paths,
+            generated=generated,
+            shared=config.stress_shared,
+            nrfiles=config.stress_nrfiles,
+            openfiles=config.stress_openfiles,
+            file_service_type=config.file_service_type,
+        )
+
+    @property
+    def file_count(self) -> int:
+        """Files fio does I/O on per worker"""
+        return len(self.paths) * self.nrfiles
+
+    def fio_args(self) -> List[str]:
+        """Arguments replacing --name and --filename of a single-file command
+
+        They go last: options before the first --name are global to every
+        job, the job sections follow.
+        """
+        args = [f"--file_service_type={self.file_service_type}"]
+        if self.openfiles > 0:
+            args.append(f"--openfiles={self.openfiles}")
+        for slot in self.slots:
+            args.extend(slot.fio_args(self.nrfiles))
+        return args
+
+    def layout_bytes(self, file_bytes: int, num_jobs: int = 1) -> int:
+        """Bytes fio writes laying out generated files before a read test
+
+        A job's size is split over its files; the workers of a job share its
+        files, except in a directory where each worker gets its own set.
+        """
+        if not self.generated:
+            return 0
+        return len(self.slots) * file_bytes * (num_jobs if self.nrfiles > 1 else 1)
+
+    def prepare(self) -> None:
+        """Create the directories of a small-file layout"""
+        if self.nrfiles > 1:
+            for path in self.paths:
+                Path(path).mkdir(parents=True, exist_ok=True)
+
+    def cleanup(self) -> None:
+        """Remove generated files and directories; given paths are kept"""
+        if not self.generated:
+            return
+        for path in map(Path, self.paths):
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.exists():
+                path.unlink()
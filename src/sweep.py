@@ -0,0 +1,77 @@
+"""Parameter sweep expansion over iodepth, numjobs, block size and rwmixread"""
+
+import itertools
+import json
+from pathlib import Path
+from typing import List
+
+from src.config import BenchmarkConfig
+
+# Dimensions a sweep point may set; each is stored as its own result column
+SWEEP_DIMENSIONS = ("test_type", "block_size", "io_depth", "num_jobs", "rwmixread")
+
+# Test types with a read/write mix, the only ones rwmixread applies to
+MIXED_TEST_TYPES = ("randrw", "rw", "readwrite")
+
+
+def expand_grid(
+    test_types: List[str],
+    block_sizes: List[str],
+    io_depths: List[int],
+    num_jobs: List[int],
+    rwmixread: List[int],
+) -> List[dict]:
+    """Expand the cartesian product of sweep dimensions into test configs
+
+    rwmixread only varies for mixed test types; pure read or write tests get
+    one point per remaining combination.
+    """
+    configs = []
+    seen = set()
+    for test_type, block_size, depth, jobs, mix in itertools.product(
+        test_types, block_sizes, io_depths, num_jobs, rwmixread or [None]
+    ):
+        point = {"test_type": test_type, "block_size": block_size, "io_depth": depth}
+        point["num_jobs"] = jobs
+        if test_type in MIXED_TEST_TYPES and mix is not None:
+            point["rwmixread"] = mix
+        key = tuple(sorted(point.items()))
+        if key not in seen:
+            seen.add(key)
+            configs.append(point)
+    return configs
+
+
+def load_grid(path: str) -> List[dict]:
+    """Load a user-defined list of sweep points from a JSON file
+
+    The file holds a list of objects using SWEEP_DIMENSIONS as keys;
+    test_type and block_size are required, the rest default to the config.
+    """
+    with open(Path(path), "r") as f:
+        points = json.load(f)
+    if not isinstance(points, list):
+        raise ValueError(f"Sweep grid {path} must contain a list of points")
+
+    configs = []
+    for idx, point in enumerate(points):
+        unknown = set(point) - set(SWEEP_DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Sweep point {idx} has unknown keys: {', '.join(sorted(unknown))}")
+        if "test_type" not in point or "block_size" not in point:
+            raise ValueError(f"Sweep point {idx} needs test_type and block_size")
+        configs.append(dict(point))
+    return configs
+
+
+def sweep_configs(config: BenchmarkConfig) -> List[dict]:
+    """Return the test configs for a sweep run"""
+    if config.sweep_grid_file:
+        return load_grid(config.sweep_grid_file)
+    return expand_grid(
+        config.sweep_test_types or ["randread"],
+        config.sweep_block_sizes or [config.block_size],
+        config.sweep_io_depths or [config.io_depth],
+        config.sweep_num_jobs or [config.num_jobs],
+        config.sweep_rwmixread,
+    )
@@ -0,0 +1,158 @@
+"""Prepared test-file pool shared by read benchmarks"""
+
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from src.config import parse_filesize_to_bytes
+
+# fio arguments that produce each supported fill pattern
+FILL_PATTERNS: Dict[str, list] = {
+    "random": [],
+    "zero": ["--zero_buffers"],
+}
+
+POOL_DIR_NAME = ".disk_io_bm_pool"
+
+
+class PreparedFilePool:
+    """Pool of prepared test files keyed by (target dir, filesize, fill pattern)
+
+    Read benchmarks only need a fully written file of the right size; the
+    access pattern does not matter for its contents. Sharing one prepared
+    file between all read tests avoids rewriting it for every test. A
+    manifest next to the files records what each one was prepared with so
+    stale or truncated files are detected and rebuilt.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, target_dir: Path, persistent: bool = False):
+        self.target_dir = Path(target_dir)
+        self.root = self.target_dir / POOL_DIR_NAME
+        self.persistent = persistent
+
+    def path_for(self, filesize: str, pattern: str) -> Path:
+        """Return the path a prepared file with these parameters lives at"""
+        return self.root / f"prepared_{filesize}_{pattern}.dat"
+
+    def _load_manifest(self) -> dict:
+        manifest_path = self.root / self.MANIFEST
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_manifest(self, manifest: dict) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.root / (self.MANIFEST + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        tmp_path.replace(self.root / self.MANIFEST)
+
+    def validate(self, filesize: str, pattern: str) -> bool:
+        """Check that a prepared file exists and matches its manifest entry"""
+        path = self.path_for(filesize, pattern)
+        entry = self._load_manifest().get(path.name)
+        if not entry or not path.exists():
+            return False
+
+        stat = path.stat()
+        return (
+            entry.get("size_bytes") == parse_filesize_to_bytes(filesize)
+            and stat.st_size >= entry["size_bytes"]
+            and entry.get("pattern") == pattern
+            and entry.get("mtime") == stat.st_mtime
+        )
+
+    def get(self, filesize: str, pattern: str = "random") -> Optional[Path]:
+        """Return the prepared file if it is present and valid"""
+        if self.validate(filesize, pattern):
+            return self.path_for(filesize, pattern)
+        return None
+
+    def acquire(
+        self,
+        filesize: str,
+        pattern: str,
+        create: Callable[[Path, str], bool],
+    ) -> Optional[Path]:
+        """Return a valid prepared file, creating it with `create` if needed
+
+        Args:
+            filesize: fio size string of the file
+            pattern: Fill pattern name (see FILL_PATTERNS)
+            create: Callable writing the file at the given path with the given
+                pattern, returning True on success
+
+        Returns:
+            Path of the prepared file, or None if it could not be created
+        """
+        if pattern not in FILL_PATTERNS:
+            raise ValueError(f"Unknown fill pattern: {pattern}")
+
+        existing = self.get(filesize, pattern)
+        if existing is not None:
+            return existing
+
+        path = self.path_for(filesize, pattern)
+        self.root.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()
+
+        if not create(path, pattern) or not path.exists():
+            return None
+
+        manifest = self._load_manifest()
+        manifest[path.name] = {
+            "size_bytes": parse_filesize_to_bytes(filesize),
+            "pattern": pattern,
+            "created": time.time(),
+            "mtime": path.stat().st_mtime,
+        }
+        self._save_manifest(manifest)
+        return path
+
+    def contains(self, path: Path) -> bool:
+        """Check whether a path belongs to this pool"""
+        return Path(path).parent == self.root
+
+    def evict(self, filesize: Optional[str] = None, pattern: Optional[str] = None) -> int:
+        """Remove prepared files matching the given filters
+
+        Returns:
+            Number of files removed
+        """
+        manifest = self._load_manifest()
+        removed = 0
+        for name, entry in list(manifest.items()):
+            if filesize is not None and name != self.path_for(filesize, entry["pattern"]).name:
+                continue
+            if pattern is not None and entry.get("pattern") != pattern:
+                continue
+            path = self.root / name
+            if path.exists():
+                path.unlink()
+            del manifest[name]
+            removed += 1
+
+        if manifest:
+            self._save_manifest(manifest)
+        elif self.root.exists():
+            manifest_path = self.root / self.MANIFEST
+            if manifest_path.exists():
+                manifest_path.unlink()
+            try:
+                self.root.rmdir()
+            except OSError:
+                pass  # Directory holds files not tracked by the pool
+        return removed
+
+    def release(self) -> None:
+        """Evict all prepared files unless the pool persists across runs"""
+        if not self.persistent:
+            self.evict()
@@ -0,0 +1,203 @@
+"""I/O trace conversion and fio iolog replay helpers"""
+
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, TextIO
+
+# CSV op spellings mapped to fio iolog actions
+TRACE_OPS = {
+    "r": "read",
+    "read": "read",
+    "w": "write",
+    "write": "write",
+    "t": "trim",
+    "d": "trim",  # discard
+    "trim": "trim",
+    "discard": "trim",
+    "s": "sync",
+    "f": "sync",  # flush
+    "sync": "sync",
+    "flush": "sync",
+}
+
+# Factor converting CSV timestamps to microseconds
+TIME_UNITS = {"s": 1_000_000.0, "ms": 1000.0, "us": 1.0, "ns": 0.001}
+
+IOLOG_V2_HEADER = "fio version 2 iolog"
+IOLOG_V3_HEADER = "fio version 3 iolog"
+
+# fio drops wait entries shorter than this (microseconds)
+MIN_WAIT_US = 100
+
+# Name used inside converted iologs; replay_redirect points it at the test file
+TRACE_FILENAME = "trace.dat"
+
+
+@dataclass
+class TraceRecord:
+    """One I/O of a trace"""
+
+    timestamp_us: float
+    op: str  # fio iolog action: read, write, trim or sync
+    offset: int
+    length: int
+
+
+def detect_format(path: str) -> str:
+    """Return "iolog2", "iolog3" or "csv" for a trace file"""
+    with open(path, "r") as f:
+        first = f.readline().strip()
+    if first == IOLOG_V2_HEADER:
+        return "iolog2"
+    if first == IOLOG_V3_HEADER:
+        return "iolog3"
+    return "csv"
+
+
+def read_csv_trace(path: str, time_unit: str = "us") -> Iterator[TraceRecord]:
+    """Stream records from a CSV trace with columns offset, length, op, timestamp
+
+    A header row is optional. Offsets and lengths are in bytes; timestamps
+    use `time_unit` and may start anywhere, they are made relative to the
+    first record.
+    """
+    if time_unit not in TIME_UNITS:
+        raise ValueError(f"Unknown time unit: {time_unit}")
+    factor = TIME_UNITS[time_unit]
+    start = None
+    with open(path, "r", newline="") as f:
+        for line_no, row in enumerate(csv.reader(f), 1):
+            if not row or row[0].lstrip().startswith("#"):
+                continue
+            try:
+                offset, length = int(row[0]), int(row[1])
+                timestamp = float(row[3]) * factor
+            except (ValueError, IndexError):
+                if line_no == 1:
+                    continue  # Header
+                raise ValueError(f"{path}:{line_no}: malformed trace row {row!r}")
+            op = TRACE_OPS.get(row[2].strip().lower())
+            if op is None:
+                raise ValueError(f"{path}:{line_no}: unknown op {row[2]!r}")
+            if start is None:
+                start = timestamp
+            yield TraceRecord(timestamp - start, op, offset, length)
+
+
+def write_iolog(records: Iterable[TraceRecord], out: TextIO, filename: str = TRACE_FILENAME) -> int:
+    """Write records as a fio version 2 iolog
+
+    Timing is kept with `wait` entries, which fio interprets as microseconds
+    since the previous wait. Gaps below fio's 100us resolution are carried
+    over to the next wait instead of being dropped.
+
+    Returns:
+        Number of I/O records written
+    """
+    out.write(f"{IOLOG_V2_HEADER}\n{filename} add\n{filename} open\n")
+    count = 0
+    waited_us = 0.0
+    for record in records:
+        gap = record.timestamp_us - waited_us
+        if gap >= MIN_WAIT_US:
+            # iolog v2 action lines always have four fields; fio rejects shorter ones
+            out.write(f"{filename} wait {int(gap)} 0\n")
+            waited_us += int(gap)
+        if record.op == "sync":
+            out.write(f"{filename} sync 0 0\n")
+        else:
+            out.write(f"{filename} {record.op} {record.offset} {record.length}\n")
+        count += 1
+    out.write(f"{filename} close\n")
+    return count
+
+
+def convert_trace(src: str, dst: str, time_unit: str = "us") -> int:
+    """Normalize a CSV trace into a fio iolog
+
+    Returns:
+        Number of I/O records written
+    """
+    Path(dst).parent.mkdir(parents=True, exist_ok=True)
+    with open(dst, "w") as out:
+        return write_iolog(read_csv_trace(src, time_unit), out)
+
+
+def converted_path(trace: str, cache_dir: str) -> str:
+    """Where iolog_for keeps a trace's conversion; fio iologs are their own path"""
+    if detect_format(trace) != "csv":
+        return trace
+    return str(Path(cache_dir) / f"{Path(trace).stem}.iolog")
+
+
+def iolog_for(trace: str, cache_dir: str, time_unit: str = "us") -> str:
+    """Return an iolog path fio can replay for a trace
+
+    fio iologs are used as-is; CSV traces are converted into `cache_dir`
+    once and reconverted only when the source changes.
+    """
+    dst = Path(converted_path(trace, cache_dir))
+    if dst == Path(trace):
+        return trace
+    if (
+        not dst.exists()
+        or dst.stat().st_mtime < Path(trace).stat().st_mtime
+        or _has_short_wait(dst)
+    ):
+        convert_trace(trace, str(dst), time_unit)
+    return str(dst)
+
+
+def _has_short_wait(iolog: Path) -> bool:
+    """Whether a cached conversion has 3-field wait lines, which fio skips"""
+    with open(iolog, "r") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) > 1 and fields[1] == "wait":
+                return len(fields) != 4
+    return False
+
+
+def trace_span(trace: str, time_unit: str = "us") -> int:
+    """Highest byte a trace touches, read from a CSV trace without converting it"""
+    if detect_format(trace) != "csv":
+        return iolog_span(trace)
+    return max((r.offset + r.length for r in read_csv_trace(trace, time_unit)), default=0)
+
+
+def iolog_span(path: str) -> int:
+    """Return the highest byte an iolog touches (offset + length)
+
+    Handles version 2 (`file action offset length`) and version 3
+    (`timestamp file action offset length`) entries.
+    """
+    span = 0
+    with open(path, "r") as f:
+        for line in f:
+            fields: List[str] = line.split()
+            if len(fields) == 5:
+                fields = fields[1:]
+            if len(fields) != 4 or fields[1] not in ("read", "write", "trim"):
+                continue
+            try:
+                span = max(span, int(fields[2]) + int(fields[3]))
+            except ValueError:
+                continue
+    return span
+
+
+def replay_fio_args(iolog: str, time_scale: int = 100, no_stall: bool = False) -> List[str]:
+    """Return FIO arguments replaying an iolog
+
+    Args:
+        iolog: fio iolog (v2 or v3)
+        time_scale: Replay rate in percent of the recorded timing (200 = twice as fast)
+        no_stall: Ignore recorded timing and issue I/O as fast as possible
+    """
+    args = [f"--read_iolog={iolog}"]
+    if no_stall:
+        args.append("--replay_no_stall=1")
+    elif time_scale != 100:
+        args.append(f"--replay_time_scale={time_scale}")
+    return args
@@ -0,0 +1,132 @@
+"""Tests for the raw output archive and reparsing"""
+
+import json
+import subprocess
+
+from src.archive import RawArchive
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+from src.reparse import parse_archived, reparse_history
+from src.storage import SQLiteStorage
+
+
+def fio_job(name: str, read_iops: float) -> dict:
+    side = {"iops": read_iops, "bw": read_iops * 4, "io_bytes": 4096, "runtime": 1000}
+    return {
+        "jobname": name,
+        "job_runtime": 1000,
+        "read": side,
+        "write": {"iops": 0, "bw": 0, "io_bytes": 0, "runtime": 0},
+    }
+
+
+def test_put_get_roundtrip(tmp_path):
+    """Test identical content is stored once, compressed, under its digest"""
+    archive = RawArchive(str(tmp_path))
+    data = b"fio output " * 1000
+    digest = archive.put(data)
+    assert archive.put(data) == digest
+    assert digest in archive
+    assert archive.get(digest) == data
+    assert archive.path_for(digest).stat().st_size < len(data)
+    assert len(list(tmp_path.rglob("*.gz"))) == 1
+
+
+def test_archive_test_with_logs(tmp_path):
+    """Test the manifest links the output and the test's interval logs"""
+    archive = RawArchive(str(tmp_path / "archive"))
+    prefix = tmp_path / "logs" / "randread_4k"
+    prefix.parent.mkdir()
+    (tmp_path / "logs" / "randread_4k_lat.1.log").write_text("1000, 250, 0, 4096, 0\n")
+    test_config = {"test_type": "randread", "block_size": "4k", "log_prefix": str(prefix)}
+
+    manifest = archive.get_json(archive.archive_test("{}", test_config, host="h1"))
+    assert manifest["host"] == "h1"
+    assert archive.get(manifest["output"]) == b"{}"
+    [(name, digest)] = manifest["logs"].items()
+    assert name == "randread_4k_lat.1.log"
+    assert archive.get(digest).startswith(b"1000, 250")
+
+
+def test_parse_archived_section_and_host():
+    """Test batch sections and fio server hosts are picked out again"""
+    test_config = {"test_type": "randread", "block_size": "4k", "num_jobs": 1}
+    output = json.dumps({"jobs": [fio_job("a", 100), fio_job("b", 200)]})
+    result = parse_archived({"test_config": test_config, "section": "b"}, output)
+    assert result["read_iops"] == 200
+    assert "status" not in result
+
+    hosts = json.dumps(
+        {
+            "client_stats": [
+                dict(fio_job("t", 300), hostname="h1"),
+                dict(fio_job("t", 500), hostname="h2"),
+                dict(fio_job("All clients", 800), hostname="all"),
+            ]
+        }
+    )
+    manifest = {"test_config": test_config, "host": "h2"}
+    assert parse_archived(manifest, hosts)["read_iops"] == 500
+    assert parse_archived(dict(manifest, host="h3"), hosts) is None
+    assert parse_archived({"test_config": test_config}, "not json") is None
+
+
+def test_reparse_restores_rows(tmp_path):
+    """Test reparsing rebuilds derived columns from the archive alone"""
+    archive_dir = str(tmp_path / "archive")
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL,
+        test_types=["randread", "write"],
+        block_sizes=["4k"],
+        runtime=1,
+        filesize="1M",
+        python_engine=True,
+        status_interval=0,
+        archive_raw=True,
+        archive_dir=archive_dir,
+    )
+    results = BenchmarkExecutor(config, target_dir=str(tmp_path)).run_all_tests()
+    assert all(r.extra["raw_output"] in RawArchive(archive_dir) for r in results)
+
+    storage = SQLiteStorage(str(tmp_path / "test.db"))
+    ids = storage.save_results(results, config)
+    query = "SELECT id, read_iops, write_bw, read_p99_us, ioengine FROM benchmarks ORDER BY id"
+    original = storage.custom_query(query)
+
+    for workers in (1, None):
+        storage.custom_query("UPDATE benchmarks SET read_iops = 0, write_bw = 0, read_p99_us = 0")
+        assert reparse_history(storage, archive_dir, workers=workers) == (2, 0)
+        assert storage.custom_query(query) == original
+
+    storage.custom_query(f"UPDATE benchmarks SET raw_output = 'missing' WHERE id = {ids[0]}")
+    assert reparse_history(storage, archive_dir, workers=1) == (1, 1)
+
+
+def test_archive_is_opt_in(tmp_path, monkeypatch):
+    """Test library runs leave no archive behind and client rows get a manifest each"""
+    hosts = json.dumps(
+        {
+            "client_stats": [
+                dict(fio_job("t01_randread_4k", 300), hostname="h1"),
+                dict(fio_job("t01_randread_4k", 500), hostname="h2"),
+                dict(fio_job("All clients", 800), hostname="all"),
+            ]
+        }
+    )
+    monkeypatch.setattr(
+        "src.executor.subprocess.run",
+        lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, hosts, ""),
+    )
+    monkeypatch.chdir(tmp_path)
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL, test_types=["randread"], block_sizes=["4k"], clients=["a", "b"]
+    )
+    results = BenchmarkExecutor(config, target_dir=str(tmp_path)).run_distributed()
+    assert all("raw_output" not in r.extra for r in results)
+    assert not (tmp_path / "results").exists()
+
+    config.archive_raw = True
+    config.archive_dir = str(tmp_path / "archive")
+    results = BenchmarkExecutor(config, target_dir=str(tmp_path)).run_distributed()
+    # Each row links its own manifest over the one shared raw output
+    assert len({r.extra["raw_output"] for r in results}) == 3
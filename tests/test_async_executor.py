@@ -0,0 +1,168 @@
+"""Tests for the asyncio multi-target executor"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from src.async_executor import AsyncBenchmarkExecutor, device_key
+from src.checkpoint import CheckpointJournal
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+from src.prepare import FillReport
+from src.result import Status
+
+FIO_OUTPUT = json.dumps(
+    {
+        "jobs": [
+            {
+                "read": {},
+                "write": {"iops": 500.0, "bw_bytes": 2048000, "lat_ns": {"mean": 1000.0}},
+                "job_runtime": 1000,
+            }
+        ]
+    }
+)
+
+
+def _config():
+    return BenchmarkConfig(mode=Mode.INDIVIDUAL, test_types=["randwrite"], block_sizes=["4k"])
+
+
+def _targets(tmp_path, count):
+    targets = []
+    for idx in range(count):
+        target = tmp_path / f"t{idx}"
+        target.mkdir()
+        targets.append(str(target))
+    return targets
+
+
+def _track_concurrency(monkeypatch):
+    """Replace FIO with a short sleep that records overlapping runs"""
+    active = []
+    peak = {"all": 0}
+
+    async def fake_exec(self, cmd, timeout):
+        filename = next(arg for arg in cmd if arg.startswith("--filename="))
+        active.append(filename)
+        peak["all"] = max(peak["all"], len(active))
+        await asyncio.sleep(0.05)
+        active.remove(filename)
+        return 0, FIO_OUTPUT, ""
+
+    monkeypatch.setattr(AsyncBenchmarkExecutor, "_exec_fio", fake_exec)
+    return peak
+
+
+def test_async_targets_on_one_device_are_serialized(tmp_path, monkeypatch):
+    """Test targets sharing a device never run FIO at the same time"""
+    peak = _track_concurrency(monkeypatch)
+    targets = _targets(tmp_path, 3)
+    assert len({device_key(t) for t in targets}) == 1
+
+    results = AsyncBenchmarkExecutor(_config(), targets).run_all_tests()
+
+    assert peak["all"] == 1
+    assert [r.extra["target"] for r in results] == targets
+    assert all(r.ok and r.write_iops == 500.0 for r in results)
+
+
+def test_async_global_concurrency_limit(tmp_path, monkeypatch):
+    """Test the semaphore caps concurrent FIO runs across devices"""
+    peak = _track_concurrency(monkeypatch)
+    targets = _targets(tmp_path, 4)
+    monkeypatch.setattr("src.async_executor.device_key", lambda target: target)
+
+    AsyncBenchmarkExecutor(_config(), targets, max_concurrency=2).run_all_tests()
+    assert peak["all"] == 2
+
+
+def test_async_timeout_kills_process_group(tmp_path):
+    """Test a timeout terminates FIO and the processes it forked"""
+    executor = AsyncBenchmarkExecutor(_config(), _targets(tmp_path, 1))
+    marker = tmp_path / "survived"
+    cmd = ["sh", "-c", f"(sleep 1; touch {marker}) & sleep 30"]
+
+    start = time.time()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(executor._exec_fio(cmd, timeout=0.2))
+    assert time.time() - start < 5
+    time.sleep(1.2)
+    assert not marker.exists()
+
+
+def test_async_timeout_result(tmp_path, monkeypatch):
+    """Test a timed-out test is reported instead of aborting the suite"""
+
+    async def slow_exec(self, cmd, timeout):
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(AsyncBenchmarkExecutor, "_exec_fio", slow_exec)
+    results = AsyncBenchmarkExecutor(_config(), _targets(tmp_path, 1)).run_all_tests()
+    assert results[0].status is Status.TIMED_OUT
+
+
+def test_async_run_is_journaled_and_resumed(tmp_path, monkeypatch):
+    """Test completed tests are journaled per target and skipped on resume"""
+    _track_concurrency(monkeypatch)
+    targets = _targets(tmp_path, 2)
+    config = _config()
+    config.test_types = ["randwrite", "write"]
+    config.run_id, config.checkpoint_dir = "run1", str(tmp_path / "checkpoints")
+    first = AsyncBenchmarkExecutor(config, targets).run_all_tests()
+    assert len(CheckpointJournal(config.checkpoint_dir, "run1").load()) == 4
+
+    ran = []
+
+    async def counting_exec(self, cmd, timeout):
+        ran.append(cmd)
+        return 0, FIO_OUTPUT, ""
+
+    monkeypatch.setattr(AsyncBenchmarkExecutor, "_exec_fio", counting_exec)
+    resumed = AsyncBenchmarkExecutor(config, targets).run_all_tests()
+    assert ran == []
+    assert [(r.extra["target"], r.test_type) for r in resumed] == [
+        (r.extra["target"], r.test_type) for r in first
+    ]
+
+
+class _FakeSampler:
+    """Device sampler stand-in recording whether it was stopped"""
+
+    def __init__(self):
+        self.samples = []
+        self.queue = {}
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+        return [object()]
+
+    def summary(self):
+        return {"device_util_pct": 42.0}
+
+
+def test_async_records_telemetry_and_prepare_time(tmp_path, monkeypatch):
+    """Test samplers run around each test and read file preparation is timed"""
+    _track_concurrency(monkeypatch)
+    samplers = []
+
+    def start_samplers(self):
+        samplers.append(_FakeSampler())
+        return {"device": samplers[-1]}
+
+    def acquire_read_file(self, timeout):
+        self.fill_reports.append(FillReport("fio", 1024, 1.5))
+        return self.temp_dir / "prepared.dat"
+
+    monkeypatch.setattr(BenchmarkExecutor, "_start_samplers", start_samplers)
+    monkeypatch.setattr(BenchmarkExecutor, "_acquire_read_file", acquire_read_file)
+    config = _config()
+    config.test_types = ["randread", "randwrite"]
+    results = AsyncBenchmarkExecutor(config, _targets(tmp_path, 1)).run_all_tests()
+
+    assert [r.extra["device_util_pct"] for r in results] == [42.0, 42.0]
+    assert all(sampler.stopped for sampler in samplers)
+    assert results[0].extra["prepare_sec"] == 1.5
+    assert "prepare_sec" not in results[1].extra
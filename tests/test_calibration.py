@@ -0,0 +1,94 @@
+"""Tests for the calibration probe and calibrated timeouts"""
+
+import json
+import subprocess
+
+import pytest
+from src.calibration import Calibration, run_probe
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor, _calculate_timeout
+from src.pyengine import PythonEngine
+from src.storage import SQLiteStorage
+
+GB = 1024**3
+
+
+def fio_output(direction: str, bw: float, iops: float, io_bytes: int) -> str:
+    stats = {"bw_bytes": bw, "iops": iops, "io_bytes": io_bytes}
+    return json.dumps({"jobs": [{direction: stats}]})
+
+
+def test_calibrated_timeout():
+    """Test timeouts follow the measured write speed instead of 10 MB/s"""
+    config = BenchmarkConfig(filesize="10G", runtime=300)
+    assert _calculate_timeout(config) == 300 + 1024 + 60
+
+    nvme = Calibration(target="/mnt/nvme", seq_write_bps=2 * GB)
+    # 10G at half of 2 GB/s
+    assert _calculate_timeout(config, nvme) == 300 + 10 + 60
+
+    throttled = Calibration(target="/mnt/ebs", seq_write_bps=5 * 1024 * 1024)
+    assert _calculate_timeout(config, throttled) == 300 + 4096 + 60
+
+    assert _calculate_timeout(BenchmarkConfig(timeout=42), nvme) == 42
+
+
+def test_run_probe_with_fio(tmp_path):
+    """Test the read pass covers only what the write pass wrote"""
+    commands = []
+
+    def runner(cmd, **kwargs):
+        commands.append(cmd)
+        if "--rw=write" in cmd:
+            return subprocess.CompletedProcess(cmd, 0, fio_output("write", 100e6, 95, 300e6), "")
+        return subprocess.CompletedProcess(cmd, 0, fio_output("read", 20e6, 5000, 60e6), "")
+
+    calibration = run_probe(tmp_path / "probe", "/mnt/x", runner=runner)
+    assert calibration.seq_write_bps == 100e6
+    assert calibration.rand_read_iops == 5000
+    assert "--size=268435456" in commands[1]
+
+
+def test_run_probe_failure(tmp_path):
+    """Test a probe without output yields no calibration"""
+
+    def runner(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, 1, "", "error")
+
+    assert run_probe(tmp_path / "probe", "/mnt/x", runner=runner) is None
+
+
+def test_run_probe_python_engine(tmp_path):
+    """Test the Python engine can run the probe and the file is removed"""
+    calibration = run_probe(
+        tmp_path / "probe", str(tmp_path), engine=PythonEngine(direct=False), runtime=1
+    )
+    assert calibration.seq_write_bps > 0
+    assert calibration.rand_read_iops > 0
+    assert not (tmp_path / "probe").exists()
+
+
+def test_calibration_cached_per_target(tmp_path):
+    """Test a stored calibration is reused instead of probing again"""
+    storage = SQLiteStorage(str(tmp_path / "test.db"))
+    executor = BenchmarkExecutor(BenchmarkConfig(), target_dir=str(tmp_path))
+    target = executor.target_info["target"]
+    storage.save_calibration(
+        Calibration(target, 1e9, 1e5, measured_at="2099-01-01 00:00:00").to_dict()
+    )
+    assert storage.get_calibration("/elsewhere") is None
+
+    calibration = executor.calibrate(storage)
+    assert calibration.seq_write_bps == 1e9
+    assert executor.calibration is calibration
+
+
+def test_calibrated_estimate(tmp_path):
+    """Test the estimate adds read-file creation once at the measured speed"""
+    config = BenchmarkConfig(mode=Mode.TEST, runtime=60, filesize="1G")
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    configs = executor._get_test_configs()
+    assert executor._estimate_total_seconds(configs) == pytest.approx(3 * 60 * 1.1)
+
+    executor.calibration = Calibration(str(tmp_path), seq_write_bps=GB / 8)
+    assert executor._estimate_total_seconds(configs) == 3 * (60 + 2) + 8
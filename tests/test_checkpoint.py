@@ -0,0 +1,91 @@
+"""Tests for the per-test checkpoint journal"""
+
+import pytest
+from src.checkpoint import CheckpointJournal, config_key, run_settings
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+from src.result import BenchmarkResult
+
+
+def test_journal_roundtrip(tmp_path):
+    """Test recorded results are loaded back keyed by their config"""
+    journal = CheckpointJournal(str(tmp_path), "run1")
+    assert not journal.exists()
+    tc = {"test_type": "randread", "block_size": "4k"}
+    journal.record(tc, {"status": "OK", "read_iops": 1000})
+
+    done = journal.load()
+    assert done[config_key(tc)]["read_iops"] == 1000
+    # Log prefixes differ between attempts and do not change identity
+    assert config_key(dict(tc, log_prefix="results/logs/x")) in done
+
+
+def test_journal_ignores_truncated_entry(tmp_path):
+    """Test an entry cut off by a crash is skipped"""
+    journal = CheckpointJournal(str(tmp_path), "run1")
+    journal.record({"test_type": "read", "block_size": "1M"}, {"status": "OK"})
+    with open(journal.path, "a") as f:
+        f.write('{"config": {"test_type": "wri')
+    assert len(journal.load()) == 1
+
+    journal.remove()
+    assert not journal.exists()
+
+
+def test_journal_refuses_other_settings(tmp_path):
+    """Test the header written with the first entry guards a resume"""
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL, test_types=["read"], block_sizes=["1M"], filesize="1G", runtime=60
+    )
+    journal = CheckpointJournal(str(tmp_path), "run1", run_settings(config))
+    journal.record({"test_type": "read", "block_size": "1M"}, {"status": "OK"})
+    assert len(journal.load()) == 1
+    journal.check()
+
+    config.filesize, config.direct_io = "4G", False
+    resumed = CheckpointJournal(str(tmp_path), "run1", run_settings(config))
+    assert resumed.differences() == {"filesize": ("1G", "4G"), "direct_io": (True, False)}
+    with pytest.raises(ValueError, match="filesize '1G' -> '4G'"):
+        resumed.check()
+
+    config.run_id, config.checkpoint_dir = "run1", str(tmp_path)
+    with pytest.raises(ValueError):
+        BenchmarkExecutor(config, target_dir=str(tmp_path)).run_all_tests()
+    # Journals from before the header and unchecked readers see no difference
+    assert CheckpointJournal(str(tmp_path), "run1").differences() == {}
+
+
+def test_executor_resume_skips_completed_tests(tmp_path, monkeypatch):
+    """Test a resumed run only executes missing or failed tests and keeps suite order"""
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL,
+        test_types=["randread", "randwrite", "read"],
+        block_sizes=["4k"],
+        run_id="run1",
+        checkpoint_dir=str(tmp_path),
+    )
+    target = str(tmp_path.resolve())
+    journal = CheckpointJournal(str(tmp_path), "run1")
+    journal.record(
+        {"test_type": "randread", "block_size": "4k", "target": target}, {"status": "OK", "n": 0}
+    )
+    journal.record(
+        {"test_type": "randwrite", "block_size": "4k", "target": target}, {"status": "FAILED: x"}
+    )
+    # Same test on another target does not count as done
+    journal.record({"test_type": "read", "block_size": "4k", "target": "/other"}, {"status": "OK"})
+
+    ran = []
+
+    def fake_run(self, test_config, *args):
+        ran.append(test_config["test_type"])
+        return BenchmarkResult(test_type=test_config["test_type"]), 0.0
+
+    monkeypatch.setattr(BenchmarkExecutor, "_run_single_test_with_progress", fake_run)
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    results = executor.run_all_tests()
+
+    assert ran == ["randwrite", "read"]
+    assert [r.extra.get("n") for r in results] == [0, None, None]
+    assert [r.test_type for r in results[1:]] == ["randwrite", "read"]
+    assert len(journal.load()) == 4
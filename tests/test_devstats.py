@@ -0,0 +1,91 @@
+"""Tests for block-device telemetry sampling"""
+
+import time
+
+from src.config import BenchmarkConfig
+from src.devstats import (
+    DeviceSampler,
+    compute_sample,
+    parse_diskstats,
+    sample_dicts,
+    summarize,
+)
+from src.storage import SQLiteStorage
+
+
+def stat_line(*counters: int) -> str:
+    """A sysfs stat line; counters not given are zero"""
+    fields = list(counters) + [0] * (17 - len(counters))
+    return " ".join(f"{value:8d}" for value in fields) + "\n"
+
+
+def test_compute_sample():
+    """Test iostat-style metrics from two counter snapshots"""
+    prev = (100, 0, 800, 50, 10, 0, 80, 10, 0, 1000, 2000)
+    # 2s later: 400 reads (100 merged) taking 800ms, 200 writes taking 1000ms
+    cur = (500, 100, 4000, 850, 210, 0, 1680, 1010, 3, 2500, 6000)
+    sample = compute_sample(prev, cur, 2.0, 2000, (2, 1))
+    assert sample.util_pct == 75.0
+    assert sample.aqu_sz == 2.0
+    assert sample.read_iops == 200.0
+    assert sample.write_bw == 1600 * 512 / 2
+    assert sample.read_await_ms == 2.0
+    assert sample.write_await_ms == 5.0
+    assert sample.read_merge_pct == 20.0
+    assert sample.write_merge_pct == 0.0
+    assert (sample.inflight_read, sample.inflight_write) == (2, 1)
+
+
+def test_parse_diskstats():
+    """Test a device row is found by name in /proc/diskstats"""
+    text = (
+        "   7       0 loop0 1 0 2 0 0 0 0 0 0 0 0 0 0 0 0 0 0\n"
+        " 254       0 vda 11 2 33 44 55 66 77 88 0 99 111 0 0 0 0 0 0\n"
+    )
+    assert parse_diskstats(text, "vda") == (11, 2, 33, 44, 55, 66, 77, 88, 0, 99, 111)
+    assert parse_diskstats(text, "sdz") is None
+
+
+def test_sampler_reads_sources_in_place(tmp_path):
+    """Test the sampler re-reads its open sources and keeps the final interval"""
+    stat = tmp_path / "stat"
+    stat.write_text(stat_line(0))
+    (tmp_path / "inflight").write_text("       0        4\n")
+    (tmp_path / "queue").mkdir()
+    (tmp_path / "queue" / "scheduler").write_text("none [mq-deadline]\n")
+
+    sampler = DeviceSampler(str(tmp_path), interval=0.05).start()
+    # Rewritten in place so the sampler's descriptor sees the new counters
+    with open(stat, "r+") as f:
+        f.write(stat_line(0, 0, 0, 0, 100, 0, 800, 200, 4, 50, 400))
+    time.sleep(0.12)
+    samples = sampler.stop()
+
+    assert sampler.queue == {"scheduler": "none [mq-deadline]"}
+    assert sum(s.write_iops for s in samples) > 0
+    assert samples[-1].inflight_write == 4
+    assert summarize(samples)["dev_write_await_ms"] == 2.0
+
+
+def test_device_stats_stored_as_timeseries(tmp_path):
+    """Test the device series lands in the timeseries table with its summary"""
+    prev = (0,) * 11
+    samples = [
+        compute_sample(prev, (10, 0, 80, 20, 0, 0, 0, 0, 1, 500, 600), 1.0, 1000),
+        compute_sample(prev, (30, 0, 240, 30, 0, 0, 0, 0, 1, 1000, 1200), 1.0, 2000),
+    ]
+    result = {"test_type": "randread", "block_size": "4k", "status": "OK"}
+    result.update(summarize(samples))
+    result["device_stats"] = sample_dicts(samples)
+
+    storage = SQLiteStorage(str(tmp_path / "test.db"))
+    [benchmark_id] = storage.save_results([result], BenchmarkConfig())
+    util = storage.get_timeseries(benchmark_id, "dev_util_pct")
+    assert [(row["t_ms"], row["value"]) for row in util] == [(1000, 50.0), (2000, 100.0)]
+    iops = storage.get_timeseries(benchmark_id, "dev_iops")
+    reads = [row for row in iops if row["direction"] == "read"]
+    assert [row["value"] for row in reads] == [10.0, 30.0]
+
+    row = storage.custom_query("SELECT dev_util_pct, metadata FROM benchmarks")[0]
+    assert row["dev_util_pct"] == 75.0
+    assert "device_stats" not in row["metadata"]
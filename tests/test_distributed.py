@@ -0,0 +1,161 @@
+"""Tests for fio client/server distributed runs"""
+
+import json
+import shutil
+import socket
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+
+
+def _client_job(hostname, port, iops, lat_ns):
+    return {
+        "jobname": "t01_randread_4k",
+        "hostname": hostname,
+        "port": port,
+        "read": {
+            "iops": iops,
+            "bw_bytes": iops * 4096,
+            "total_ios": iops * 10,
+            "lat_ns": {"min": lat_ns, "max": lat_ns, "mean": lat_ns, "stddev": 0, "N": 100},
+        },
+        "write": {},
+        "usr_cpu": 1.0,
+        "sys_cpu": 1.0,
+        "job_runtime": 10000,
+    }
+
+
+CLIENT_OUTPUT = json.dumps(
+    {
+        "client_stats": [
+            _client_job("node1", 8765, 1000, 100000),
+            _client_job("node1", 8766, 3000, 300000),
+            dict(_client_job("node1", 0, 4000, 250000), jobname="All clients"),
+        ]
+    }
+)
+
+
+def test_parse_client_stats_aggregates_hosts():
+    """Test client_stats are merged per host and across hosts"""
+    executor = BenchmarkExecutor(BenchmarkConfig(mode=Mode.TEST))
+    result = executor._parse_fio_json_output(
+        CLIENT_OUTPUT, {"test_type": "randread", "block_size": "4k"}
+    )
+
+    assert result.extra["host"] == "all"
+    assert result.read_iops == 4000
+    # Weighted by sample count, not taken from FIO's "All clients" entry
+    assert result.read_latency_us == 200.0
+    assert [(h.extra["host"], h.read_iops) for h in result.extra["hosts"]] == [
+        ("node1:8765", 1000),
+        ("node1:8766", 3000),
+    ]
+
+
+def test_run_distributed_flattens_hosts(tmp_path, monkeypatch):
+    """Test every test yields an aggregate row and one row per host"""
+    commands = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        assert "unlink=1" in Path(cmd[-1]).read_text()
+        return subprocess.CompletedProcess(cmd, 0, CLIENT_OUTPUT, "")
+
+    monkeypatch.setattr("src.executor.subprocess.run", fake_run)
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL,
+        test_types=["randread"],
+        block_sizes=["4k"],
+        clients=["localhost,8765", "localhost,8766"],
+    )
+    results = BenchmarkExecutor(config, target_dir=str(tmp_path)).run_distributed()
+
+    assert commands[0][2::2] == ["--client=localhost,8765", "--client=localhost,8766"]
+    assert [r.extra["host"] for r in results] == ["all", "node1:8765", "node1:8766"]
+    assert all(r.ok for r in results)
+    # The job file goes to the system temp directory and is removed afterwards
+    assert not Path(commands[0][-1]).is_relative_to(tmp_path)
+    assert not Path(commands[0][-1]).exists()
+
+
+def test_run_distributed_journals_and_skips(tmp_path, monkeypatch):
+    """Test completed tests resume with all host rows and skipped tests never run"""
+    commands = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, CLIENT_OUTPUT, "")
+
+    monkeypatch.setattr("src.executor.subprocess.run", fake_run)
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL,
+        test_types=["randread", "randwrite"],
+        block_sizes=["4k"],
+        clients=["localhost,8765", "localhost,8766"],
+        run_id="run1",
+        checkpoint_dir=str(tmp_path / "checkpoints"),
+    )
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    monkeypatch.setattr(
+        executor,
+        "_skip_reason",
+        lambda tc: "SKIPPED: no writes" if tc["test_type"] == "randwrite" else None,
+    )
+    first = executor.run_distributed()
+    assert len(commands) == 1
+    assert [r.status_text for r in first] == ["OK"] * 3 + ["SKIPPED: no writes"]
+    assert all(r.extra["target"] == executor.target_info["target"] for r in first)
+
+    commands.clear()
+    resumed = BenchmarkExecutor(config, target_dir=str(tmp_path)).run_distributed()
+    assert [c[2] for c in commands] == ["--client=localhost,8765"]
+    assert resumed[:3] == first[:3]
+    assert resumed[3].test_type == "randwrite"
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.skipif(shutil.which("fio") is None, reason="fio not installed")
+def test_run_distributed_loopback_servers(tmp_path):
+    """Test a real run against two fio servers on the loopback interface"""
+    ports = [_free_port(), _free_port()]
+    servers = [
+        subprocess.Popen(
+            ["fio", f"--server=ip:127.0.0.1,{port}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for port in ports
+    ]
+    try:
+        time.sleep(1)
+        config = BenchmarkConfig(
+            mode=Mode.INDIVIDUAL,
+            test_types=["randwrite"],
+            block_sizes=["4k"],
+            runtime=2,
+            filesize="16M",
+            direct_io=False,
+            clients=[f"127.0.0.1,{port}" for port in ports],
+        )
+        results = BenchmarkExecutor(config, target_dir=str(tmp_path)).run_distributed()
+    finally:
+        for server in servers:
+            server.terminate()
+            server.wait()
+
+    assert [r.extra["host"] for r in results][0] == "all"
+    assert len(results) == 3
+    assert results[0].write_iops == pytest.approx(
+        sum(r.write_iops for r in results[1:]), rel=0.01
+    )
@@ -0,0 +1,124 @@
+"""Tests for I/O engine selection, detection and the engine matrix"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from src.config import BenchmarkConfig, Mode
+from src.engines import (
+    detect_engines,
+    engine_fio_args,
+    engine_matrix_configs,
+    engine_speedups,
+    parse_engine,
+)
+from src.executor import BenchmarkExecutor
+
+ENGHELP = "Available IO engines:\n\tpsync\n\tlibaio\n\tposixaio\n\tmmap\n\tnull\n"
+
+
+def fake_fio(enghelp: str = ENGHELP, failing: tuple = ()):
+    """Runner standing in for subprocess.run; probes of `failing` engines fail"""
+
+    def run(cmd, **kwargs):
+        if "--enghelp" in cmd:
+            return subprocess.CompletedProcess(cmd, 0, enghelp, "")
+        engine = next(arg.split("=", 1)[1] for arg in cmd if arg.startswith("--ioengine="))
+        return subprocess.CompletedProcess(cmd, 1 if engine in failing else 0, "{}", "")
+
+    return run
+
+
+def test_parse_engine_and_fio_args():
+    """Test engine specs map to --ioengine plus one option per flag"""
+    assert parse_engine("libaio") == ("libaio", [])
+    assert engine_fio_args("io_uring+fixedbufs+hipri") == [
+        "--ioengine=io_uring",
+        "--fixedbufs=1",
+        "--hipri=1",
+    ]
+    with pytest.raises(ValueError):
+        parse_engine("spdk")
+    with pytest.raises(ValueError):
+        parse_engine("psync+fixedbufs")
+
+
+def test_detect_engines(tmp_path):
+    """Test engines missing from fio or failing their probe are dropped"""
+    runner = fake_fio(failing=("posixaio",))
+    usable = detect_engines(
+        str(tmp_path), ["psync", "posixaio", "libaio", "io_uring"], runner=runner
+    )
+    assert usable == ["psync", "libaio"]
+    assert not list(Path(tmp_path).iterdir())
+
+
+def test_engine_matrix_configs():
+    """Test every test is repeated once per engine"""
+    configs = engine_matrix_configs(
+        [{"test_type": "randread", "block_size": "4k"}, {"test_type": "read", "block_size": "1M"}],
+        ["psync", "io_uring"],
+    )
+    assert [(c["test_type"], c["ioengine"]) for c in configs] == [
+        ("randread", "psync"),
+        ("randread", "io_uring"),
+        ("read", "psync"),
+        ("read", "io_uring"),
+    ]
+
+
+def test_executor_engine_matrix_and_command(tmp_path):
+    """Test the executor expands the matrix and passes the engine to fio"""
+    config = BenchmarkConfig(
+        mode=Mode.TEST, engine_matrix=True, engines=["psync", "io_uring+fixedbufs"]
+    )
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    executor.is_macos = False
+    configs = executor._get_test_configs()
+    assert len(configs) == 6
+
+    cmd = executor._build_fio_command(configs[1], tmp_path / "f")
+    assert "--ioengine=io_uring" in cmd
+    assert "--fixedbufs=1" in cmd
+    assert "--ioengine=psync" in executor._build_fio_command(configs[0], tmp_path / "f")
+
+
+def test_default_engine_not_passed_but_recorded(tmp_path):
+    """Test runs without an engine keep fio's default and record it as psync"""
+    executor = BenchmarkExecutor(BenchmarkConfig(), target_dir=str(tmp_path))
+    executor.is_macos = False
+    test_config = {"test_type": "randread", "block_size": "4k"}
+    assert not any(
+        arg.startswith("--ioengine") for arg in executor._build_fio_command(test_config, tmp_path)
+    )
+    result = executor._parse_job({"read": {"iops": 10}, "write": {}}, test_config)
+    assert result.extra["ioengine"] == "psync"
+
+
+def test_engine_speedups():
+    """Test speedups are relative to the first engine of each test"""
+
+    def result(engine, iops, block_size="4k"):
+        return {
+            "test_type": "randread",
+            "block_size": block_size,
+            "ioengine": engine,
+            "status": "OK",
+            "read_iops": iops,
+            "write_iops": 0,
+            "read_bw": iops * 4096,
+            "write_bw": 0,
+            "read_latency_us": 100.0,
+            "write_latency_us": 0,
+        }
+
+    rows = engine_speedups(
+        [
+            result("psync", 1000),
+            result("io_uring", 4000),
+            result("psync", 500, "1M"),
+            dict(result("libaio", 0, "1M"), status="FAILED: no libaio"),
+        ]
+    )
+    speedups = {(r["block_size"], r["ioengine"]): r["speedup"] for r in rows}
+    assert speedups == {("4k", "psync"): 1.0, ("4k", "io_uring"): 4.0, ("1M", "psync"): 1.0}
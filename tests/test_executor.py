@@ -1,6 +1,9 @@
 """Tests for benchmark executor with mocked FIO output"""
 
 import json
+import subprocess
+from pathlib import Path
+
 import pytest
 from src.config import BenchmarkConfig, Mode
 from src.executor import BenchmarkExecutor
@@ -103,18 +106,18 @@ def test_parse_fio_json_output(mock_fio_json_output):
     executor = BenchmarkExecutor(config)
     test_config = {"test_type": "read", "block_size": "4k"}
     result = executor._parse_fio_json_output(mock_fio_json_output, test_config)
-    assert result["test_type"] == "read"
-    assert result["block_size"] == "4k"
-    assert result["read_iops"] == 10000.5
+    assert result.test_type == "read"
+    assert result.block_size == "4k"
+    assert result.read_iops == 10000.5
     # Write metrics should be 0 for read test
-    assert result["write_iops"] == 0
-    assert result["read_bw"] == 41943040
-    assert result["write_bw"] == 0
-    assert abs(result["read_latency_us"] - 50.0) < 1
-    assert result["write_latency_us"] == 0
-    assert "usr=5.50%" in result["cpu"]
-    assert "sys=2.30%" in result["cpu"]
-    assert result["io_time_sec"] == 15.023
+    assert result.write_iops == 0
+    assert result.read_bw == 41943040
+    assert result.write_bw == 0
+    assert abs(result.read_latency_us - 50.0) < 1
+    assert result.write_latency_us == 0
+    assert "usr=5.50%" in result.cpu
+    assert "sys=2.30%" in result.cpu
+    assert result.io_time_sec == 15.023
 
 
 def test_convert_latency():
@@ -124,3 +127,223 @@ def test_convert_latency():
     assert executor._convert_latency(50000) == 50.0
     assert executor._convert_latency(100000) == 100.0
     assert executor._convert_latency(0) == 0
+
+
+def test_render_job_file_sections():
+    """Test batch job file rendering with one stonewall section per test"""
+    config = BenchmarkConfig(mode=Mode.TEST, runtime=30, filesize="1G")
+    executor = BenchmarkExecutor(config)
+    test_configs = executor._get_test_configs()
+    files = [executor.temp_dir / f"f{i}" for i in range(len(test_configs))]
+    job_file = executor._render_job_file(test_configs, files)
+
+    assert "[t01_randread_4k]" in job_file
+    assert "[t02_randwrite_64k]" in job_file
+    assert "[t03_read_1M]" in job_file
+    assert job_file.count("stonewall") == 3
+    assert "rw=randwrite" in job_file
+    assert "runtime=30" in job_file
+    assert "name=benchmark" not in job_file
+    assert "output-format" not in job_file
+
+
+def test_split_batch_output(mock_fio_json_output):
+    """Test combined batch JSON is split back into per-section results"""
+    config = BenchmarkConfig()
+    executor = BenchmarkExecutor(config)
+    data = json.loads(mock_fio_json_output)
+    first = dict(data["jobs"][0], jobname="t01_read_4k")
+    second = dict(data["jobs"][0], jobname="t02_write_4k", read={}, write=data["jobs"][0]["read"])
+    output = json.dumps({"jobs": [first, second]})
+
+    results = executor._split_batch_output(
+        output,
+        [
+            ("t01_read_4k", {"test_type": "read", "block_size": "4k"}),
+            ("t02_write_4k", {"test_type": "write", "block_size": "4k"}),
+            ("t03_missing_4k", {"test_type": "read", "block_size": "1M"}),
+        ],
+    )
+
+    assert [r.test_type for r in results] == ["read", "write", "read"]
+    assert results[0].read_iops == 10000.5
+    assert results[1].write_iops == 10000.5
+    assert results[1].read_iops == 0
+    assert results[0].ok
+    assert results[2].status_text == "No jobs in output"
+
+
+def test_run_batch_keeps_suite_order(tmp_path, monkeypatch, mock_fio_json_output):
+    """Test sections that failed before fio ran stay in their suite position"""
+    job = json.loads(mock_fio_json_output)["jobs"][0]
+    output = json.dumps({"jobs": [dict(job, jobname="t01_write_4k", read={}, write=job["read"])]})
+    job_files = []
+
+    def fake_run(cmd, **kwargs):
+        job_files.append(Path(cmd[-1]).read_text())
+        return subprocess.CompletedProcess(cmd, 0, output, "")
+
+    monkeypatch.setattr("src.executor.subprocess.run", fake_run)
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL, test_types=["write", "read"], block_sizes=["4k"], batch=True
+    )
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    monkeypatch.setattr(executor, "_acquire_read_file", lambda timeout: None)
+
+    results = executor.run_batch()
+    assert [r.extra["section"] for r in results] == ["t01_write_4k", "t02_read_4k"]
+    assert [r.status_text for r in results] == ["OK", "FAILED: Could not create test file"]
+    # The read section that could not be prepared is not handed to fio
+    assert "[t01_write_4k]" in job_files[0]
+    assert "[t02_read_4k]" not in job_files[0]
+
+
+def test_parse_fio_json_plus_percentiles():
+    """Test json+ latency percentiles, min/max/stddev and histogram bins are captured"""
+    config = BenchmarkConfig()
+    executor = BenchmarkExecutor(config)
+    percentiles = {
+        "50.000000": 40000,
+        "90.000000": 60000,
+        "99.000000": 90000,
+        "99.900000": 150000,
+        "99.990000": 400000,
+    }
+    output = json.dumps(
+        {
+            "jobs": [
+                {
+                    "read": {
+                        "iops": 1000.0,
+                        "bw_bytes": 4096000,
+                        "total_ios": 15000,
+                        "slat_ns": {"min": 1000, "max": 9000, "mean": 2000.0, "stddev": 500.0},
+                        "clat_ns": {
+                            "min": 30000,
+                            "max": 500000,
+                            "mean": 45000.0,
+                            "stddev": 8000.0,
+                            "percentile": percentiles,
+                            "bins": {"40000": 10000, "90000": 4990, "400000": 10},
+                        },
+                        "lat_ns": {
+                            "min": 31000,
+                            "max": 509000,
+                            "mean": 47000.0,
+                            "stddev": 8100.0,
+                            "percentile": percentiles,
+                        },
+                    },
+                    "write": {"total_ios": 0},
+                    "job_runtime": 15000,
+                }
+            ]
+        }
+    )
+    result = executor._parse_fio_json_output(output, {"test_type": "randread", "block_size": "4k"})
+
+    assert result.extra["read_p50_us"] == 40.0
+    assert result.extra["read_p99_us"] == 90.0
+    assert result.extra["read_p99_9_us"] == 150.0
+    assert result.extra["read_p99_99_us"] == 400.0
+    assert result.extra["write_p99_us"] == 0
+    read_latency = result.latency["read"]
+    assert read_latency["slat"]["max_us"] == 9.0
+    assert read_latency["clat"]["stddev_us"] == 8.0
+    assert read_latency["clat_bins"] == [[40000, 10000], [90000, 4990], [400000, 10]]
+    assert result.latency["write"] == {}
+
+
+def test_build_fio_command_requests_json_plus():
+    """Test FIO is asked for json+ output and the stored percentiles"""
+    executor = BenchmarkExecutor(BenchmarkConfig())
+    cmd = executor._build_fio_command({"test_type": "read", "block_size": "4k"}, "test")
+    assert "--output-format=json+" in cmd
+    assert "--lat_percentiles=1" in cmd
+    assert "--percentile_list=50:90:99:99.9:99.99" in cmd
+
+
+def _worker_job(iops, lat_mean_ns, bins):
+    """Build one FIO worker entry as reported with numjobs > 1"""
+    total_ios = sum(bins.values())
+    return {
+        "jobname": "benchmark",
+        "read": {
+            "iops": iops,
+            "bw_bytes": iops * 4096,
+            "io_bytes": total_ios * 4096,
+            "total_ios": total_ios,
+            "clat_ns": {"min": 10000, "max": 90000, "mean": lat_mean_ns, "bins": bins},
+            "lat_ns": {"min": 11000, "max": 91000, "mean": lat_mean_ns, "N": total_ios},
+        },
+        "write": {"iops": 0, "bw_bytes": 0, "total_ios": 0},
+        "usr_cpu": 2.0,
+        "sys_cpu": 1.0,
+        "job_runtime": 10000,
+    }
+
+
+def test_parse_multiple_jobs_aggregates_workers():
+    """Test all workers are summed instead of reporting only jobs[0]"""
+    config = BenchmarkConfig(per_job_breakdown=True)
+    executor = BenchmarkExecutor(config)
+    jobs = [
+        _worker_job(3000.0, 20000.0, {"20000": 900, "80000": 100}),
+        _worker_job(1000.0, 60000.0, {"20000": 100, "80000": 900}),
+    ]
+    output = json.dumps({"jobs": jobs})
+    result = executor._parse_fio_json_output(output, {"test_type": "randread", "block_size": "4k"})
+
+    assert result.read_iops == 4000.0
+    assert result.read_bw == 4000.0 * 4096
+    # Both workers have 1000 samples, so the pooled mean is the plain average
+    assert result.read_latency_us == 40.0
+    # Merged histogram: 1000 samples at 20us, 1000 at 80us
+    assert result.latency["read"]["clat"]["p50_us"] == 20.0
+    assert result.latency["read"]["clat"]["p90_us"] == 80.0
+    assert result.latency["read"]["clat"]["min_us"] == 10.0
+    assert "usr=4.00%" in result.cpu
+
+    assert [job["read_iops"] for job in result.extra["jobs"]] == [3000.0, 1000.0]
+    assert result.extra["job_iops_spread"] == 1.0
+
+
+def test_parse_single_job_has_no_breakdown(mock_fio_json_output):
+    """Test the per-job breakdown is only added for several workers"""
+    executor = BenchmarkExecutor(BenchmarkConfig(per_job_breakdown=True))
+    result = executor._parse_fio_json_output(
+        mock_fio_json_output, {"test_type": "read", "block_size": "4k"}
+    )
+    assert "jobs" not in result.extra
+    assert result.read_iops == 10000.5
+
+
+def test_run_batch_device_target_skips_writes(tmp_path, monkeypatch, mock_fio_json_output):
+    """Test skipped device writes are not rendered and the job file stays off the device"""
+    device = tmp_path / "sdx"
+    device.write_bytes(b"")
+    job = json.loads(mock_fio_json_output)["jobs"][0]
+    output = json.dumps({"jobs": [dict(job, jobname="t02_read_4k")]})
+    commands = []
+    job_files = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        job_files.append(Path(cmd[-1]).read_text())
+        return subprocess.CompletedProcess(cmd, 0, output, "")
+
+    monkeypatch.setattr("src.executor.is_block_device", lambda path: True)
+    monkeypatch.setattr("src.executor.subprocess.run", fake_run)
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL, test_types=["write", "read"], block_sizes=["4k"], batch=True
+    )
+    executor = BenchmarkExecutor(config, target_dir=str(device))
+
+    results = executor.run_batch()
+    assert [r.extra["section"] for r in results] == ["t01_write_4k", "t02_read_4k"]
+    assert results[0].status_text.startswith("SKIPPED")
+    assert results[1].ok
+    assert "[t01_write_4k]" not in job_files[0]
+    assert "[t02_read_4k]" in job_files[0]
+    assert not Path(commands[0][-1]).exists()
+    assert device.is_file()
@@ -0,0 +1,50 @@
+"""Tests for FIO interval log parsing"""
+
+from src.config import BenchmarkConfig
+from src.executor import BenchmarkExecutor
+from src.fio_logs import find_log_files, iter_log_samples, log_fio_args
+
+
+def _write_logs(prefix):
+    """Write a small set of FIO-style interval logs"""
+    (prefix.parent / f"{prefix.name}_iops.1.log").write_text("100, 2500, 0, 4096, 0\n")
+    (prefix.parent / f"{prefix.name}_iops.2.log").write_text("100, 2400, 0, 4096, 0\n")
+    (prefix.parent / f"{prefix.name}_bw.1.log").write_text(
+        "100, 10000, 0, 4096, 0\n200, 9000, 1, 4096, 0, 0\n"
+    )
+    (prefix.parent / f"{prefix.name}_lat.1.log").write_text("100, 52000, 0, 4096, 0\n")
+    # A different test sharing the same directory must not be picked up
+    (prefix.parent / f"{prefix.name}x_iops.1.log").write_text("100, 1, 0, 4096, 0\n")
+
+
+def test_find_log_files(tmp_path):
+    """Test log files are found by prefix, metric and job number"""
+    prefix = tmp_path / "run_read_4k"
+    _write_logs(prefix)
+
+    found = [(metric, job) for metric, job, _ in find_log_files(str(prefix))]
+    assert found == [("bw", 1), ("iops", 1), ("iops", 2), ("lat", 1)]
+
+
+def test_iter_log_samples_converts_units(tmp_path):
+    """Test samples are streamed and converted to result units"""
+    prefix = tmp_path / "run_read_4k"
+    _write_logs(prefix)
+
+    bw = list(iter_log_samples(tmp_path / "run_read_4k_bw.1.log", "bw"))
+    assert bw == [(100, "read", 10000 * 1024.0), (200, "write", 9000 * 1024.0)]
+
+    lat = list(iter_log_samples(tmp_path / "run_read_4k_lat.1.log", "lat"))
+    assert lat == [(100, "read", 52.0)]
+
+
+def test_log_args_added_with_prefix():
+    """Test fio log options are passed only for tests with a log prefix"""
+    executor = BenchmarkExecutor(BenchmarkConfig(log_interval_ms=100))
+    test_config = {"test_type": "read", "block_size": "4k"}
+    assert not any("log" in arg for arg in executor._build_fio_command(test_config, "f"))
+
+    cmd = executor._build_fio_command(dict(test_config, log_prefix="results/logs/x"), "f")
+    for arg in log_fio_args("results/logs/x", 100):
+        assert arg in cmd
+    assert "--log_avg_msec=100" in cmd
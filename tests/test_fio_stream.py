@@ -0,0 +1,83 @@
+"""Tests for incremental FIO status-interval parsing"""
+
+import json
+import sys
+
+from src.config import BenchmarkConfig
+from src.executor import BenchmarkExecutor
+from src.fio_stream import FioJsonStream, IntervalTracker, iter_interval_samples
+
+
+def _report(runtime_ms, read_ios, read_bytes, lat_mean_ns):
+    """Build a cumulative FIO report as printed at each status interval"""
+    return {
+        "jobs": [
+            {
+                "jobname": "benchmark",
+                "job_runtime": runtime_ms,
+                "read": {
+                    "total_ios": read_ios,
+                    "io_bytes": read_bytes,
+                    "iops": read_ios / max(runtime_ms, 1) * 1000,
+                    "bw_bytes": read_bytes / max(runtime_ms, 1) * 1000,
+                    "lat_ns": {"mean": lat_mean_ns, "N": read_ios},
+                },
+                "write": {},
+            }
+        ]
+    }
+
+
+def test_stream_splits_documents_across_chunks():
+    """Test documents split over arbitrary chunk boundaries are reassembled"""
+    text = 'fio: warning\n{"a": {"b": "}"}}\n{"c": 1}'
+    stream = FioJsonStream()
+    documents = []
+    for i in range(0, len(text), 3):
+        documents.extend(stream.feed(text[i : i + 3]))
+
+    assert [json.loads(d) for d in documents] == [{"a": {"b": "}"}}, {"c": 1}]
+
+
+def test_interval_tracker_computes_deltas():
+    """Test per-interval rates are computed from cumulative counters"""
+    tracker = IntervalTracker()
+    first = tracker.update(_report(1000, 1000, 4096000, 100000.0))
+    second = tracker.update(_report(2000, 3000, 12288000, 200000.0))
+
+    assert first.read_iops == 1000
+    assert second.elapsed_sec == 2.0
+    assert second.read_iops == 2000
+    assert second.read_bw == 8192000
+    # Interval mean latency: (3000*200us - 1000*100us) / 2000 ios = 250us
+    assert abs(second.read_latency_us - 250.0) < 1e-6
+    assert tracker.update(_report(2000, 3000, 12288000, 200000.0)) is None
+
+
+def test_iter_interval_samples_yields_final_report():
+    """Test the iterator API yields every document with its sample"""
+    lines = [
+        json.dumps(_report(1000, 10, 40960, 1000.0)),
+        json.dumps(_report(2000, 20, 81920, 1000.0)),
+    ]
+    pairs = list(iter_interval_samples(lines))
+
+    assert len(pairs) == 2
+    assert pairs[-1][1]["jobs"][0]["job_runtime"] == 2000
+    assert pairs[-1][0].read_iops == 10
+
+
+def test_run_fio_streaming_reports_samples():
+    """Test the executor streams samples from a running process"""
+    reports = [_report(1000, 10, 40960, 1000.0), _report(2000, 30, 122880, 1000.0)]
+    script = "import json, sys\n" + "".join(
+        f"print(json.dumps({r!r}), flush=True)\n" for r in reports
+    )
+    executor = BenchmarkExecutor(BenchmarkConfig())
+    samples = []
+
+    result = executor._run_fio_streaming([sys.executable, "-c", script], 30, samples.append)
+
+    assert result.returncode == 0
+    assert [s.read_iops for s in samples] == [10, 20]
+    assert json.loads(result.stdout)["jobs"][0]["job_runtime"] == 2000
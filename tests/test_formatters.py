@@ -66,3 +66,24 @@ def test_table_formatter_with_failed_result():
     formatter.format(results)
     output = console.file.getvalue()
     assert "FAILED" in output
+
+
+def test_table_formatter_percentile_columns():
+    """Test percentile columns are shown when requested"""
+    console = Console(file=StringIO(), width=300)
+    formatter = TableFormatter(console, show_percentiles=True)
+    formatter.format(
+        [
+            {
+                "test_type": "randread",
+                "block_size": "4k",
+                "read_p50_us": 40.0,
+                "read_p99_us": 90.0,
+                "read_p99_9_us": 150.25,
+                "status": "OK",
+            }
+        ]
+    )
+    output = console.file.getvalue()
+    assert "Read p99.9 (µs)" in output
+    assert "150.25" in output
@@ -0,0 +1,98 @@
+"""Tests for host pressure and CPU-cost sampling"""
+
+from src.config import BenchmarkConfig
+from src.hoststats import (
+    compute_sample,
+    iops_per_cpu_sec,
+    parse_cpu_stat,
+    parse_psi,
+    parse_vmstat,
+    sample_dicts,
+    summarize,
+)
+from src.storage import SQLiteStorage
+
+PSI = (
+    "some avg10=1.00 avg60=0.50 avg300=0.10 total={some}\n"
+    "full avg10=0.50 avg60=0.20 avg300=0.05 total={full}\n"
+)
+
+
+def proc_stat(cpu0: tuple, cpu1: tuple) -> str:
+    total = tuple(a + b for a, b in zip(cpu0, cpu1))
+    lines = [f"cpu  {' '.join(map(str, total))} 0 0"]
+    lines += [f"cpu{i} {' '.join(map(str, cpu))} 0 0" for i, cpu in enumerate((cpu0, cpu1))]
+    return "\n".join(lines + ["intr 12345 0 0", "ctxt 999"]) + "\n"
+
+
+def snapshot(cpu0: tuple, cpu1: tuple, io_some: int, dirty: int, psi: bool = True) -> dict:
+    return {
+        "cpu": parse_cpu_stat(proc_stat(cpu0, cpu1)),
+        "vmstat": parse_vmstat(f"nr_free_pages 1000\nnr_dirty {dirty}\nnr_writeback 8\n"),
+        "psi_io": parse_psi(PSI.format(some=io_some, full=io_some // 2)) if psi else None,
+        "psi_cpu": None,
+    }
+
+
+def test_parsers():
+    """Test PSI totals, cpu lines and dirty/writeback counts are parsed"""
+    assert parse_psi(PSI.format(some=1500, full=700)) == (1500, 700)
+    cpus = parse_cpu_stat(proc_stat((1, 2, 3, 4, 5, 6, 7, 8), (0,) * 8))
+    assert list(cpus) == ["cpu", "cpu0", "cpu1"]
+    assert cpus["cpu0"] == (1, 2, 3, 4, 5, 6, 7, 8)
+    assert parse_vmstat("nr_dirty 12\nnr_writeback 3\nnr_dirtied 99\n") == (12, 3)
+
+
+def test_compute_sample():
+    """Test pressure, CPU busy time and the hottest CPU over one interval"""
+    prev = snapshot((0,) * 8, (0,) * 8, io_some=0, dirty=0)
+    # cpu0: 50 user, 30 system, 20 softirq; cpu1: 40 iowait, 60 idle (100 ticks/s, 1s)
+    cur = snapshot((50, 0, 30, 0, 0, 0, 20, 0), (0, 0, 0, 60, 40, 0, 0, 0), 250_000, 256)
+    sample = compute_sample(prev, cur, 1.0, 1000, clk_tck=100, page_size=4096)
+    assert sample.io_some_pct == 25.0
+    assert sample.io_full_pct == 12.5
+    assert sample.cpu_some_pct is None
+    assert sample.cpu_busy_pct == 50.0
+    assert sample.iowait_pct == 20.0
+    assert sample.max_cpu_iowait_pct == 40.0
+    assert sample.max_cpu_softirq_pct == 20.0
+    assert sample.cpu_busy_sec == 1.0
+    assert (sample.dirty_bytes, sample.writeback_bytes) == (256 * 4096, 8 * 4096)
+
+
+def test_summary_and_iops_per_cpu_sec():
+    """Test PSI is left out where unavailable and IOPS are related to CPU time"""
+    idle = (0,) * 8
+    first = snapshot(idle, idle, 0, 0, psi=False)
+    second = snapshot((50,) + idle[1:], idle, 0, 10, psi=False)
+    third = snapshot((250,) + idle[1:], idle, 0, 30, psi=False)
+    samples = [
+        compute_sample(first, second, 1.0, 1000, 100, 4096),
+        compute_sample(second, third, 1.0, 2000, 100, 4096),
+    ]
+    summary = summarize(samples)
+    assert "host_io_some_pct" not in summary
+    assert summary["host_cpu_sec"] == 2.5
+    assert summary["host_dirty_max_bytes"] == 30 * 4096
+    # 1000 IOPS for 2s on 2.5 CPU-seconds
+    assert iops_per_cpu_sec(1000, samples) == 800.0
+    assert iops_per_cpu_sec(1000, []) is None
+
+
+def test_host_series_stored(tmp_path):
+    """Test the optional host series lands in the timeseries table"""
+    prev = snapshot((0,) * 8, (0,) * 8, 0, 0)
+    cur = snapshot((50,) + (0,) * 7, (0,) * 8, 100_000, 1)
+    samples = [compute_sample(prev, cur, 1.0, 1000, 100, 4096)]
+    result = {"test_type": "randread", "block_size": "4k", "status": "OK"}
+    result.update(summarize(samples))
+    result["host_stats"] = sample_dicts(samples)
+
+    storage = SQLiteStorage(str(tmp_path / "test.db"))
+    [benchmark_id] = storage.save_results([result], BenchmarkConfig())
+    series = storage.get_timeseries(benchmark_id, "host_io_some_pct")
+    assert [(row["t_ms"], row["value"]) for row in series] == [(1000, 10.0)]
+    # Unavailable PSI values are not stored as samples
+    assert storage.get_timeseries(benchmark_id, "host_cpu_some_pct") == []
+    row = storage.custom_query("SELECT host_io_some_pct FROM benchmarks")[0]
+    assert row["host_io_some_pct"] == 10.0
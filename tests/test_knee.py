@@ -0,0 +1,133 @@
+"""Tests for the saturation knee search"""
+
+import pytest
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+from src.knee import KneeFinder
+from src.result import BenchmarkResult
+from src.storage import SQLiteStorage
+
+
+class FakeExecutor:
+    """Executor stub modelling a device that saturates at 100k IOPS"""
+
+    def __init__(self, field="io_depth"):
+        self.field = field
+        self.calls = []
+        self.releases = 0
+
+    def run_tests(self, test_configs, release_files=True):
+        assert not release_files
+        load = test_configs[0].get(self.field, 0)
+        self.calls.append(load)
+        if self.field == "rate_iops":
+            iops = min(load, 100000) if load else 100000
+            p99 = 100 + 900 * (iops / 100000) ** 4
+        else:
+            iops = min(load * 10000, 100000)
+            p99 = 50 * load
+        test_config = test_configs[0]
+        return [
+            BenchmarkResult(
+                test_config["test_type"],
+                test_config["block_size"],
+                read_iops=iops,
+                extra={"read_p99_us": p99},
+            )
+        ]
+
+    def _release_test_files(self):
+        self.releases += 1
+
+
+def test_knee_bisects_io_depth():
+    """Test the search doubles io_depth, then bisects to the last depth meeting the SLO"""
+    executor = FakeExecutor()
+    result = KneeFinder(executor, "randread", "4k", slo_p99_us=300).search()
+
+    assert executor.calls[:4] == [1, 2, 4, 8]
+    assert result.knee.value == 6
+    assert result.knee.iops == 60000
+    assert [p.value for p in result.curve] == sorted(executor.calls)
+    # The prepared read file is released once, after the last probe
+    assert executor.releases == 1
+
+
+def test_knee_stops_when_throughput_saturates():
+    """Test the search ends once IOPS stop growing under the SLO"""
+    executor = FakeExecutor()
+    result = KneeFinder(executor, "randread", "4k", slo_p99_us=10000).search()
+
+    assert executor.calls == [1, 2, 4, 8, 16, 32]
+    assert result.knee.iops == 100000
+
+
+def test_knee_bisects_offered_rate():
+    """Test the rate search converges below the unthrottled maximum"""
+    executor = FakeExecutor("rate_iops")
+    result = KneeFinder(executor, "randread", "4k", 500, dimension="rate_iops").search()
+
+    assert executor.calls[0] == 0
+    # p99 crosses 500us at ~81.6k IOPS in the model
+    assert 75000 <= result.knee.value <= 81650
+    assert all(p.p99_us <= 500 for p in result.curve if p.value == result.knee.value)
+
+
+def test_knee_without_passing_probe():
+    """Test no knee is reported when every probe misses the SLO"""
+    result = KneeFinder(FakeExecutor(), "randread", "4k", slo_p99_us=10).search()
+    assert result.knee is None
+    assert result.summary()["knee_iops"] is None
+
+
+def test_knee_rejects_unknown_dimension():
+    """Test only supported load knobs can be searched"""
+    with pytest.raises(ValueError):
+        KneeFinder(FakeExecutor(), "randread", "4k", 100, dimension="block_size")
+
+
+def test_rate_iops_split_across_jobs():
+    """Test the offered rate is divided between fio jobs"""
+    executor = BenchmarkExecutor(BenchmarkConfig(mode=Mode.INDIVIDUAL))
+    executor.is_macos = False
+    cmd = executor._build_fio_command(
+        {"test_type": "randread", "block_size": "4k", "num_jobs": 4, "rate_iops": 10001},
+        "/tmp/test",
+    )
+    assert "--rate_iops=2501" in cmd
+
+
+def test_knee_search_storage(tmp_path):
+    """Test a knee search and its curve round-trip through SQLite"""
+    storage = SQLiteStorage(str(tmp_path / "knee.db"))
+    result = KneeFinder(FakeExecutor(), "randread", "4k", slo_p99_us=300).search()
+    config = BenchmarkConfig(mode=Mode.INDIVIDUAL)
+    ids = storage.save_results([p.result for p in result.curve], config)
+    search_id = storage.save_knee_search(
+        result.summary(), [(p.value, p.iops, p.p99_us, i) for p, i in zip(result.curve, ids)]
+    )
+
+    search = storage.get_knee_searches()[0]
+    assert search["id"] == search_id
+    assert search["knee_value"] == 6
+    points = storage.get_knee_points(search_id)
+    assert [p["value"] for p in points] == [p.value for p in result.curve]
+    assert points[0]["benchmark_id"] == ids[0]
+
+
+def test_knee_probes_share_read_file(tmp_path):
+    """Test the read file is created once per search and removed after it"""
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL, runtime=1, filesize="1M", python_engine=True, status_interval=0
+    )
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    created = []
+    precreate = executor._precreate_test_file
+    executor._precreate_test_file = lambda *args, **kwargs: (
+        created.append(args[0]) or precreate(*args, **kwargs)
+    )
+
+    result = KneeFinder(executor, "randread", "4k", slo_p99_us=1e9, max_probes=3).search()
+    assert len(result.curve) > 1
+    assert len(created) == 1
+    assert not list(tmp_path.iterdir())
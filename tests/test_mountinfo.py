@@ -0,0 +1,78 @@
+"""Tests for target mount and device resolution"""
+
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+from src.mountinfo import describe_target, find_mount, parse_mountinfo
+from src.storage import SQLiteStorage
+
+MOUNTINFO = """\
+22 1 259:2 / / rw,relatime shared:1 - ext4 /dev/nvme0n1p2 rw
+35 22 0:32 / /tmp rw,nosuid shared:15 - tmpfs tmpfs rw
+41 22 8:17 / /mnt/data\\040disk rw,noatime shared:20 master:3 - xfs /dev/sdb1 rw,attr2
+42 41 8:33 / /mnt/data\\040disk/inner rw - btrfs /dev/sdc1 rw
+"""
+
+
+def test_parse_mountinfo_optional_fields_and_escapes():
+    """Test optional fields are skipped and escaped mount points decoded"""
+    entries = parse_mountinfo(MOUNTINFO)
+    assert len(entries) == 4
+    assert entries[2].mount_point == "/mnt/data disk"
+    assert entries[2].fstype == "xfs"
+    assert entries[2].source == "/dev/sdb1"
+    assert entries[2].dev == "8:17"
+
+
+def test_find_mount_longest_prefix():
+    """Test a path resolves to its innermost mount"""
+    entries = parse_mountinfo(MOUNTINFO)
+    assert find_mount("/mnt/data disk/inner/x", entries).source == "/dev/sdc1"
+    assert find_mount("/mnt/data disk/x", entries).source == "/dev/sdb1"
+    assert find_mount("/mnt/data diskette", entries).source == "/dev/nvme0n1p2"
+
+
+def test_describe_target_directory(tmp_path):
+    """Test a directory target is tagged with its mount, filesystem and device"""
+    entries = parse_mountinfo(f"50 1 7:0 / {tmp_path} rw - ext4 /dev/loop0 rw\n")
+    info = describe_target(str(tmp_path / "."), entries)
+    assert info == {
+        "target": str(tmp_path.resolve()),
+        "mount_point": str(tmp_path),
+        "fstype": "ext4",
+        "device": "/dev/loop0",
+    }
+
+
+def test_block_device_write_tests_skipped(tmp_path, monkeypatch):
+    """Test write tests on block device targets are skipped unless allowed"""
+    monkeypatch.setattr("src.executor.is_block_device", lambda path: True)
+    config = BenchmarkConfig(mode=Mode.INDIVIDUAL)
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+
+    assert executor._skip_reason({"test_type": "randwrite", "block_size": "4k"})
+    assert executor._skip_reason({"test_type": "randread", "block_size": "4k"}) is None
+    assert executor._test_file_for({"test_type": "write", "block_size": "4k"}) == tmp_path
+    # The device itself must never be deleted as a per-test file
+    executor._remove_test_file(tmp_path)
+    assert tmp_path.exists()
+
+    config.allow_device_writes = True
+    assert executor._skip_reason({"test_type": "randwrite", "block_size": "4k"}) is None
+
+
+def test_target_columns_stored(tmp_path):
+    """Test target tags are stored as columns and queryable per device"""
+    storage = SQLiteStorage(str(tmp_path / "t.db"))
+    result = {
+        "test_type": "randread",
+        "block_size": "4k",
+        "status": "OK",
+        "target": "/mnt/a",
+        "mount_point": "/mnt/a",
+        "fstype": "xfs",
+        "device": "/dev/sdb1",
+    }
+    storage.save_results([result, dict(result, device="/dev/sdc1")], BenchmarkConfig())
+    rows = storage.get_device_history("/dev/sdb1")
+    assert len(rows) == 1
+    assert rows[0]["fstype"] == "xfs"
@@ -0,0 +1,114 @@
+"""Tests for the history-driven run planner"""
+
+import pytest
+from src.calibration import Calibration
+from src.config import BenchmarkConfig, Mode
+from src.engines import DEFAULT_MATRIX
+from src.executor import BenchmarkExecutor
+from src.planner import OverheadModel
+from src.storage import SQLiteStorage
+
+GB = 1024**3
+
+
+def row(test_type, block_size, wall, io, prepare=None, write_bw=0, status="OK"):
+    return {
+        "test_type": test_type,
+        "block_size": block_size,
+        "status": status,
+        "wall_time_sec": wall,
+        "io_time_sec": io,
+        "prepare_sec": prepare,
+        "write_bw": write_bw,
+    }
+
+
+def test_overhead_model_falls_back_to_wider_groups():
+    """Test the closest group's median is used and preparation is not overhead"""
+    rows = [
+        row("randread", "4k", 95, 60, prepare=30),
+        row("randread", "4k", 66, 60),
+        row("randread", "4k", 67, 60),
+        row("randwrite", "4k", 160, 0, status="TIMED OUT"),
+        row("randwrite", "64k", 70, 60, write_bw=100e6),
+    ]
+    model = OverheadModel(rows, default=6, file_bytes=GB)
+    assert model.overhead("randread", "4k") == (6, "history")
+    assert model.overhead("randread", "1M") == (6, "history")
+    assert model.overhead("randwrite", "4k") == (160, "history")
+    assert model.overhead("randwrite", "1M") == (85, "history")
+    assert model.overhead("trim", "4k") == (7, "history")
+    assert OverheadModel([], default=6).overhead("read", "1M") == (6, "default")
+    assert model.write_bytes("randwrite", "64k", 60) == 6e9
+    assert model.write_bytes("randwrite", "4k", 60) is None
+    assert model.prepare_bps() == GB / 30
+
+
+def test_plan_from_history(tmp_path):
+    """Test the plan prepares the read file once and shows each fio command"""
+    config = BenchmarkConfig(mode=Mode.TEST, runtime=60, filesize="1G", status_interval=0)
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    target = executor.target_info["target"]
+
+    storage = SQLiteStorage(str(tmp_path / "test.db"))
+    results = [
+        dict(row("randread", "4k", 80, 60, prepare=16), filesize="1G"),
+        dict(row("randwrite", "64k", 63, 60, write_bw=50e6), filesize="1G"),
+        dict(row("read", "1M", 64, 60), filesize="1G"),
+    ]
+    storage.save_results([dict(r, target=target) for r in results], config)
+    # Other targets do not count
+    storage.save_results([dict(results[0], target="/elsewhere", wall_time_sec=900)], config)
+    executor.load_history(storage)
+    assert len(executor.history) == 3
+
+    configs = executor._get_test_configs()
+    plan = executor.plan(configs)
+    assert [t.prepare_bytes for t in plan.tests] == [GB, 0, 0]
+    assert plan.tests[0].prepare_sec == pytest.approx(16)
+    assert [t.overhead_sec for t in plan.tests] == [4, 3, 4]
+    assert plan.tests[1].write_bytes == 50e6 * 60
+    assert plan.total_sec == pytest.approx(16 + 3 * 60 + 11)
+    assert plan.total_bytes_written == GB + 3e9
+    read_file = executor.file_pool.path_for("1G", "random")
+    assert f"--filename={read_file}" in plan.tests[0].command
+    assert executor._estimate_total_seconds(configs) == plan.total_sec
+
+
+def test_plan_never_exceeds_timeout(tmp_path):
+    """Test a history of timeouts is capped at the configured timeout"""
+    config = BenchmarkConfig(mode=Mode.TEST, runtime=60, timeout=100)
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    executor.history = [row("randwrite", "64k", 3600, 0, status="TIMED OUT")]
+    executor.calibration = Calibration(str(tmp_path), seq_write_bps=GB / 1000)
+
+    plan = executor.plan(executor._get_test_configs())
+    assert [t.basis for t in plan.tests] == ["history"] * 3
+    assert all(t.run_sec + t.overhead_sec <= 100 for t in plan.tests)
+    assert plan.tests[0].prepare_sec == 100
+
+
+def test_dry_run_plan_probes_and_writes_nothing(tmp_path, monkeypatch):
+    """Test a dry run lists the default engines and leaves CSV traces unconverted"""
+
+    def no_probe(*args, **kwargs):
+        raise AssertionError("engine detection probes the target")
+
+    monkeypatch.setattr("src.executor.detect_engines", no_probe)
+    trace = tmp_path / "trace.csv"
+    trace.write_text("0,4096,R,0\n4194304,4096,W,1000\n")
+    config = BenchmarkConfig(
+        mode=Mode.REPLAY,
+        trace_files=[str(trace)],
+        engine_matrix=True,
+        filesize="1M",
+        results_dir=str(tmp_path / "results"),
+    )
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path), dry_run=True)
+    executor.is_macos = False
+
+    plan = executor.plan(executor._get_test_configs())
+    assert len(plan.tests) == len(DEFAULT_MATRIX)
+    assert all(t.prepare_bytes == 4194304 + 4096 for t in plan.tests)
+    assert f"--read_iolog={tmp_path}/results/traces/trace.iolog" in plan.tests[0].command
+    assert not (tmp_path / "results").exists()
@@ -103,3 +103,44 @@ def test_empty_results(tmp_path):
         plotter.generate()
     except Exception:
         pass
+
+
+def test_generate_sweep_plot(tmp_path):
+    """Test sweep plots pivot on a dimension with one trace per other combination"""
+    results = [
+        {
+            "test_type": "randread",
+            "block_size": block_size,
+            "io_depth": depth,
+            "num_jobs": 1,
+            "read_iops": depth * 1000.0,
+            "write_iops": 0.0,
+            "read_bw": 0,
+            "write_bw": 0,
+            "read_latency_us": 10.0 * depth,
+            "write_latency_us": 0.0,
+        }
+        for block_size in ("4k", "64k")
+        for depth in (1, 4, 16)
+    ]
+    config = {"plot_output_dir": str(tmp_path), "pivot": "io_depth", "pivot_metric": "iops"}
+    plotter = PlotlyPlotter(results, config)
+
+    fig = plotter._create_sweep_chart(_results_frame(results), "io_depth", "iops")
+    assert len(fig.data) == 2
+    assert list(fig.data[0].x) == [1, 4, 16]
+    assert list(fig.data[0].y) == [1000.0, 4000.0, 16000.0]
+
+    fig = plotter._create_sweep_chart(_results_frame(results), "block_size", "latency")
+    assert len(fig.data) == 3
+    assert list(fig.data[0].x) == ["4k", "64k"]
+
+    plotter._generate_sweep_plot()
+    assert (tmp_path / "sweep_iops_by_io_depth.html").exists()
+
+
+def _results_frame(results):
+    """Build the DataFrame plotters work on"""
+    import pandas as pd
+
+    return pd.DataFrame(results)
@@ -0,0 +1,88 @@
+"""Tests for test-file preparation strategies"""
+
+import json
+import subprocess
+
+import pytest
+from src.prepare import (
+    FILL_BLOCK_SIZE,
+    choose_strategy,
+    fill_command,
+    job_ranges,
+    prepare_file,
+)
+from src.pyengine import PythonEngine
+
+GB = 1024**3
+
+
+def test_choose_strategy():
+    """Test auto refills random files and fills zero files in parallel"""
+    assert choose_strategy("auto", "random") == "refill"
+    assert choose_strategy("auto", "zero") == "parallel"
+    assert choose_strategy("sequential", "random") == "sequential"
+    with pytest.raises(ValueError):
+        choose_strategy("fast", "random")
+
+
+@pytest.mark.parametrize("size,jobs", [(10 * GB, 8), (10 * GB + 4096, 3), (FILL_BLOCK_SIZE, 1)])
+def test_job_ranges_cover_file(size, jobs):
+    """Test job ranges are disjoint, aligned and cover every byte"""
+    ranges = job_ranges(size, jobs)
+    assert len(ranges) == jobs
+    assert ranges[0][0] == 0
+    for (offset, length), (next_offset, _) in zip(ranges, ranges[1:]):
+        assert offset + length == next_offset
+        assert next_offset % FILL_BLOCK_SIZE == 0
+    assert ranges[-1][0] + ranges[-1][1] == size
+
+
+def test_parallel_fill_command(monkeypatch, tmp_path):
+    """Test the parallel fill runs one fio job per disjoint range"""
+    monkeypatch.setattr("src.prepare.os.cpu_count", lambda: 4)
+    cmd = fill_command(tmp_path / "f", 4 * GB, "refill", "random", ioengine="libaio")
+    assert cmd.count("--rw=write") == 1
+    assert [arg for arg in cmd if arg.startswith("--offset=")] == [
+        f"--offset={i * GB}" for i in range(4)
+    ]
+    assert "--refill_buffers" in cmd
+    assert "--iodepth=32" in cmd
+    assert cmd.index("--ioengine=libaio") < cmd.index("--name=fill0")
+
+    sequential = fill_command(tmp_path / "f", GB, "sequential", "zero")
+    assert "--numjobs=1" in sequential
+    assert "--zero_buffers" in sequential
+
+
+def test_prepare_file_requires_every_byte_written(tmp_path):
+    """Test a fill that wrote less than the file size is rejected"""
+
+    def runner(cmd, **kwargs):
+        output = json.dumps({"jobs": [{"write": {"io_bytes": 512 * 1024}}]})
+        return subprocess.CompletedProcess(cmd, 0, output, "")
+
+    with pytest.raises(RuntimeError, match="only 524288 of 1048576 bytes"):
+        prepare_file(tmp_path / "f", FILL_BLOCK_SIZE, "random", "parallel", runner=runner)
+
+    def complete(cmd, **kwargs):
+        output = json.dumps({"jobs": [{"write": {"io_bytes": FILL_BLOCK_SIZE}}]})
+        return subprocess.CompletedProcess(cmd, 0, output, "")
+
+    report = prepare_file(tmp_path / "g", FILL_BLOCK_SIZE, "random", runner=complete)
+    assert report.strategy == "refill"
+    assert report.size_bytes == FILL_BLOCK_SIZE
+
+
+def test_prepare_file_python_engine_refill(tmp_path, monkeypatch):
+    """Test the Python engine writes unique data over several ranges"""
+    monkeypatch.setattr("src.prepare.MIN_JOB_BYTES", FILL_BLOCK_SIZE)
+    monkeypatch.setattr("src.prepare.os.cpu_count", lambda: 4)
+    path = tmp_path / "f"
+    report = prepare_file(
+        path, 4 * FILL_BLOCK_SIZE, "random", "refill", engine=PythonEngine(direct=False)
+    )
+    assert report.jobs > 1
+    data = path.read_bytes()
+    assert len(data) == 4 * FILL_BLOCK_SIZE
+    blocks = {data[i : i + FILL_BLOCK_SIZE] for i in range(0, len(data), FILL_BLOCK_SIZE)}
+    assert len(blocks) == 4
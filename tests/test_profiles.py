@@ -0,0 +1,96 @@
+"""Tests for declarative workload profiles"""
+
+import pytest
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+from src.profiles import builtin_profiles, load_profile, profile_configs
+
+PROFILE_TOML = """
+name = "custom"
+description = "Test profile"
+
+[fio]
+norandommap = true
+
+[[tests]]
+name = "hot-reads"
+rw = "randread"
+bssplit = "4k/50:64k/50"
+iodepth = 16
+random_distribution = "zipf:1.1"
+thinktime = 100
+
+[[tests]]
+rw = "randrw"
+bs = "16k"
+rwmixread = 60
+"""
+
+
+def test_builtin_profiles_load():
+    """Test every shipped profile loads and expands into test configs"""
+    names = builtin_profiles()
+    assert {"oltp", "log-append", "object-store", "vm-boot"} <= set(names)
+    for name in names:
+        configs = profile_configs(name)
+        assert configs
+        assert all(c["profile"] == name and c["test_type"] for c in configs)
+
+
+def test_profile_fields_and_fio_params(tmp_path):
+    """Test known keys map to test config fields and the rest pass through to fio"""
+    path = tmp_path / "custom.toml"
+    path.write_text(PROFILE_TOML)
+    first, second = profile_configs(str(path))
+
+    assert first["workload"] == "hot-reads"
+    assert first["block_size"] == "mixed"
+    assert first["io_depth"] == 16
+    assert first["fio_params"] == {
+        "norandommap": True,
+        "bssplit": "4k/50:64k/50",
+        "random_distribution": "zipf:1.1",
+        "thinktime": 100,
+    }
+    assert second["workload"] == "custom-2"
+    assert second["rwmixread"] == 60
+
+
+def test_profile_yaml(tmp_path):
+    """Test YAML profiles are equivalent to TOML ones"""
+    pytest.importorskip("yaml")
+    path = tmp_path / "seq.yaml"
+    path.write_text("tests:\n  - rw: write\n    bs: 1m\n    fdatasync: 1\n")
+    config = profile_configs(str(path))[0]
+    assert config["profile"] == "seq"
+    assert config["fio_params"] == {"fdatasync": 1}
+
+
+def test_profile_validation(tmp_path):
+    """Test unknown names and incomplete tests are rejected"""
+    with pytest.raises(ValueError, match="Unknown profile"):
+        load_profile("no-such-profile")
+    path = tmp_path / "bad.toml"
+    path.write_text('[[tests]]\nrw = "read"\n')
+    with pytest.raises(ValueError, match="bssplit"):
+        load_profile(str(path))
+
+
+def test_profile_mode_fio_command(tmp_path):
+    """Test profile tests drop --bs for bssplit and append fio parameters last"""
+    path = tmp_path / "custom.toml"
+    path.write_text(PROFILE_TOML)
+    executor = BenchmarkExecutor(BenchmarkConfig(mode=Mode.PROFILE, profiles=[str(path)]))
+    executor.is_macos = False
+    test_config = executor._get_test_configs()[0]
+
+    cmd = executor._build_fio_command(test_config, tmp_path / "f")
+    assert not any(arg.startswith("--bs=") for arg in cmd)
+    assert "--iodepth=16" in cmd
+    assert cmd[-4:] == [
+        "--norandommap=1",
+        "--bssplit=4k/50:64k/50",
+        "--random_distribution=zipf:1.1",
+        "--thinktime=100",
+    ]
+    assert executor._describe(test_config).startswith("hot-reads: randread")
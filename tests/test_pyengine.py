@@ -0,0 +1,90 @@
+"""Tests for the built-in Python benchmark engine"""
+
+import numpy as np
+import pytest
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+from src.pyengine import LatencyRecorder, PythonEngine, latency_block
+
+
+def test_latency_recorder_bounded():
+    """Test the recorder grows, then decimates while keeping exact totals"""
+    recorder = LatencyRecorder(capacity=4, max_samples=8)
+    for value in range(1, 101):
+        recorder.add(value * 1000)
+    assert recorder.count == 100
+    assert recorder.size <= 8
+    assert recorder.stride > 1
+    assert (recorder.min_ns, recorder.max_ns) == (1000, 100000)
+
+    block = latency_block([recorder])
+    assert block["N"] == 100
+    assert block["mean"] == pytest.approx(50500)
+    assert sum(block["bins"].values()) == recorder.size
+
+
+def test_latency_block_percentiles():
+    """Test blocks use FIO's percentile keys so the latency parser reads them"""
+    recorder = LatencyRecorder()
+    for value in np.arange(1, 1001) * 1000:
+        recorder.add(int(value))
+    block = latency_block([recorder])
+    assert block["percentile"]["50.000000"] == pytest.approx(500500, rel=0.01)
+    assert block["percentile"]["99.000000"] == pytest.approx(990010, rel=0.01)
+    assert latency_block([LatencyRecorder()]) == {}
+
+
+def test_run_mixed(tmp_path):
+    """Test a short mixed run produces a FIO-style job entry"""
+    engine = PythonEngine(direct=False)
+    path = tmp_path / "test.dat"
+    engine.fill(path, 1024 * 1024)
+    assert path.stat().st_size == 1024 * 1024
+
+    samples = []
+    job = engine.run(
+        path,
+        "randrw",
+        block_size=4096,
+        size=1024 * 1024,
+        runtime=1,
+        io_depth=2,
+        rwmixread=70,
+        status_interval=1,
+        on_sample=samples.append,
+    )
+    assert job["read"]["total_ios"] > 0
+    assert job["write"]["total_ios"] > 0
+    assert job["read"]["total_ios"] > job["write"]["total_ios"]
+    assert job["read"]["lat_ns"]["N"] == job["read"]["total_ios"]
+    assert job["job_runtime"] >= 1000
+    assert samples
+
+
+def test_run_rejects_unsupported_test_type(tmp_path):
+    """Test trim is refused"""
+    with pytest.raises(ValueError):
+        PythonEngine().run(tmp_path / "f", "trim", 4096, 4096, 1)
+
+
+def test_executor_python_engine_results(tmp_path):
+    """Test executor results from the Python engine match the FIO schema"""
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL,
+        test_types=["randread", "write", "trim"],
+        block_sizes=["4k"],
+        runtime=1,
+        filesize="1M",
+        python_engine=True,
+        status_interval=0,
+    )
+    results = BenchmarkExecutor(config, target_dir=str(tmp_path)).run_all_tests()
+    by_type = {r.test_type: r for r in results}
+
+    assert by_type["randread"].ok
+    assert by_type["randread"].read_iops > 0
+    assert by_type["randread"].extra["read_p99_us"] > 0
+    assert by_type["randread"].extra["ioengine"] == "python"
+    assert by_type["write"].write_bw > 0
+    assert by_type["trim"].status_text.startswith("SKIPPED")
+    assert not list(tmp_path.glob("test_*"))
@@ -0,0 +1,89 @@
+"""Tests for typed result records"""
+
+import numpy as np
+import pytest
+from src.config import BenchmarkConfig
+from src.result import BenchmarkResult, Status, from_frame, to_columns, to_frame
+from src.storage import SQLiteStorage
+
+
+def test_status_parse_roundtrip():
+    """Test status text splits into kind and detail and reads back the same"""
+    for text, kind, detail in [
+        ("OK", Status.OK, ""),
+        ("TIMED OUT", Status.TIMED_OUT, ""),
+        ("FAILED: fio: bad option: x", Status.FAILED, "fio: bad option: x"),
+        ("SKIPPED: not supported", Status.SKIPPED, "not supported"),
+        ("No jobs in output", Status.NO_RESULT, "No jobs in output"),
+    ]:
+        assert Status.parse(text) == (kind, detail)
+        assert kind.text(detail) == text
+
+
+def test_from_dict_normalizes_fields():
+    """Test missing and NULL numbers read as 0 and runtime_sec as io_time_sec"""
+    record = BenchmarkResult.from_dict(
+        {
+            "test_type": "randread",
+            "block_size": "4k",
+            "status": "OK",
+            "read_iops": 1500,
+            "write_iops": None,
+            "runtime_sec": 15,
+            "read_p99_us": 80.0,
+            "latency": {"total": {}},
+        }
+    )
+    assert record.ok
+    assert (record.read_iops, record.write_iops, record.io_time_sec) == (1500.0, 0.0, 15.0)
+    assert record.extra == {"read_p99_us": 80.0}
+    assert record.latency == {"total": {}}
+    assert BenchmarkResult.from_dict(record.to_dict()) == record
+    assert not hasattr(record, "__dict__")
+
+
+def test_placeholder():
+    """Test placeholders keep the test's engine and the elapsed wall time"""
+    test_config = {"test_type": "write", "block_size": "1M", "ioengine": "libaio"}
+    record = BenchmarkResult.placeholder(test_config, "FAILED: disk full", 2.5)
+    assert (record.status, record.detail) == (Status.FAILED, "disk full")
+    assert record.to_dict()["status"] == "FAILED: disk full"
+    assert record.to_dict()["ioengine"] == "libaio"
+    assert record.wall_time_sec == 2.5
+
+
+def test_status_text_setter_and_hosts():
+    """Test setting status text resets the detail and per-host records round-trip"""
+    record = BenchmarkResult.placeholder({"test_type": "read", "block_size": "4k"}, "Empty result")
+    record.status_text = "OK"
+    assert (record.status, record.detail) == (Status.OK, "")
+
+    host = BenchmarkResult("read", "4k", read_iops=50.0, extra={"host": "node1:8765"})
+    record.extra["hosts"] = [host]
+    data = record.to_dict()
+    assert data["hosts"] == [host.to_dict()]
+    assert BenchmarkResult.from_dict(data).extra["hosts"] == [host]
+
+
+def test_columns_and_frame_roundtrip():
+    """Test a batch converts to arrays and a frame and back"""
+    records = [
+        BenchmarkResult("randread", "4k", read_iops=100.0, extra={"host": "a"}),
+        BenchmarkResult("write", "1M", Status.TIMED_OUT, write_bw=5e6, extra={"host": "b"}),
+    ]
+    columns = to_columns(records)
+    assert columns["read_iops"].dtype == np.float64
+    np.testing.assert_array_equal(columns["write_bw"], [0.0, 5e6])
+
+    frame = to_frame(records)
+    assert list(frame["status"]) == ["OK", "TIMED OUT"]
+    assert from_frame(frame.assign(host=["a", "b"])) == records
+
+
+def test_sqlite_saves_records(tmp_path):
+    """Test storage takes records and dicts alike"""
+    storage = SQLiteStorage(str(tmp_path / "test.db"))
+    record = BenchmarkResult("randread", "4k", read_iops=100.0, extra={"read_p99_us": 9.5})
+    storage.save_results([record, record.to_dict()], BenchmarkConfig())
+    rows = storage.custom_query("SELECT status, read_iops, read_p99_us FROM benchmarks")
+    assert rows == [{"status": "OK", "read_iops": pytest.approx(100.0), "read_p99_us": 9.5}] * 2
@@ -0,0 +1,103 @@
+"""Tests for steady-state detection"""
+
+import json
+import sys
+
+import pytest
+from src.config import BenchmarkConfig
+from src.executor import BenchmarkExecutor
+from src.fio_stream import IntervalSample
+from src.steadystate import SteadyStateDetector, steadystate_fio_args
+
+
+def test_detector_converges_on_flat_throughput():
+    """Test convergence is reported once the window is flat and narrow"""
+    detector = SteadyStateDetector(window_sec=10, ramp_sec=5)
+    converged = [
+        detector.add(IntervalSample(elapsed_sec=t, read_iops=10000 + (t % 2) * 50))
+        for t in range(1, 30)
+    ]
+    assert any(converged)
+    # Ramp (5s) plus a full 10s window must pass before convergence
+    assert detector.converged_at >= 14
+    assert detector.slope_pct <= 0.3
+    assert detector.deviation_pct <= 5.0
+
+
+def test_detector_rejects_trending_throughput():
+    """Test a steadily falling metric (e.g. SLC cache draining) never converges"""
+    detector = SteadyStateDetector(window_sec=10, ramp_sec=0)
+    for t in range(1, 60):
+        assert not detector.add(IntervalSample(elapsed_sec=t, write_iops=20000 - t * 200))
+    assert detector.converged_at is None
+
+
+def test_detector_bandwidth_metric():
+    """Test bandwidth can be used instead of IOPS"""
+    detector = SteadyStateDetector(metric="bw", window_sec=5, ramp_sec=0)
+    for t in range(1, 10):
+        detector.add(IntervalSample(elapsed_sec=t, read_iops=t * 1000, read_bw=1e9))
+    assert detector.converged_at is not None
+
+    with pytest.raises(ValueError):
+        SteadyStateDetector(metric="latency")
+
+
+def test_steadystate_fio_args():
+    """Test fio's steadystate options are built from the config"""
+    config = BenchmarkConfig(steady_state=True, ss_metric="bw", ss_slope_limit=0.5, ss_dur=20)
+    assert steadystate_fio_args(config) == [
+        "--steadystate=bw_slope:0.5%",
+        "--ss_dur=20",
+        "--ss_ramp=10",
+    ]
+    executor = BenchmarkExecutor(config)
+    cmd = executor._build_fio_command({"test_type": "read", "block_size": "4k"}, "test")
+    assert "--steadystate=bw_slope:0.5%" in cmd
+
+
+def test_parse_fio_steadystate_block():
+    """Test fio's steadystate result is recorded with the convergence point"""
+    executor = BenchmarkExecutor(BenchmarkConfig())
+    output = json.dumps(
+        {
+            "jobs": [
+                {
+                    "read": {"iops": 1000.0, "bw_bytes": 4096000, "total_ios": 42000},
+                    "write": {},
+                    "job_runtime": 42000,
+                    "steadystate": {"ss": "iops_slope", "attained": 1, "criterion": "0.30%"},
+                }
+            ]
+        }
+    )
+    result = executor._parse_fio_json_output(output, {"test_type": "read", "block_size": "4k"})
+    assert result.extra["ss_attained"] is True
+    assert result.extra["ss_converged_sec"] == 42.0
+    assert result.extra["ss_source"] == "fio"
+
+
+def test_streaming_stop_interrupts_process():
+    """Test a converged detector interrupts the process, which still reports"""
+    script = """
+import json, time
+t = 0
+try:
+    while True:
+        t += 1000
+        print(json.dumps({"jobs": [{"job_runtime": t, "read": {"total_ios": t, "io_bytes": t}}]}), flush=True)
+        time.sleep(0.05)
+except KeyboardInterrupt:
+    print(json.dumps({"jobs": [{"job_runtime": t + 1, "read": {"total_ios": t, "io_bytes": t}}]}))
+"""
+    executor = BenchmarkExecutor(BenchmarkConfig())
+    seen = []
+
+    def on_sample(sample):
+        seen.append(sample)
+        return len(seen) >= 3
+
+    result = executor._run_fio_streaming([sys.executable, "-c", script], 30, on_sample)
+
+    assert 3 <= len(seen) < 50
+    assert json.loads(result.stdout)["jobs"][0]["job_runtime"] % 1000 == 1
@@ -242,3 +242,61 @@ def test_json_storage_save(sample_results, sample_config, tmp_dir):
     assert "timestamp" in data
     assert "results" in data
     assert len(data["results"]) == 2
+
+
+def test_sqlite_storage_latency_distribution(sample_config, tmp_dir):
+    """Test latency percentiles and histogram bins are stored compactly"""
+    storage = SQLiteStorage(str(tmp_dir / "test_benchmark.db"))
+    result = {
+        "test_type": "randread",
+        "block_size": "4k",
+        "read_iops": 1000.0,
+        "read_p99_us": 90.0,
+        "read_p99_9_us": 150.0,
+        "status": "OK",
+        "latency": {
+            "read": {
+                "clat": {"min_us": 30.0, "max_us": 500.0, "p99_us": 90.0},
+                "lat": {"min_us": 31.0, "max_us": 509.0, "p99_us": 92.0},
+                "clat_bins": [[40000, 10000], [90000, 4990]],
+            },
+            "write": {},
+        },
+    }
+    storage.save_results([result], sample_config)
+
+    row = storage.get_history(1)[0]
+    assert row["read_p99_us"] == 90.0
+    assert row["read_p99_9_us"] == 150.0
+    assert "clat_bins" not in row["metadata"]
+
+    stats = storage.get_latency_stats(row["id"])
+    assert {(s["direction"], s["kind"]) for s in stats} == {("read", "clat"), ("read", "lat")}
+    assert next(s for s in stats if s["kind"] == "lat")["p99_us"] == 92.0
+
+    values, counts = storage.get_latency_histogram(row["id"], "read")
+    assert list(values) == [40000, 90000]
+    assert list(counts) == [10000, 4990]
+    assert storage.get_latency_histogram(row["id"], "write") is None
+
+
+def test_sqlite_storage_ingests_interval_logs(sample_config, tmp_dir):
+    """Test FIO interval logs are ingested in batches and linked to the row"""
+    prefix = tmp_dir / "logs" / "run_randread_4k"
+    prefix.parent.mkdir()
+    lines = "".join(f"{t * 100}, {1000 + t}, 0, 4096, 0\n" for t in range(1, 251))
+    (prefix.parent / f"{prefix.name}_iops.1.log").write_text(lines)
+    (prefix.parent / f"{prefix.name}_lat.1.log").write_text("100, 52000, 0, 4096, 0\n")
+
+    storage = SQLiteStorage(str(tmp_dir / "test_benchmark.db"))
+    storage.TIMESERIES_BATCH_SIZE = 100
+    result = {"test_type": "randread", "block_size": "4k", "log_prefix": str(prefix)}
+    storage.save_results([result], sample_config)
+
+    benchmark_id = storage.get_history(1)[0]["id"]
+    iops = storage.get_timeseries(benchmark_id, "iops")
+    assert len(iops) == 250
+    assert iops[0]["t_ms"] == 100
+    assert iops[-1]["value"] == 1250
+    assert len(storage.get_timeseries(benchmark_id)) == 251
+    assert storage.get_timeseries(benchmark_id, "lat")[0]["value"] == 52.0
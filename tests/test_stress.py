@@ -0,0 +1,163 @@
+"""Tests for multi-file stress layouts"""
+
+import json
+import os
+import sys
+
+import pytest
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+from src.stress import split_filenames, validate_file_service_type
+
+RANDREAD = {"test_type": "randread", "block_size": "4k"}
+
+
+def job(name: str, iops: float, options: dict) -> dict:
+    """One fio job entry of a stress run"""
+    return {
+        "jobname": name,
+        "job options": options,
+        "read": {"iops": iops, "bw_bytes": iops * 4096, "lat_ns": {"mean": 50000.0}},
+        "write": {},
+        "job_runtime": 10000,
+    }
+
+
+def test_one_job_per_file(tmp_path):
+    """Test global options come first and each file gets its own job section"""
+    config = BenchmarkConfig(stress_files=3, num_jobs=2, file_service_type="random")
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    test_config = dict(RANDREAD, rate_iops=600)
+    cmd = executor._build_fio_command(test_config, executor._test_file_for(test_config))
+
+    first_job = cmd.index("--name=file0")
+    assert all(not arg.startswith("--name=") for arg in cmd[:first_job])
+    assert "--numjobs=2" in cmd[:first_job]
+    assert "--file_service_type=random" in cmd[:first_job]
+    # 600 IOPS over 3 files with 2 workers each
+    assert "--rate_iops=100" in cmd
+    assert cmd[first_job:] == [
+        arg
+        for idx in range(3)
+        for arg in (f"--name=file{idx}", f"--filename={tmp_path}/stress_{idx}")
+    ]
+    assert [arg for arg in cmd if arg.startswith("--filename=")] == cmd[first_job + 1 :: 2]
+
+
+def test_shared_and_small_file_layouts(tmp_path):
+    """Test filename=a:b:c for shared files and nrfiles/openfiles for directories"""
+    targets = [str(tmp_path / "a"), str(tmp_path / "b:c")]
+    config = BenchmarkConfig(stress_targets=targets, stress_shared=True)
+    cmd = BenchmarkExecutor(config, target_dir=str(tmp_path))._build_fio_command(RANDREAD, "x")
+    filename = f"--filename={tmp_path}/a:{tmp_path}/b\\:c"
+    assert cmd[-2:] == ["--name=files", filename]
+    assert split_filenames(filename.split("=", 1)[1]) == targets
+
+    config = BenchmarkConfig(stress_files=2, stress_nrfiles=1000, stress_openfiles=16)
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    cmd = executor._build_fio_command(RANDREAD, "x")
+    assert "--openfiles=16" in cmd
+    assert cmd[-3:] == ["--name=dir1", f"--directory={tmp_path}/stress_1", "--nrfiles=1000"]
+
+    executor.stress.prepare()
+    assert (tmp_path / "stress_1").is_dir()
+    executor._release_test_files()
+    assert not list(tmp_path.glob("stress_*"))
+
+
+def test_per_file_breakdown():
+    """Test jobs are merged per file and in total, with a file count and spread"""
+    executor = BenchmarkExecutor(BenchmarkConfig())
+    jobs = [
+        job("file0", 3000.0, {"filename": "/dev/sdb"}),
+        job("file0", 1000.0, {"filename": "/dev/sdb"}),
+        job("file1", 2000.0, {"filename": "/dev/sdc"}),
+    ]
+    result = executor._parse_fio_json_output(json.dumps({"jobs": jobs}), RANDREAD)
+    assert result.read_iops == 6000.0
+    assert result.extra["file_count"] == 2
+    assert [(f["file"], f["read_iops"]) for f in result.extra["files"]] == [
+        ("/dev/sdb", 4000.0),
+        ("/dev/sdc", 2000.0),
+    ]
+    assert result.extra["file_iops_spread"] == 0.6667
+
+    shared = [job("files", 5000.0, {"filename": "/a:/b:/c"})]
+    result = executor._parse_fio_json_output(json.dumps({"jobs": shared}), RANDREAD)
+    assert result.extra["file_count"] == 3
+    assert "files" not in result.extra
+
+    small = [job(f"dir{i}", 100.0, {"directory": f"/d{i}", "nrfiles": "500"}) for i in range(2)]
+    result = executor._parse_fio_json_output(json.dumps({"jobs": small}), RANDREAD)
+    assert result.extra["file_count"] == 1000
+    assert [f["file"] for f in result.extra["files"]] == ["/d0", "/d1"]
+
+
+def test_plan_and_python_engine(tmp_path):
+    """Test read tests plan the file layout and the Python engine skips stress tests"""
+    config = BenchmarkConfig(mode=Mode.TEST, stress_files=4, filesize="1G", runtime=10)
+    executor = BenchmarkExecutor(config, target_dir=str(tmp_path))
+    plan = executor.plan(executor._get_test_configs())
+    assert [t.prepare_bytes for t in plan.tests] == [4 * 1024**3, 0, 0]
+    assert "--name=file3" in plan.tests[0].command
+
+    executor = BenchmarkExecutor(
+        BenchmarkConfig(stress_files=2, python_engine=True), target_dir=str(tmp_path)
+    )
+    assert executor._skip_reason(RANDREAD) == "SKIPPED: not supported by the Python engine"
+
+
+# Stands in for fio: lays out each job's file and reports one job per --name
+FAKE_FIO = """
+import json, sys
+jobs, options = [], {}
+for arg in sys.argv[1:]:
+    key, _, value = arg[2:].partition("=")
+    if key == "name":
+        options = {}
+        jobs.append({"jobname": value, "job options": options, "job_runtime": 1000,
+                     "read": {"iops": 100.0, "bw_bytes": 409600, "lat_ns": {"mean": 1000.0}},
+                     "write": {"iops": 50.0, "bw_bytes": 204800, "lat_ns": {"mean": 2000.0}}})
+    elif key == "filename" and jobs:
+        options["filename"] = value
+        open(value, "a").close()
+print(json.dumps({"jobs": jobs}))
+"""
+
+
+def test_stress_run_end_to_end(tmp_path, monkeypatch):
+    """Test read and write tests run on a generated layout and leave the target intact"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fio = bin_dir / "fio"
+    fio.write_text(f"#!{sys.executable}\n{FAKE_FIO}")
+    fio.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    target = tmp_path / "target"
+    target.mkdir()
+    config = BenchmarkConfig(
+        mode=Mode.INDIVIDUAL,
+        test_types=["randread", "read", "randwrite"],
+        block_sizes=["4k"],
+        runtime=1,
+        filesize="1M",
+        status_interval=0,
+        stress_files=2,
+    )
+
+    results = BenchmarkExecutor(config, target_dir=str(target)).run_all_tests()
+    assert [r.status_text for r in results] == ["OK"] * 3
+    assert [r.extra["file_count"] for r in results] == [2] * 3
+    assert results[0].read_iops == 200.0
+    assert results[0].extra["output_file"] == f"{target}/stress_0:{target}/stress_1"
+    assert target.is_dir()
+    assert not list(target.iterdir())
+
+
+def test_validate_file_service_type():
+    """Test fio's file service types are accepted and others refused"""
+    for spec in ("random", "roundrobin:4", "sequential", "zipf:1.2", "gauss:0.5"):
+        assert validate_file_service_type(spec) == spec
+    for spec in ("", "lru", "zipf", "random:x"):
+        with pytest.raises(ValueError):
+            validate_file_service_type(spec)
@@ -0,0 +1,80 @@
+"""Tests for parameter sweep expansion"""
+
+import json
+
+import pytest
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+from src.sweep import expand_grid, load_grid
+
+
+def test_expand_grid_cartesian():
+    """Test the grid is the cartesian product of all dimensions"""
+    configs = expand_grid(["randread"], ["4k", "64k"], [1, 4, 16], [1, 2], [])
+    assert len(configs) == 2 * 3 * 2
+    assert {"test_type": "randread", "block_size": "64k", "io_depth": 16, "num_jobs": 2} in configs
+
+
+def test_expand_grid_rwmixread_only_for_mixed_types():
+    """Test rwmixread only multiplies mixed workloads"""
+    configs = expand_grid(["randread", "randrw"], ["4k"], [8], [1], [50, 70, 90])
+    randread = [c for c in configs if c["test_type"] == "randread"]
+    randrw = [c for c in configs if c["test_type"] == "randrw"]
+    assert len(randread) == 1
+    assert "rwmixread" not in randread[0]
+    assert sorted(c["rwmixread"] for c in randrw) == [50, 70, 90]
+
+
+def test_load_grid(tmp_path):
+    """Test user-defined sweep points are loaded and validated"""
+    grid_file = tmp_path / "grid.json"
+    grid_file.write_text(
+        json.dumps(
+            [
+                {"test_type": "randread", "block_size": "4k", "io_depth": 32},
+                {"test_type": "randrw", "block_size": "8k", "rwmixread": 80},
+            ]
+        )
+    )
+    assert load_grid(str(grid_file))[1]["rwmixread"] == 80
+
+    grid_file.write_text(json.dumps([{"test_type": "read", "block_size": "4k", "iodepth": 1}]))
+    with pytest.raises(ValueError):
+        load_grid(str(grid_file))
+
+
+def test_executor_sweep_mode_builds_dimensions():
+    """Test sweep points drive the fio command and are recorded per result"""
+    config = BenchmarkConfig(
+        mode=Mode.SWEEP,
+        sweep_test_types=["randrw"],
+        sweep_block_sizes=["4k"],
+        sweep_io_depths=[1, 32],
+        sweep_num_jobs=[2],
+        sweep_rwmixread=[90],
+    )
+    executor = BenchmarkExecutor(config)
+    executor.is_macos = False
+    configs = executor._get_test_configs()
+    assert len(configs) == 2
+
+    cmd = executor._build_fio_command(configs[1], "test")
+    assert "--iodepth=32" in cmd
+    assert "--numjobs=2" in cmd
+    assert "--rwmixread=90" in cmd
+    assert "qd=32" in executor._describe(configs[1])
+
+    result = executor._parse_job({"read": {}, "write": {}, "job_runtime": 1000}, configs[1])
+    assert result.extra["io_depth"] == 32
+    assert result.extra["num_jobs"] == 2
+    assert result.extra["rwmixread"] == 90
+
+
+def test_default_modes_record_fixed_dimensions():
+    """Test non-sweep results still record their queue depth and job count"""
+    executor = BenchmarkExecutor(BenchmarkConfig())
+    executor.is_macos = False
+    result = executor._parse_job({}, {"test_type": "randrw", "block_size": "4k"})
+    assert result.extra["io_depth"] == 4
+    assert result.extra["num_jobs"] == 1
+    assert result.extra["rwmixread"] == 70
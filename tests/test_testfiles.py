@@ -0,0 +1,92 @@
+"""Tests for the prepared test-file pool"""
+
+import pytest
+from src.config import BenchmarkConfig
+from src.executor import BenchmarkExecutor
+from src.testfiles import PreparedFilePool
+
+
+def _fake_create(path, pattern):
+    """Write a small file standing in for a fio-prepared one"""
+    path.write_bytes(b"\0" * 1024)
+    return True
+
+
+def test_pool_acquire_creates_and_reuses(tmp_path):
+    """Test the pool creates a file once and then reuses it"""
+    pool = PreparedFilePool(tmp_path)
+    calls = []
+
+    def create(path, pattern):
+        calls.append(pattern)
+        return _fake_create(path, pattern)
+
+    first = pool.acquire("1k", "random", create)
+    second = pool.acquire("1k", "random", create)
+
+    assert first == second
+    assert first.exists()
+    assert calls == ["random"]
+    assert pool.contains(first)
+
+
+def test_pool_rebuilds_invalid_file(tmp_path):
+    """Test a truncated prepared file fails validation and is recreated"""
+    pool = PreparedFilePool(tmp_path)
+    path = pool.acquire("1k", "random", _fake_create)
+
+    path.write_bytes(b"\0" * 10)
+    assert not pool.validate("1k", "random")
+    assert pool.get("1k", "random") is None
+
+    path = pool.acquire("1k", "random", _fake_create)
+    assert pool.validate("1k", "random")
+
+
+def test_pool_keys_by_pattern(tmp_path):
+    """Test different fill patterns use different files"""
+    pool = PreparedFilePool(tmp_path)
+    random_file = pool.acquire("1k", "random", _fake_create)
+    zero_file = pool.acquire("1k", "zero", _fake_create)
+    assert random_file != zero_file
+
+    with pytest.raises(ValueError):
+        pool.acquire("1k", "unknown", _fake_create)
+
+
+def test_pool_evict_and_release(tmp_path):
+    """Test explicit eviction and release behaviour"""
+    pool = PreparedFilePool(tmp_path)
+    pool.acquire("1k", "random", _fake_create)
+    pool.acquire("1k", "zero", _fake_create)
+
+    assert pool.evict(pattern="zero") == 1
+    assert pool.get("1k", "random") is not None
+
+    persistent = PreparedFilePool(tmp_path, persistent=True)
+    persistent.release()
+    assert persistent.get("1k", "random") is not None
+
+    pool.release()
+    assert pool.get("1k", "random") is None
+    assert not pool.root.exists()
+
+
+def test_executor_read_tests_share_pooled_file(tmp_path, monkeypatch):
+    """Test read tests reuse one prepared file instead of recreating it"""
+    monkeypatch.chdir(tmp_path)
+    config = BenchmarkConfig(filesize="1k")
+    executor = BenchmarkExecutor(config)
+    calls = []
+
+    def precreate(test_file, timeout, pattern="random"):
+        calls.append(test_file)
+        return _fake_create(test_file, pattern)
+
+    monkeypatch.setattr(executor, "_precreate_test_file", precreate)
+
+    first = executor._acquire_read_file(60)
+    second = executor._acquire_read_file(60)
+
+    assert first == second
+    assert len(calls) == 1
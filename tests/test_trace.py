@@ -0,0 +1,111 @@
+"""Tests for trace conversion and replay"""
+
+import io
+from pathlib import Path
+
+import pytest
+from src.config import BenchmarkConfig, Mode
+from src.executor import BenchmarkExecutor
+from src.trace import (
+    convert_trace,
+    detect_format,
+    iolog_for,
+    iolog_span,
+    read_csv_trace,
+    write_iolog,
+    TraceRecord,
+)
+
+CSV_TRACE = """offset,length,op,timestamp
+0,4096,R,1000000
+8192,8192,W,1000050
+1048576,4096,read,1000500
+0,0,flush,1002500
+"""
+
+
+def test_read_csv_trace_relative_timestamps(tmp_path):
+    """Test CSV rows are normalized to relative microsecond timestamps"""
+    path = tmp_path / "trace.csv"
+    path.write_text(CSV_TRACE)
+    records = list(read_csv_trace(str(path)))
+    assert [r.op for r in records] == ["read", "write", "read", "sync"]
+    assert [r.timestamp_us for r in records] == [0, 50, 500, 2500]
+
+    path.write_text("0,4096,X,0\n")
+    with pytest.raises(ValueError):
+        list(read_csv_trace(str(path)))
+
+
+def test_write_iolog_accumulates_short_waits():
+    """Test waits below fio's resolution carry over instead of being lost"""
+    out = io.StringIO()
+    records = [
+        TraceRecord(0, "read", 0, 4096),
+        TraceRecord(60, "read", 4096, 4096),
+        TraceRecord(120, "write", 8192, 4096),
+    ]
+    assert write_iolog(records, out) == 3
+    lines = out.getvalue().splitlines()
+    assert lines[:3] == ["fio version 2 iolog", "trace.dat add", "trace.dat open"]
+    assert lines[3:] == [
+        "trace.dat read 0 4096",
+        "trace.dat read 4096 4096",
+        "trace.dat wait 120 0",
+        "trace.dat write 8192 4096",
+        "trace.dat close",
+    ]
+
+
+def test_convert_and_span(tmp_path):
+    """Test conversion output is detected as an iolog and its span computed"""
+    src = tmp_path / "trace.csv"
+    src.write_text(CSV_TRACE)
+    cached = iolog_for(str(src), str(tmp_path / "cache"))
+    assert detect_format(str(src)) == "csv"
+    assert detect_format(cached) == "iolog2"
+    assert iolog_span(cached) == 1048576 + 4096
+    # iologs are replayed as-is
+    assert iolog_for(cached, str(tmp_path / "cache")) == cached
+    # Conversions with 3-field wait lines, which fio skips, are redone
+    Path(cached).write_text("fio version 2 iolog\nf add\nf open\nf wait 500\nf close\n")
+    iolog_for(str(src), str(tmp_path / "cache"))
+    assert all(
+        len(line.split()) == 4 for line in Path(cached).read_text().splitlines() if " wait " in line
+    )
+
+    v3 = tmp_path / "v3.iolog"
+    v3.write_text("fio version 3 iolog\n0 f add\n0 f open\n10 f write 100 50\n20 f close\n")
+    assert detect_format(str(v3)) == "iolog3"
+    assert iolog_span(str(v3)) == 150
+
+
+def test_replay_mode_command(tmp_path):
+    """Test replay tests redirect the iolog onto the test file with scaling and loops"""
+    src = tmp_path / "db.csv"
+    src.write_text(CSV_TRACE)
+    config = BenchmarkConfig(
+        mode=Mode.REPLAY,
+        trace_files=[str(src)],
+        replay_time_scale=200,
+        replay_loops=3,
+        results_dir=str(tmp_path / "results"),
+    )
+    executor = BenchmarkExecutor(config)
+    executor.is_macos = False
+    configs = executor._get_test_configs()
+    assert configs == [{"test_type": "replay", "block_size": "iolog", "trace": str(src)}]
+
+    cmd = executor._build_fio_command(configs[0], tmp_path / "test_replay_iolog")
+    assert f"--replay_redirect={tmp_path / 'test_replay_iolog'}" in cmd
+    assert f"--read_iolog={tmp_path / 'results' / 'traces' / 'db.iolog'}" in cmd
+    assert "--replay_time_scale=200" in cmd
+    assert "--loops=3" in cmd
+    assert not any(arg.startswith(("--rw=", "--time_based")) for arg in cmd)
+
+
+def test_convert_trace_counts(tmp_path):
+    """Test the converter reports the number of I/Os written"""
+    src = tmp_path / "trace.csv"
+    src.write_text(CSV_TRACE)
+    assert convert_trace(str(src), str(tmp_path / "out" / "trace.iolog")) == 4